@@ -2,7 +2,7 @@ import time
 import cv2
 import mediapipe as mp
 import numpy as np
-from TTS import speak, speak_async
+from TTS import speak, speak_async, PRIORITY_HIGH
 
 mp_drawing=mp.solutions.drawing_utils
 mp_pose=mp.solutions.pose
@@ -48,6 +48,9 @@ def run_exercise_mode():
         fail_count = 0
         last_feedback_time = 0
         feedback_interval = 3  # 3초마다 피드백
+        last_prompt_time = 0  # 마지막 '카메라 앞으로 와주세요' 안내 시각
+        prompt_future = None  # 아직 재생되지 않았을 수 있는 위치 안내
+        finish_time = 0  # 운동 완료 후 화면을 유지할 시각 (0이면 미완료)
 
         while cap.isOpened():
             ret, frame = cap.read()
@@ -67,13 +70,17 @@ def run_exercise_mode():
                 if results.pose_landmarks:
                     if not detected:
                         print("인식 성공! 운동을 시작합니다.")
-                        speak("운동을 시작합니다.")
+                        if prompt_future is not None:
+                            prompt_future.cancel()  # 아직 대기 중인 위치 안내는 취소
+                        speak_async("운동을 시작합니다.")
                         stage = "raise"
                         detected = True
-                        speak("첫 번째 동작입니다. 만세를 해보세요!")
-                else:
+                        speak_async("첫 번째 동작입니다. 만세를 해보세요!")
+                elif time.time() - last_prompt_time >= feedback_interval:
+                    # 매 프레임이 아니라 feedback_interval마다 한 번만 안내
                     print("인식 실패. 카메라 앞으로 와주세요.")
-                    speak("카메라 앞으로 와주세요.")
+                    prompt_future = speak_async("카메라 앞으로 와주세요.")
+                    last_prompt_time = time.time()
                 
                 cv2.imshow("Camera Check", frame)
                 if cv2.waitKey(10) & 0xFF == ord('q'):
@@ -100,26 +107,28 @@ def run_exercise_mode():
                     # 만세 동작
                     if stage == "raise":
                         if current_time - last_feedback_time >= feedback_interval:
+                            pause = 0
                             if angle > 160 and wrist[1] < shoulder[1]:
                                 print("만세 동작 성공!")
-                                speak("정답! 축하합니다!")
+                                speak_async("정답! 축하합니다!", PRIORITY_HIGH)
                                 stage = "hands_on_waist"
                                 fail_count = 0
-                                speak("두 번째 동작입니다. 허리에 손을 얹어보세요!")
-                                time.sleep(2)
+                                speak_async("두 번째 동작입니다. 허리에 손을 얹어보세요!")
+                                pause = 2  # 자세를 바꿀 시간 (화면은 계속 갱신)
                             else:
                                 fail_count += 1
                                 print(f"만세 동작 오답 ({fail_count}/3)")
                                 if fail_count >= 3:
                                     print("3회 실패, 괜찮아요. 다음 동작으로 넘어갑니다.")
-                                    speak("괜찮아요, 다음 동작으로 넘어갈게요")
+                                    speak_async("괜찮아요, 다음 동작으로 넘어갈게요")
                                     stage = "hands_on_waist"
                                     fail_count = 0
-                                    speak("두 번째 동작입니다. 허리에 손을 얹어보세요!")
-                                    time.sleep(2)
+                                    speak_async("두 번째 동작입니다. 허리에 손을 얹어보세요!")
+                                    pause = 2
                                 else:
-                                    speak("조금만 더 팔을 펴볼까요?")
-                            last_feedback_time = current_time
+                                    speak_async("조금만 더 팔을 펴볼까요?")
+                            # 다음 판정은 pause초 만큼 늦게 시작
+                            last_feedback_time = current_time + pause
 
                     # 허리에 손 얹기 동작
                     elif stage == "hands_on_waist":
@@ -129,26 +138,21 @@ def run_exercise_mode():
                             
                             if abs(wrist[1] - hip[1]) < 0.05:  # 손목-허리 y좌표 차이가 작으면 성공
                                 print("허리에 손 얹기 성공!")
-                                speak("정답! 축하합니다!")
+                                speak_async("정답! 축하합니다!", PRIORITY_HIGH)
                                 stage = "done"
                                 fail_count = 0
-                                time.sleep(3)
+                                finish_time = current_time + 3  # 3초간 화면 유지 후 종료
                             else:
                                 fail_count += 1
                                 print(f"허리에 손 얹기 오답 ({fail_count}/3)")
                                 if fail_count >= 3:
                                     print("3회 실패, 괜찮아요. 운동을 마칩니다.")
-                                    speak("괜찮아요, 운동을 마칩니다.")
+                                    speak_async("괜찮아요, 운동을 마칩니다.")
                                     stage = "done"
                                 else:
-                                    speak("다시 해보세요!")
+                                    speak_async("다시 해보세요!")
                             last_feedback_time = current_time
 
-                    # 운동 완료
-                    if stage == "done":
-                        print("모든 동작 완료")
-                        speak("모든 운동이 끝났습니다. 수고하셨습니다!")
-                        break
 
                 except Exception as e:
                     print(f"좌표 추출 오류: {e}")
@@ -156,6 +160,12 @@ def run_exercise_mode():
             else:
                 print("인식 실패. 카메라 앞으로 와주세요.")
             
+            # 운동 완료 (예약된 시각이 지나면 종료)
+            if stage == "done" and time.time() >= finish_time:
+                print("모든 동작 완료")
+                speak("모든 운동이 끝났습니다. 수고하셨습니다!")
+                break
+            
             # 화면에 관절 표시
             if results.pose_landmarks:
                 mp_drawing.draw_landmarks(image, results.pose_landmarks, mp_pose.POSE_CONNECTIONS)
@@ -0,0 +1,172 @@
+import speech_recognition as sr
+import threading
+import time
+from collections import deque
+
+class MicrophoneCapture:
+    """마이크를 한 번만 열어 계속 읽고, 읽은 프레임을 여러 소비자에게 나눠 주는 캡처 소유자
+
+    프레임은 링 버퍼에 일련번호와 함께 저장되고, 소비자(명령 인식, 종료 감지 등)는
+    각자 커서(CaptureCursor)로 자기 위치부터 읽음 (서로의 읽기에 영향 없음)
+    소음 보정은 마이크를 열 때 한 번만 수행
+    읽기가 max_read_errors번 연속 실패하면 장치 오류로 보고 캡처를 끝냄 (reopen()으로 다시 열기)
+    """
+    def __init__(self, buffer_seconds=10, calibration_seconds=1, max_read_errors=20, reopen_delay=2.0):
+        self.buffer_seconds = buffer_seconds
+        self.calibration_seconds = calibration_seconds
+        self.max_read_errors = max_read_errors
+        self.reopen_delay = reopen_delay  # 다시 열기 시도 간격 (초)
+        self.device_error = None  # 장치 오류로 끝났을 때 마지막 오류
+        self._next_reopen = 0
+        self.mic = None
+        self.source = None
+        self.energy_threshold = 300
+        self.frames = deque()
+        self.next_seq = 0  # 다음에 들어올 프레임 번호
+        self.running = False
+        self.ready = threading.Event()  # 소음 보정 완료
+        self._cond = threading.Condition()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """마이크를 열고 캡처 스레드 시작 (이미 실행 중이면 그대로 사용)"""
+        with self._start_lock:
+            if self.running:
+                return
+            self._close_mic()  # 장치 오류로 끝난 이전 마이크 정리
+            self.mic = sr.Microphone()
+            self.source = self.mic.__enter__()
+            frames_per_second = self.source.SAMPLE_RATE / self.source.CHUNK
+            self.frames = deque(maxlen=max(1, int(self.buffer_seconds * frames_per_second)))
+            self.device_error = None
+            self.running = True
+            self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """캡처 중지 후 마이크 닫기 (읽고 있던 커서는 빈 데이터를 받고 끝남)"""
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+        self._close_mic()
+        self.ready.set()
+
+    def reopen(self):
+        """캡처가 끝났으면 마이크를 다시 열기 (reopen_delay 간격으로만 시도, 실행 중이면 True)"""
+        if self.running:
+            return True
+        wait = self._next_reopen - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_reopen = time.monotonic() + self.reopen_delay
+        try:
+            self.start()
+        except Exception as e:
+            print(f"[MIC] 마이크 열기 실패: {e}")
+            self.device_error = e
+            return False
+        print("[MIC] 마이크를 다시 열었습니다.")
+        return True
+
+    def _close_mic(self):
+        if self.mic is not None:
+            try:
+                self.mic.__exit__(None, None, None)
+            except Exception as e:
+                print(f"[MIC] 마이크 닫기 오류: {e}")
+            self.mic = self.source = None
+
+    def open_cursor(self, max_lag_seconds=2):
+        """새 소비자용 커서 (지금부터 들어오는 프레임을 읽음)"""
+        self.start()
+        self.ready.wait()
+        return CaptureCursor(self, max_lag_seconds)
+
+    def _capture_loop(self):
+        # 소음 보정 (처음 한 번만, 이때 읽은 프레임은 소비자에게 전달하지 않음)
+        try:
+            recognizer = sr.Recognizer()
+            recognizer.adjust_for_ambient_noise(self.source, duration=self.calibration_seconds)
+            self.energy_threshold = recognizer.energy_threshold
+            print(f"[MIC] 소음 보정 완료 (임계값 {self.energy_threshold:.0f})")
+        except Exception as e:
+            print(f"[MIC] 소음 보정 실패: {e}")
+        self.ready.set()
+
+        read_errors = 0
+        while self.running:
+            try:
+                frame = self.source.stream.read(self.source.CHUNK)
+                read_errors = 0
+            except Exception as e:
+                read_errors += 1
+                print(f"[MIC] 마이크 읽기 오류 ({read_errors}/{self.max_read_errors}): {e}")
+                if read_errors >= self.max_read_errors:
+                    # 장치가 빠졌거나 멈춤: 캡처 종료 (reopen()에서 다시 열기)
+                    self.device_error = e
+                    break
+                time.sleep(0.1)
+                continue
+            with self._cond:
+                self.frames.append(frame)
+                self.next_seq += 1
+                self._cond.notify_all()
+
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+
+    def live_position(self):
+        """다음에 들어올 프레임 번호 (커서를 지금 시점으로 옮길 때 사용)"""
+        with self._cond:
+            return self.next_seq
+
+    def read_frame(self, position, max_lag):
+        """position번 프레임 읽기 (없으면 들어올 때까지 대기)
+
+        반환값: (프레임, 다음 위치), 캡처가 끝났으면 (b"", position)
+        버퍼에서 이미 밀려났거나 max_lag보다 뒤처졌으면 읽을 수 있는 위치로 건너뜀
+        """
+        with self._cond:
+            while position >= self.next_seq and self.running:
+                self._cond.wait()
+            if position >= self.next_seq:
+                return b"", position
+            oldest = self.next_seq - len(self.frames)
+            position = max(position, oldest, self.next_seq - max_lag)
+            return self.frames[position - oldest], position + 1
+
+class CaptureCursor(sr.AudioSource):
+    """MicrophoneCapture의 링 버퍼를 읽는 소비자별 오디오 소스
+
+    sr.Recognizer.listen()에 마이크 대신 그대로 넘길 수 있음
+    (with 문에 써도 장치를 다시 열지 않음)
+    """
+    def __init__(self, capture, max_lag_seconds=2):
+        self.capture = capture
+        self.SAMPLE_RATE = capture.source.SAMPLE_RATE
+        self.SAMPLE_WIDTH = capture.source.SAMPLE_WIDTH
+        self.CHUNK = capture.source.CHUNK
+        self.max_lag = max(1, int(max_lag_seconds * self.SAMPLE_RATE / self.CHUNK))
+        self.position = capture.live_position()
+        self.stream = self
+
+    def seek_live(self):
+        """지금부터 들어오는 프레임을 읽도록 이동 (이전 소리는 건너뜀)"""
+        self.position = self.capture.live_position()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def read(self, size=None):
+        frame, self.position = self.capture.read_frame(self.position, self.max_lag)
+        return frame
+
+# 전역 캡처 (처음 커서를 열 때 마이크를 엶)
+microphone_capture = MicrophoneCapture()
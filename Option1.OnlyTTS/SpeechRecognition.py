@@ -1,18 +1,35 @@
 import speech_recognition as sr
 import sys
 import threading
-import time
+from MicrophoneCapture import microphone_capture
 
-r = sr.Recognizer()
-mic = sr.Microphone()
+# 마이크는 microphone_capture가 한 번만 열고, 스레드마다 자기 커서와 인식기로 읽음
+# (메인 스레드의 명령 인식과 백그라운드 종료 감지가 마이크를 두고 다투지 않음)
+_local = threading.local()
 
 stop_flag=False
 
+def _consumer():
+    """현재 스레드의 커서와 인식기 (처음 호출할 때 생성)"""
+    if not hasattr(_local, 'cursor'):
+        _local.cursor = microphone_capture.open_cursor()
+        _local.recognizer = sr.Recognizer()
+        _local.recognizer.energy_threshold = microphone_capture.energy_threshold  # 보정 결과 공유
+        _local.recognizer.dynamic_energy_threshold = True  # 듣는 동안 임계값 자동 조정
+    return _local.cursor, _local.recognizer
+
 def listen_command():  # 마이크로 음성 인식하고 문자열 반환
-    with mic as source:
-        r.adjust_for_ambient_noise(source)  # 소음 보정
-        print("듣고 있습니다...")
-        audio = r.listen(source)
+    # 마이크 캡처가 장치 오류로 끝났으면 다시 열기 (실패하면 잠시 뒤 다음 호출에서 재시도)
+    if not microphone_capture.reopen():
+        print("마이크를 사용할 수 없습니다:", microphone_capture.device_error)
+        return None
+    source, r = _consumer()
+    source.seek_live()  # 지난 호출 이후 쌓인 소리(방금 나온 TTS 안내 등)는 듣지 않음
+    print("듣고 있습니다...")
+    audio = r.listen(source)
+    if not audio.frame_data:
+        print("마이크 캡처가 끊겼습니다.")
+        return None  # 다음 호출에서 다시 열기
 
     try:
         text = r.recognize_google(audio, language="ko-KR")
@@ -31,8 +48,6 @@ def listen_command():  # 마이크로 음성 인식하고 문자열 반환
     except sr.RequestError as e:
         print("Google API 요청 실패:", e)
         return None
-    finally:
-        time.sleep(3)
     
 def listen_loop(): #계속 돌아가면서 종료를 감지
     global stop_flag
@@ -1,30 +1,303 @@
 import pyttsx3
 import threading
+import hashlib
+import itertools
+import io
+import os
+import queue
+import wave
+from collections import deque
+from concurrent.futures import Future, CancelledError
+from pathlib import Path
+
+try:
+    import winsound
+except ImportError:
+    winsound = None  # Windows가 아니면 캐시 재생 불가 (실시간 합성 사용)
+
+# 렌더링된 문장 WAV 저장 위치
+TTS_CACHE_DIR = Path(__file__).parent / "tts_cache"
+RENDER_IDLE_SECONDS = 0.5  # 대기열이 이만큼 비어 있을 때만 새 문장을 캐시에 렌더링
+
+class TTSCache:
+    """문장별로 렌더링한 WAV를 디스크에 저장하고 메모리에 올려두는 캐시
+
+    키: 문장 + 음성 + 속도의 해시 (음성/속도가 바뀌면 다시 렌더링)
+    """
+    def __init__(self, cache_dir=TTS_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.clips = {}  # 키 -> WAV 바이트
+        self.preload()
+
+    @staticmethod
+    def make_key(text, voice, rate):
+        return hashlib.sha1(f"{voice}|{rate}|{text}".encode("utf-8")).hexdigest()
+
+    def preload(self):
+        """디스크에 저장된 WAV를 모두 메모리로 읽기"""
+        for path in self.cache_dir.glob("*.wav"):
+            if '.' in path.stem:
+                continue  # 렌더링 중 남은 임시 파일
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            if data:
+                self.clips[path.stem] = data
+        print(f"[TTS] 캐시된 문장 {len(self.clips)}개 불러옴")
+
+    def get(self, key):
+        return self.clips.get(key)
+
+    def path(self, key):
+        return self.cache_dir / f"{key}.wav"
+
+    def render(self, engine, text, key):
+        """save_to_file로 문장을 WAV로 렌더링해 캐시에 추가"""
+        path = self.path(key)
+        tmp_path = self.cache_dir / f"{key}.tmp.wav"
+        try:
+            engine.save_to_file(text, str(tmp_path))
+            engine.runAndWait()
+            data = tmp_path.read_bytes()
+            if not data:
+                return None
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[TTS] 문장 렌더링 실패: {e}")
+            return None
+        finally:
+            if tmp_path.exists():
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+        self.clips[key] = data
+        return data
+
+    def discard(self, key):
+        """렌더링이 중간에 끊긴 문장 삭제"""
+        self.clips.pop(key, None)
+        try:
+            self.path(key).unlink()
+        except OSError:
+            pass
+
+def wav_duration(data):
+    """WAV 바이트의 재생 길이(초), 읽을 수 없으면 None"""
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, EOFError, ZeroDivisionError):
+        return None
+
+# 발화 우선순위 (값이 작을수록 먼저)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+class Utterance:
+    """대기열에 들어가는 발화"""
+    def __init__(self, text, priority, seq):
+        self.text = text
+        self.priority = priority
+        self.seq = seq
+        self.future = Future()
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
 
 class TTSManager:
+    """TTS 전용 작업 스레드 하나가 pyttsx3 엔진을 소유하고 발화 대기열을 처리
+
+    pyttsx3 엔진은 스레드 안전하지 않으므로 엔진 생성과 모든 호출은 작업 스레드에서만 수행
+    (interrupt()도 중단 플래그만 세우고, 실제 중지는 작업 스레드가 수행)
+    엔진은 작업 스레드에서 백그라운드로 초기화 (import 시 블로킹 없음)
+    """
     def __init__(self):
+        self.engine = None
+        self.cache = None
+        self.ready = threading.Event()  # 엔진 초기화 완료 여부
+        self.init_error = None
+
+        self._queue = queue.PriorityQueue()
+        self._lock = threading.Lock()
+        self._pending = []  # 아직 시작하지 않은 발화 (중복 확인 / 중단용)
+        self._counter = itertools.count()
+        self._interrupted = threading.Event()  # 현재 발화 중지 요청 (작업 스레드가 확인)
+        self._to_render = deque()  # 캐시에 렌더링할 (문장, 키), 작업 스레드 전용
+
+        self._thread = threading.Thread(target=self._worker, daemon=True, name="TTSWorker")
+        self._thread.start()
+
+    def _init_engine(self):
+        try:
+            import comtypes  # Windows SAPI: 작업 스레드에서 COM 초기화
+            comtypes.CoInitialize()
+        except (ImportError, OSError, AttributeError):
+            pass
+
         self.engine = pyttsx3.init()
         self.engine.setProperty('rate', 150)  # 말하기 속도
         self.engine.setProperty('volume', 0.9)  # 볼륨
-        
+
         # 한국어 음성 설정 (시스템에 한국어 음성이 설치되어 있어야 함)
         voices = self.engine.getProperty('voices')
         for voice in voices:
             if 'korean' in voice.name.lower() or 'ko' in voice.id.lower():
                 self.engine.setProperty('voice', voice.id)
                 break
-    
-    def speak(self, text):
-        """텍스트를 음성으로 출력"""
+
+        # 단어마다 중지 요청 확인 (콜백은 runAndWait 안, 즉 작업 스레드에서 호출됨)
+        self.engine.connect('started-word', self._on_word)
+
+        # 렌더링된 문장 캐시 (Windows에서만 메모리 재생 가능)
+        if winsound:
+            self.cache = TTSCache()
+        else:
+            self.cache = None
+            print("[TTS] winsound를 사용할 수 없어 문장 캐시를 사용하지 않습니다 (실시간 합성만 사용)")
+
+    def _worker(self):
+        try:
+            self._init_engine()
+        except Exception as e:
+            print(f"[TTS] 엔진 초기화 실패: {e}")
+            self.init_error = e
+        finally:
+            self.ready.set()
+
+        while True:
+            try:
+                # 렌더링할 문장이 있으면 대기열이 한동안 비어 있을 때 하나씩 렌더링
+                utterance = self._queue.get(timeout=RENDER_IDLE_SECONDS if self._to_render else None)
+            except queue.Empty:
+                self._render_next()
+                continue
+            if utterance.text is None:
+                break  # 종료 요청
+            with self._lock:
+                if utterance in self._pending:
+                    self._pending.remove(utterance)
+                self._interrupted.clear()  # 이후의 interrupt()는 이 발화를 중지
+            if not utterance.future.set_running_or_notify_cancel():
+                continue  # 중단된 발화
+            if self.init_error is not None:
+                utterance.future.set_exception(self.init_error)
+                continue
+            try:
+                self._speak_now(utterance.text)
+            except Exception as e:
+                print(f"[TTS] 발화 오류: {e}")
+                utterance.future.set_exception(e)
+            else:
+                utterance.future.set_result(True)
+
+    def _cache_key(self, text):
+        return TTSCache.make_key(text, self.engine.getProperty('voice'), self.engine.getProperty('rate'))
+
+    def _speak_now(self, text):
+        """작업 스레드에서 실행 (캐시된 문장은 바로 재생, 새 문장은 실시간 합성 후 캐시에 저장)"""
         print(f"[TTS] {text}")
+        if self.cache is None:
+            self._speak_live(text)
+            return
+
+        key = self._cache_key(text)
+        data = self.cache.get(key)
+        if data is not None:
+            try:
+                self._play_cached(key, data)
+                return
+            except RuntimeError as e:
+                print(f"[TTS] 캐시 재생 실패, 실시간 합성 사용: {e}")
+
+        self._speak_live(text)
+        if data is None and not self._interrupted.is_set() and (text, key) not in self._to_render:
+            self._to_render.append((text, key))  # 발화 완료를 알린 뒤 한가할 때 렌더링
+
+    def _render_next(self):
+        """렌더링 대기 중인 문장 하나를 캐시에 저장 (작업 스레드에서 실행)"""
+        text, key = self._to_render.popleft()
+        if self.cache.get(key) is not None:
+            return
+        with self._lock:
+            self._interrupted.clear()
+        self.cache.render(self.engine, text, key)
+        if self._interrupted.is_set():
+            # 렌더링 중 interrupt()로 엔진이 멈춤: 잘린 WAV는 버리고 다음에 다시 렌더링
+            self.cache.discard(key)
+            self._to_render.append((text, key))
+
+    def _play_cached(self, key, data):
+        """캐시된 WAV를 비동기로 재생하고, 끝나거나 중지 요청이 올 때까지 대기
+
+        메모리 재생(SND_MEMORY)은 비동기로 할 수 없으므로 디스크의 캐시 파일을 재생
+        """
+        duration = wav_duration(data)
+        path = self.cache.path(key)
+        if duration is None or not path.exists():
+            winsound.PlaySound(data, winsound.SND_MEMORY)
+            return
+        winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+        if self._interrupted.wait(duration):
+            winsound.PlaySound(None, 0)  # 재생 중인 WAV 중지
+
+    def _speak_live(self, text):
+        if self._interrupted.is_set():
+            return
         self.engine.say(text)
         self.engine.runAndWait()
-    
-    def speak_async(self, text):
-        """비동기적으로 텍스트를 음성으로 출력"""
-        thread = threading.Thread(target=self.speak, args=(text,))
-        thread.daemon = True
-        thread.start()
+
+    def _on_word(self, name, location, length):
+        if self._interrupted.is_set():
+            self.engine.stop()
+
+    def say(self, text, priority=PRIORITY_NORMAL, interrupt=False):
+        """발화를 대기열에 추가하고 완료 Future 반환
+
+        priority: PRIORITY_HIGH / PRIORITY_NORMAL / PRIORITY_LOW
+        interrupt: True면 대기 중인 발화를 취소하고 현재 발화를 끊음
+        같은 문장이 이미 대기 중이면 새로 넣지 않고 기존 Future 반환
+        """
+        if interrupt:
+            self.interrupt()
+        with self._lock:
+            for pending in self._pending:
+                if pending.text == text:
+                    return pending.future
+            utterance = Utterance(text, priority, next(self._counter))
+            self._pending.append(utterance)
+        self._queue.put(utterance)
+        return utterance.future
+
+    def interrupt(self):
+        """대기 중인 발화를 모두 취소하고 현재 발화 중지 (중지는 작업 스레드가 수행)"""
+        with self._lock:
+            for pending in self._pending:
+                pending.future.cancel()
+            self._pending.clear()
+            self._interrupted.set()
+
+    def speak(self, text, priority=PRIORITY_NORMAL):
+        """텍스트를 음성으로 출력 (발화가 끝날 때까지 대기)"""
+        try:
+            self.say(text, priority).result()
+        except CancelledError:
+            pass
+        except Exception as e:
+            print(f"[TTS] 음성 출력 실패: {e}")
+
+    def speak_async(self, text, priority=PRIORITY_NORMAL):
+        """비동기적으로 텍스트를 음성으로 출력 (완료 Future 반환)"""
+        return self.say(text, priority)
+
+    def shutdown(self, timeout=5.0):
+        """대기 중인 발화를 취소하고 작업 스레드 종료"""
+        self.interrupt()
+        self._queue.put(Utterance(None, -1, next(self._counter)))
+        self._thread.join(timeout=timeout)
 
 # 전역 TTS 인스턴스
 tts = TTSManager()
@@ -33,6 +306,6 @@ def speak(text):
     """간단한 TTS 함수"""
     tts.speak(text)
 
-def speak_async(text):
+def speak_async(text, priority=PRIORITY_NORMAL):
     """비동기 TTS 함수"""
-    tts.speak_async(text)
+    return tts.speak_async(text, priority)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오디오 파일 색인 모듈
+MP3 디렉토리를 시작할 때 한 번만 스캔해 클립 ID(0001, 1, 0001.MP3 ...) -> 파일 경로/크기/길이 색인 생성
+디렉토리 수정 시간(mtime)이 바뀐 경우에만 다시 스캔하므로, 클립 조회는 딕셔너리 조회 한 번
+"""
+
+import os
+import re
+import time
+import wave
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from Logger import get_logger
+
+log = get_logger("ASSET")
+
+AUDIO_EXTENSIONS = ('.mp3', '.wav')
+
+@dataclass(frozen=True)
+class AudioAsset:
+    """색인된 오디오 파일 정보"""
+    clip_id: str
+    path: Path
+    size: int
+    duration: Optional[float]  # 초 단위 (알 수 없으면 None)
+
+def normalize_clip_id(name) -> str:
+    """클립 이름 정규화: 1, "1", "0001", "0001.MP3" -> "0001" """
+    if isinstance(name, int):
+        return f"{name:04d}"
+    text = str(name).strip()
+    stem, ext = os.path.splitext(text)
+    if ext.lower() in AUDIO_EXTENSIONS:
+        text = stem
+    if text.isdigit():
+        return f"{int(text):04d}"
+    return text.lower()
+
+# MPEG 오디오 Layer III 프레임 헤더 표
+_MP3_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],   # MPEG1
+    2: [22050, 24000, 16000],   # MPEG2
+    0: [11025, 12000, 8000],    # MPEG2.5
+}
+
+def mp3_duration(path) -> Optional[float]:
+    """MP3 길이 계산 (Xing/Info/VBRI 헤더가 있으면 프레임 수, 없으면 CBR 비트레이트 기준)"""
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            data = f.read(64 * 1024)
+    except OSError:
+        return None
+
+    # ID3v2 태그 건너뛰기
+    offset = 0
+    if data[:3] == b'ID3' and len(data) >= 10:
+        tag_size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        offset = 10 + tag_size + (10 if data[5] & 0x10 else 0)
+        if offset + 4 > len(data):
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(64 * 1024)
+            file_size -= offset
+            offset = 0
+
+    # 첫 번째 프레임 동기 헤더 찾기
+    while offset + 4 <= len(data):
+        if data[offset] == 0xFF and (data[offset + 1] & 0xE0) == 0xE0:
+            header = struct.unpack('>I', data[offset:offset + 4])[0]
+            version = (header >> 19) & 0x3
+            layer = (header >> 17) & 0x3
+            bitrate_index = (header >> 12) & 0xF
+            rate_index = (header >> 10) & 0x3
+            if version != 1 and layer == 1 and 0 < bitrate_index < 15 and rate_index < 3:
+                break
+        offset += 1
+    else:
+        return None
+
+    mono = ((header >> 6) & 0x3) == 3
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples_per_frame = 1152 if version == 3 else 576
+
+    # VBR 헤더 (Xing/Info: 사이드 정보 뒤, VBRI: 헤더 뒤 32바이트)
+    side_info = (21 if mono else 36) if version == 3 else (13 if mono else 21)
+    xing = offset + side_info
+    if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+        flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            frames = struct.unpack('>I', data[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+    vbri = offset + 36
+    if data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+        frames = struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    # CBR: 오디오 데이터 크기 / 비트레이트
+    table = _MP3_BITRATES['mpeg1' if version == 3 else 'mpeg2']
+    bitrate = table[bitrate_index] * 1000
+    return max(file_size - offset, 0) * 8 / bitrate
+
+def wav_duration(path) -> Optional[float]:
+    """WAV 길이 계산"""
+    try:
+        with wave.open(str(path), 'rb') as w:
+            return w.getnframes() / float(w.getframerate())
+    except (OSError, wave.Error, EOFError):
+        return None
+
+def audio_duration(path) -> Optional[float]:
+    """확장자에 맞게 오디오 길이 계산"""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == '.mp3':
+        return mp3_duration(path)
+    if ext == '.wav':
+        return wav_duration(path)
+    return None
+
+class AudioAssetIndex:
+    """클립 ID -> AudioAsset 색인
+
+    candidate_dirs 중 오디오 파일이 있는 첫 번째 디렉토리를 사용
+    check_interval초마다 한 번만 디렉토리 mtime을 확인하고, 바뀐 경우에만 다시 스캔
+    """
+    def __init__(self, candidate_dirs: Iterable, check_interval: float = 5.0):
+        self.candidate_dirs = [Path(d) for d in candidate_dirs]
+        self.check_interval = check_interval
+        self.directory: Optional[Path] = None
+
+        self._lock = threading.Lock()
+        self._assets: Dict[str, AudioAsset] = {}
+        self._aliases: Dict[str, str] = {}  # 별칭 -> 대표 클립 ID
+        self._mtime = None
+        self._last_check = 0.0
+        self.scan_count = 0
+
+    def refresh(self, force: bool = False) -> bool:
+        """디렉토리가 바뀌었으면 다시 스캔 (스캔했으면 True)"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            directory = self.directory
+            mtime = self._dir_mtime(directory) if directory is not None else None
+            if mtime is None:
+                directory = self._discover_directory()
+                mtime = self._dir_mtime(directory) if directory is not None else None
+            if not force and directory == self.directory and mtime == self._mtime and self.scan_count:
+                return False
+
+            self.directory = directory
+            self._mtime = mtime
+            self._scan()
+            return True
+
+    def lookup(self, clip_id) -> Optional[AudioAsset]:
+        """클립 ID로 파일 정보 조회"""
+        if time.monotonic() - self._last_check >= self.check_interval:
+            self.refresh()
+        key = normalize_clip_id(clip_id)
+        with self._lock:
+            canonical = self._aliases.get(key, key)
+            return self._assets.get(canonical)
+
+    def clip_ids(self) -> List[str]:
+        """색인된 클립 ID 목록 (정렬)"""
+        with self._lock:
+            return sorted(self._assets)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._assets)
+
+    def _discover_directory(self) -> Optional[Path]:
+        for path in self.candidate_dirs:
+            try:
+                if path.is_dir() and any(entry.name.lower().endswith(AUDIO_EXTENSIONS)
+                                         for entry in os.scandir(path)):
+                    return path
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def _dir_mtime(directory: Optional[Path]) -> Optional[float]:
+        try:
+            return os.stat(directory).st_mtime
+        except (OSError, TypeError):
+            return None
+
+    def _scan(self) -> None:
+        # self._lock을 잡은 상태에서 호출
+        assets = {}
+        aliases = {}
+        if self.directory is not None:
+            try:
+                entries = sorted(os.scandir(self.directory), key=lambda e: e.name)
+            except OSError as e:
+                log.error("오디오 디렉토리 스캔 오류", path=self.directory, error=e)
+                entries = []
+            for entry in entries:
+                if not entry.is_file() or not entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                    continue
+                clip_id = normalize_clip_id(entry.name)
+                if clip_id in assets:
+                    continue  # 같은 번호의 파일이 여러 개면 이름순 첫 번째 사용
+                path = Path(entry.path)
+                duration = audio_duration(path)
+                if duration is not None:
+                    duration = round(duration, 3)
+                assets[clip_id] = AudioAsset(clip_id, path, entry.stat().st_size, duration)
+                # "0001_인사.mp3" 처럼 번호로 시작하는 파일은 번호로도 조회 가능
+                match = re.match(r'(\d+)', entry.name)
+                if match:
+                    aliases.setdefault(normalize_clip_id(match.group(1)), clip_id)
+
+        self._assets = assets
+        self._aliases = aliases
+        self.scan_count += 1
+        log.info("오디오 색인 생성", path=self.directory, clips=len(assets))
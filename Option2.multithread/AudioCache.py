@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오디오 클립 캐시 모듈
+안내 음성 MP3를 시작할 때 pygame.mixer.Sound로 미리 디코딩해 메모리에 보관
+재생 시에는 파일 입출력 없이 메모리에서 바로 재생 (메모리 상한 초과 시 LRU 제거)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+from Logger import get_logger
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+log = get_logger("AUDIO")
+
+class AudioClipCache:
+    """디코딩된 클립(pygame.mixer.Sound)을 보관하는 LRU 캐시"""
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._clips = OrderedDict()  # clip_id -> (Sound, 바이트 수)
+        self._total_bytes = 0
+
+        # 통계 카운터
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'loads': 0,
+            'evictions': 0,
+        }
+
+    def get(self, clip_id: str):
+        """캐시된 Sound 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._clips.get(clip_id)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._clips.move_to_end(clip_id)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def load(self, clip_id: str, path) -> Optional[object]:
+        """파일을 디코딩해 캐시에 추가 (믹서 샘플레이트로 변환됨, 실패 시 None)"""
+        if pygame is None or not pygame.mixer.get_init():
+            return None
+        try:
+            sound = pygame.mixer.Sound(str(path))
+        except Exception as e:
+            log.warning("클립 디코딩 실패", clip=clip_id, path=path, error=e)
+            return None
+
+        nbytes = self._estimate_bytes(sound)
+        with self._lock:
+            old = self._clips.pop(clip_id, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._clips[clip_id] = (sound, nbytes)
+            self._total_bytes += nbytes
+            self._stats['loads'] += 1
+            self._evict()
+        return sound
+
+    def preload(self, clip_ids: Iterable[str], resolve_path: Callable[[str], Optional[object]]) -> int:
+        """여러 클립을 미리 디코딩 (resolve_path: clip_id -> 파일 경로, 로드한 개수 반환)"""
+        loaded = 0
+        for clip_id in clip_ids:
+            path = resolve_path(clip_id)
+            if path is not None and self.load(clip_id, path) is not None:
+                loaded += 1
+        log.info("클립 미리 불러오기 완료", loaded=loaded, bytes=self._total_bytes)
+        return loaded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clips.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """통계 카운터 복사본 반환"""
+        with self._lock:
+            stats = self._stats.copy()
+            stats['clips'] = len(self._clips)
+            stats['bytes'] = self._total_bytes
+            return stats
+
+    def _evict(self) -> None:
+        # self._lock을 잡은 상태에서 호출 (가장 최근 클립 하나는 남김)
+        while self._total_bytes > self.max_bytes and len(self._clips) > 1:
+            clip_id, (_, nbytes) = self._clips.popitem(last=False)
+            self._total_bytes -= nbytes
+            self._stats['evictions'] += 1
+            log.debug("클립 캐시에서 제거", clip=clip_id, bytes=nbytes)
+
+    @staticmethod
+    def _estimate_bytes(sound) -> int:
+        """디코딩된 PCM 크기 계산 (길이 x 샘플레이트 x 채널 x 샘플 크기)"""
+        frequency, size, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * (abs(size) // 8))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오디오 명령 실행기
+스피커(LED 안내/MP3 재생) 명령을 하나의 전용 스레드에서 순서대로 실행
+명령마다 스레드를 만들지 않고, 단계가 바뀌면 대기 중인 명령을 취소할 수 있음
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+from Logger import get_logger
+
+log = get_logger("AUDIO")
+
+class AudioCommand:
+    """대기열에 들어가는 오디오 명령"""
+    __slots__ = ('func', 'args', 'kwargs', 'tag', 'future')
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict, tag: Optional[str]):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.tag = tag
+        self.future = Future()
+
+class AudioExecutor:
+    """순서가 보장되는 단일 스레드 오디오 명령 실행기"""
+    def __init__(self, name: str = "AudioExecutor"):
+        self.name = name
+        self._cond = threading.Condition(threading.Lock())
+        self._pending = deque()
+        self._thread = None
+        self._running = False
+
+        # 통계 카운터
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'cancelled': 0,
+        }
+
+    def submit(self, func: Callable, *args: Any, tag: Optional[str] = None, **kwargs: Any) -> Future:
+        """명령을 대기열 끝에 추가하고 완료 Future 반환
+
+        tag: 명령이 속한 단계 (cancel_pending(tag)로 한꺼번에 취소)
+        """
+        command = AudioCommand(func, args, kwargs, tag)
+        with self._cond:
+            if not self._running:
+                self._start()
+            self._pending.append(command)
+            self._stats['submitted'] += 1
+            self._cond.notify()
+        return command.future
+
+    def cancel_pending(self, tag: Optional[str] = None) -> int:
+        """아직 실행되지 않은 명령 취소 (tag가 None이면 전부, 취소한 개수 반환)"""
+        with self._cond:
+            keep = deque()
+            cancelled = 0
+            for command in self._pending:
+                if tag is None or command.tag == tag:
+                    command.future.cancel()
+                    cancelled += 1
+                else:
+                    keep.append(command)
+            self._pending = keep
+            self._stats['cancelled'] += cancelled
+        if cancelled:
+            log.debug("대기 중인 오디오 명령 취소", tag=tag, count=cancelled)
+        return cancelled
+
+    def pending_count(self) -> int:
+        """대기 중인 명령 수"""
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        """통계 카운터 복사본 반환"""
+        with self._cond:
+            stats = self._stats.copy()
+            stats['pending'] = len(self._pending)
+            return stats
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = True, timeout: float = 5.0) -> None:
+        """실행기 종료 (기본: 대기 명령 취소 후 실행 중인 명령 완료 대기)"""
+        if cancel_pending:
+            self.cancel_pending()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+        if wait and thread and thread.is_alive():
+            thread.join(timeout=timeout)
+        log.info("오디오 실행기 종료", **self.stats())
+
+    def _start(self) -> None:
+        # self._cond를 잡은 상태에서 호출
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True, name=self.name)
+        self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                command = self._pending.popleft()
+
+            if not command.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = command.func(*command.args, **command.kwargs)
+            except Exception as e:
+                log.error("오디오 명령 실행 오류", command=getattr(command.func, '__name__', command.func), error=e)
+                with self._cond:
+                    self._stats['failed'] += 1
+                command.future.set_exception(e)
+            else:
+                with self._cond:
+                    self._stats['completed'] += 1
+                command.future.set_result(result)
+
+# 전역 오디오 실행기
+audio_executor = AudioExecutor()
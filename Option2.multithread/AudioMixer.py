@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 채널 믹서 모듈
+안내 음성 / 효과음 / 배경 음악에 pygame.mixer 채널을 하나씩 예약해 동시에 재생
+채널별 볼륨을 따로 조절하고, 안내 음성이 나오는 동안 배경 음악 볼륨을 낮춤(더킹)
+"""
+
+import math
+import threading
+import time
+from array import array
+from typing import Dict, Optional, Sequence, Tuple
+from Logger import get_logger
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+log = get_logger("MIXER")
+
+# 예약 채널 (pygame.mixer.set_reserved로 일반 Sound.play()에서 사용하지 않도록 예약)
+VOICE = 'voice'
+EFFECTS = 'effects'
+MUSIC = 'music'
+CHANNEL_ROLES = (VOICE, EFFECTS, MUSIC)
+
+# 효과음 톤 (주파수 Hz, 길이 초) 목록
+EFFECT_TONES = {
+    'start': [(660, 0.12), (880, 0.12)],
+    'success': [(784, 0.1), (1047, 0.18)],
+    'fail': [(330, 0.25)],
+    'complete': [(523, 0.1), (659, 0.1), (784, 0.2)],
+    'clap': [(1200, 0.05), (1200, 0.05), (1200, 0.05)],
+    'default': [(880, 0.15)],
+}
+
+class ChannelMixer:
+    """역할별 예약 채널 관리 (pygame.mixer 초기화 후 생성)"""
+    def __init__(self, volumes: Optional[Dict[str, float]] = None,
+                 duck_level: float = 0.3, ducked_roles: Sequence[str] = (MUSIC,)):
+        self.volumes = {VOICE: 1.0, EFFECTS: 0.8, MUSIC: 0.5}
+        if volumes:
+            self.volumes.update(volumes)
+        self.duck_level = duck_level
+        self.ducked_roles = tuple(ducked_roles)
+
+        self._lock = threading.Condition()
+        self._ducked = False
+        self._voice_end = 0.0  # 안내 음성(대기열 포함)이 끝나는 예상 시각 (time.monotonic 기준)
+        self._running = True
+        self._tones: Dict[str, object] = {}
+
+        pygame.mixer.set_reserved(len(CHANNEL_ROLES))
+        self.channels = {role: pygame.mixer.Channel(i) for i, role in enumerate(CHANNEL_ROLES)}
+        for role, channel in self.channels.items():
+            channel.set_volume(self.volumes[role])
+        log.info("예약 채널 설정 완료", **{role: i for i, role in enumerate(CHANNEL_ROLES)})
+
+        # 안내 음성 종료 감시 (예상 종료 시각에만 깨어나 더킹 해제)
+        self._watcher = threading.Thread(target=self._watch_voice_end, daemon=True, name="MixerDucking")
+        self._watcher.start()
+
+    def play(self, role: str, sound, loops: int = 0):
+        """역할 채널에서 재생 (같은 채널의 이전 소리는 끊김, 채널 반환)"""
+        channel = self.channels[role]
+        channel.play(sound, loops=loops)
+        if role == VOICE:
+            length = sound.get_length() * (loops + 1) if loops >= 0 else math.inf
+            with self._lock:
+                self._voice_end = time.monotonic() + length
+            self.duck()
+        return channel
+
+    def queue(self, role: str, sound) -> None:
+        """역할 채널의 현재 소리 뒤에 이어서 재생 예약"""
+        self.channels[role].queue(sound)
+        if role == VOICE:
+            with self._lock:
+                self._voice_end = max(self._voice_end, time.monotonic()) + sound.get_length()
+                self._lock.notify_all()
+
+    def set_volume(self, role: str, volume: float) -> None:
+        """채널 볼륨 설정 (0.0 ~ 1.0, 더킹 중이면 더킹 비율 적용)"""
+        with self._lock:
+            self.volumes[role] = max(0.0, min(1.0, volume))
+            self._apply_volume(role)
+
+    def busy(self, role: str) -> bool:
+        return self.channels[role].get_busy()
+
+    def stop(self, role: Optional[str] = None) -> None:
+        """채널 재생 중지 (role이 None이면 전부)"""
+        for name in ([role] if role else CHANNEL_ROLES):
+            self.channels[name].stop()
+        if role in (None, VOICE):
+            self.unduck()
+
+    def close(self) -> None:
+        """재생 중지 후 종료 감시 스레드 종료"""
+        self.stop()
+        with self._lock:
+            self._running = False
+            self._lock.notify_all()
+        self._watcher.join(timeout=1.0)
+
+    def duck(self) -> None:
+        """안내 음성 재생 중 다른 채널 볼륨 낮춤"""
+        with self._lock:
+            if self._ducked:
+                return
+            self._ducked = True
+            for role in self.ducked_roles:
+                self._apply_volume(role)
+            self._lock.notify_all()
+
+    def unduck(self) -> None:
+        """더킹 해제 (원래 볼륨 복구)"""
+        with self._lock:
+            if not self._ducked:
+                return
+            self._ducked = False
+            for role in self.ducked_roles:
+                self._apply_volume(role)
+
+    def _watch_voice_end(self) -> None:
+        """안내 음성 종료 이벤트 처리 (더킹 중일 때 예상 종료 시각까지 대기 후 해제)
+
+        pygame 채널 종료 이벤트는 pygame 디스플레이 이벤트 큐가 있어야 받을 수 있으므로
+        재생한 소리 길이로 종료 시각을 계산해 그 시각에 한 번 확인
+        """
+        while True:
+            with self._lock:
+                while self._running and not self._ducked:
+                    self._lock.wait()
+                if not self._running:
+                    return
+                delay = self._voice_end - time.monotonic()
+                if delay > 0:
+                    self._lock.wait(None if delay == math.inf else delay)
+                    continue
+            if self.channels[VOICE].get_busy():
+                # 디코딩/출력 지연으로 조금 늦게 끝나는 경우
+                with self._lock:
+                    self._voice_end = time.monotonic() + 0.05
+                continue
+            self.unduck()
+
+    def play_effect(self, sound_type: str):
+        """효과음 채널에서 합성 톤 재생 (파일/스트림 없이 바로 재생)"""
+        tone = self._tones.get(sound_type)
+        if tone is None:
+            tone = synthesize_tone(EFFECT_TONES.get(sound_type, EFFECT_TONES['default']))
+            if tone is None:
+                return None
+            self._tones[sound_type] = tone
+        return self.play(EFFECTS, tone)
+
+    def _apply_volume(self, role: str) -> None:
+        # self._lock을 잡은 상태에서 호출
+        volume = self.volumes[role]
+        if self._ducked and role in self.ducked_roles:
+            volume *= self.duck_level
+        self.channels[role].set_volume(volume)
+
+def synthesize_tone(notes: Sequence[Tuple[float, float]], amplitude: float = 0.4, fade: float = 0.01):
+    """(주파수, 길이) 목록으로 사인파 톤 Sound 생성 (16비트 signed 믹서일 때만, 실패 시 None)"""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    frequency, size, channels = init
+    if size != -16:
+        log.warning("16비트 signed 믹서가 아니어서 효과음 톤을 만들 수 없습니다", size=size)
+        return None
+
+    samples = array('h')
+    peak = int(32767 * amplitude)
+    fade_len = max(1, int(frequency * fade))
+    for note_freq, duration in notes:
+        count = int(frequency * duration)
+        step = 2 * math.pi * note_freq / frequency
+        for i in range(count):
+            # 음 사이 클릭 소리를 막기 위해 앞뒤를 짧게 페이드
+            envelope = min(1.0, i / fade_len, (count - i) / fade_len)
+            value = int(peak * envelope * math.sin(step * i))
+            samples.extend([value] * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
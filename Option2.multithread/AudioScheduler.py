@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+우선순위 오디오 스케줄러 모듈
+안내 음성 클립을 우선순위(성공 > 다음 자세 안내 > 실패 > 기타)에 따라 재생
+- 더 높은 우선순위 클립이 들어오면 재생 중인 낮은 우선순위 클립을 끊고 재생
+- 이미 대기 중인 같은 클립(같은 태그)은 다시 넣지 않음
+- 여러 클립을 묶은 시퀀스는 채널 대기열을 이용해 끊김 없이 이어서 재생
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional
+from Logger import get_logger
+
+log = get_logger("AUDIO")
+
+class AudioPriority(IntEnum):
+    """클립 우선순위 (값이 클수록 우선)"""
+    AMBIENT = 0    # 기타 안내 (오류 안내 등)
+    FAIL = 1       # 자세 실패 안내
+    CUE = 2        # 다음 자세 / 시작 안내
+    SUCCESS = 3    # 자세 성공 안내
+
+class ClipRequest:
+    """재생 요청 (클립 하나 또는 이어서 재생할 클립 시퀀스)"""
+    __slots__ = ('clip_ids', 'priority', 'tag', 'future', 'submitted_at', 'seq', 'next_index')
+
+    def __init__(self, clip_ids: List[str], priority: AudioPriority, tag: Optional[str], seq: int):
+        self.clip_ids = clip_ids
+        self.priority = priority
+        self.tag = tag
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self.seq = seq
+        self.next_index = 0  # 다음에 채널에 넣을 클립 위치
+
+    def sort_key(self):
+        return (-self.priority, self.seq)
+
+class AudioScheduler:
+    """우선순위 기반 클립 재생 스케줄러
+
+    player는 전용 스레드에서만 호출되며 다음 메서드를 제공해야 함
+    (SpeakerController 참고)
+    - start_clip(clip_id) -> bool: 재생 시작 (실패 시 False)
+    - queue_clip(clip_id) -> bool: 현재 클립 뒤에 끊김 없이 이어서 재생 예약 (대기열이 차 있으면 False)
+    - clip_busy() -> bool: 재생 중 여부
+    - stop_clip(): 재생 중지
+    """
+    def __init__(self, name: str = "AudioScheduler", poll_interval: float = 0.02):
+        self.name = name
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: List[ClipRequest] = []
+        self._current: Optional[ClipRequest] = None
+        self._player = None
+        self._thread = None
+        self._running = False
+        self._counter = itertools.count()
+
+        # 통계 카운터
+        self._stats = {
+            'submitted': 0,
+            'played': 0,
+            'deduplicated': 0,
+            'preempted': 0,
+            'cancelled': 0,
+            'high_water': 0,
+        }
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def attach(self, player) -> None:
+        """재생기 연결 (스피커 초기화 후 호출)"""
+        with self._cond:
+            self._player = player
+            if not self._running:
+                self._start()
+            self._cond.notify()
+
+    def play(self, clip_id, priority: AudioPriority = AudioPriority.CUE,
+             tag: Optional[str] = None) -> Future:
+        """클립 재생 요청 (재생이 끝나면 True, 끊기거나 취소되면 False로 완료되는 Future 반환)"""
+        return self.play_sequence([clip_id], priority, tag)
+
+    def play_sequence(self, clip_ids: Iterable, priority: AudioPriority = AudioPriority.CUE,
+                      tag: Optional[str] = None) -> Future:
+        """여러 클립을 끊김 없이 이어서 재생 요청
+
+        tag: 요청이 속한 자세 단계 (cancel(tag)로 한꺼번에 취소)
+        """
+        clip_ids = [str(clip_id) for clip_id in clip_ids]
+        with self._cond:
+            # 같은 태그의 같은 클립이 이미 대기 중이면 새로 넣지 않고 기존 요청 공유
+            # (태그가 다르면 cancel(tag)로 각각 취소할 수 있도록 따로 넣음)
+            for request in self._pending:
+                if request.clip_ids == clip_ids and request.tag == tag:
+                    if priority > request.priority:
+                        request.priority = priority
+                        self._pending.sort(key=ClipRequest.sort_key)
+                    self._stats['deduplicated'] += 1
+                    log.debug("중복 클립 요청 무시", clips=",".join(clip_ids))
+                    return request.future
+
+            request = ClipRequest(clip_ids, AudioPriority(priority), tag, next(self._counter))
+            self._pending.append(request)
+            self._pending.sort(key=ClipRequest.sort_key)
+            self._stats['submitted'] += 1
+            self._stats['high_water'] = max(self._stats['high_water'], len(self._pending))
+            self._cond.notify()
+        return request.future
+
+    def cancel(self, tag: Optional[str] = None) -> int:
+        """대기 중인 요청 취소 (tag가 None이면 전부, 취소한 개수 반환)"""
+        with self._cond:
+            keep = []
+            cancelled = 0
+            for request in self._pending:
+                if tag is None or request.tag == tag:
+                    request.future.set_result(False)
+                    cancelled += 1
+                else:
+                    keep.append(request)
+            self._pending = keep
+            self._stats['cancelled'] += cancelled
+        if cancelled:
+            log.debug("대기 중인 클립 취소", tag=tag, count=cancelled)
+        return cancelled
+
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        with self._cond:
+            return len(self._pending)
+
+    def stats(self) -> Dict[str, float]:
+        """통계 (대기열 깊이, 스케줄링 지연 시간 포함)"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['depth'] = len(self._pending)
+            played = self._stats['played']
+            stats['latency_avg_ms'] = round(self._latency_total / played * 1000, 1) if played else 0.0
+            stats['latency_max_ms'] = round(self._latency_max * 1000, 1)
+            return stats
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """대기 중인 요청을 취소하고 재생 중지 후 스레드 종료"""
+        self.cancel()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=timeout)
+        log.info("오디오 스케줄러 종료", **self.stats())
+
+    def _start(self) -> None:
+        # self._cond를 잡은 상태에서 호출
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True, name=self.name)
+        self._thread.start()
+
+    def _worker(self) -> None:
+        # player는 이 스레드에서만 호출
+        while True:
+            with self._cond:
+                while self._running and (self._player is None or
+                                         (self._current is None and not self._pending)):
+                    self._cond.wait()
+                if not self._running:
+                    break
+                if self._current is not None:
+                    self._cond.wait(self.poll_interval)
+                    if not self._running:
+                        break
+
+                current = self._current
+                start_next = None
+                preempted = False
+                if self._pending and (current is None or self._pending[0].priority > current.priority):
+                    start_next = self._pending.pop(0)
+                    preempted = current is not None
+                player = self._player
+
+            if preempted:
+                player.stop_clip()
+                self._finish(current, False, 'preempted')
+                log.debug("낮은 우선순위 클립 중단", clips=",".join(current.clip_ids),
+                          by=",".join(start_next.clip_ids))
+                current = None
+
+            if start_next is not None:
+                self._begin(start_next, player)
+                continue
+
+            if current is not None:
+                self._advance(current, player)
+
+        # 종료 시 재생 중인 클립 정리
+        with self._cond:
+            current, player = self._current, self._player
+        if current is not None:
+            if player is not None:
+                player.stop_clip()
+            self._finish(current, False, 'cancelled')
+
+    def _begin(self, request: ClipRequest, player) -> None:
+        """요청의 첫 번째 재생 가능한 클립 시작"""
+        latency = time.monotonic() - request.submitted_at
+        with self._cond:
+            self._current = request
+            self._stats['played'] += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+        while request.next_index < len(request.clip_ids):
+            clip_id = request.clip_ids[request.next_index]
+            request.next_index += 1
+            if player.start_clip(clip_id):
+                log.debug("클립 재생 시작", clip=clip_id, priority=request.priority.name,
+                          latency_ms=round(latency * 1000, 1))
+                return
+        # 재생할 수 있는 클립이 없음
+        self._finish(request, False, None)
+
+    def _advance(self, request: ClipRequest, player) -> None:
+        """다음 클립을 미리 채널 대기열에 넣고, 다 끝났으면 요청 완료"""
+        if request.next_index < len(request.clip_ids):
+            if player.queue_clip(request.clip_ids[request.next_index]):
+                request.next_index += 1
+            elif not player.clip_busy():
+                # 대기열에 넣을 수 없는 클립(캐시 실패 등)은 현재 클립이 끝난 뒤 직접 시작
+                self._begin_remaining(request, player)
+            return
+        if not player.clip_busy():
+            self._finish(request, True, None)
+
+    def _begin_remaining(self, request: ClipRequest, player) -> None:
+        while request.next_index < len(request.clip_ids):
+            clip_id = request.clip_ids[request.next_index]
+            request.next_index += 1
+            if player.start_clip(clip_id):
+                return
+        self._finish(request, True, None)
+
+    def _finish(self, request: ClipRequest, result: bool, counter: Optional[str]) -> None:
+        with self._cond:
+            if self._current is request:
+                self._current = None
+            if counter:
+                self._stats[counter] += 1
+        if not request.future.done():
+            request.future.set_result(result)
+
+# 전역 오디오 스케줄러
+audio_scheduler = AudioScheduler()
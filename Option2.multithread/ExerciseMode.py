@@ -1,26 +1,47 @@
 import time
-import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from AudioExecutor import audio_executor
+from AudioScheduler import AudioPriority, audio_scheduler
+from TimerScheduler import timer_scheduler
 from ThreadManager import thread_manager, MessageType
 from VideoProcessor import video_processing_thread
+from VoiceCommands import VoiceCommandListener, STOP, PAUSE, RESUME, NEXT, REPEAT
 import SpeakerCommunication as ArduinoCommunication  # 아두이노 대신 스피커 사용
 
-def safe_arduino_command(func, *args, **kwargs):
-    """스피커 명령을 안전하게 실행 (논블로킹)"""
-    def execute_command():
-        try:
-            if ArduinoCommunication.speaker_controller is not None and ArduinoCommunication.speaker_controller.is_connected:
-                return func(*args, **kwargs)
-            else:
-                print(f"[EXERCISE] 스피커가 연결되지 않아 {func.__name__} 명령을 건너뜁니다.")
-                return False
-        except Exception as e:
-            print(f"[EXERCISE] {func.__name__} 실행 중 오류: {e}")
+def _execute_speaker_command(func, args, kwargs):
+    """오디오 실행기 스레드에서 스피커 명령 실행 (MP3는 재생이 끝날 때까지 대기)"""
+    try:
+        if ArduinoCommunication.speaker_controller is not None and ArduinoCommunication.speaker_controller.is_connected:
+            result = func(*args, **kwargs)
+            if isinstance(result, Future):
+                # 스케줄러에 넣은 클립이 끝날(또는 끊길) 때까지 대기 (다음 명령이 앞지르지 않도록)
+                try:
+                    return result.result(timeout=15.0)
+                except FutureTimeoutError:
+                    print(f"[EXERCISE] {func.__name__} 재생 완료 대기 시간 초과")
+                    return False
+            return result
+        else:
+            print(f"[EXERCISE] 스피커가 연결되지 않아 {func.__name__} 명령을 건너뜁니다.")
             return False
+    except Exception as e:
+        print(f"[EXERCISE] {func.__name__} 실행 중 오류: {e}")
+        return False
+
+def safe_arduino_command(func, *args, tag=None, **kwargs):
+    """스피커 명령을 안전하게 실행 (논블로킹)
     
-    # 스피커 명령을 별도 스레드에서 논블로킹으로 실행
-    speaker_thread = threading.Thread(target=execute_command, daemon=True)
-    speaker_thread.start()
-    return True
+    명령은 오디오 실행기 대기열에 순서대로 쌓이고 완료 Future가 반환됨
+    tag: 명령이 속한 자세 단계 (단계 전환 시 대기 중인 명령 취소용)
+    """
+    return audio_executor.submit(_execute_speaker_command, func, args, kwargs, tag=tag)
+
+# 음성 명령 '다음'으로 건너뛸 때의 다음 단계
+NEXT_STAGE = {
+    'posture1': 'posture2',
+    'posture2': 'posture3',
+    'posture3': 'done',
+}
 
 def run_exercise_mode():
     """멀티스레드 기반 운동 모드 실행"""
@@ -37,6 +58,7 @@ def run_exercise_mode():
         'current_stage': 'posture1',
         'video_completed': False,
         'exercise_running': True,
+        'paused': False,
         'current_video_index': 0,
         'fail_count': 0
     })
@@ -47,6 +69,10 @@ def run_exercise_mode():
         print("[EXERCISE] 영상 처리 스레드 시작 실패")
         return False
     
+    # 운동 중 음성 명령 (종료/일시정지/계속/다음/다시)
+    voice_listener = VoiceCommandListener(thread_manager)
+    voice_listener.start()
+    
     # 메인 스레드에서 메시지 처리 및 아두이노 제어
     try:
         exercise_success = handle_exercise_messages()
@@ -63,7 +89,11 @@ def run_exercise_mode():
     finally:
         # 스레드 정리
         print("[EXERCISE] 스레드 정리 중...")
+        voice_listener.stop()
         thread_manager.shutdown()
+        timer_scheduler.cancel()
+        audio_scheduler.cancel()
+        audio_executor.cancel_pending()
         safe_arduino_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'off')
 
 def handle_exercise_messages():
@@ -88,6 +118,7 @@ def handle_exercise_messages():
     
     exercise_running = True
     current_stage = "posture1"
+    paused = False
     
     print("[EXERCISE] 메시지 처리 루프 시작...")
     
@@ -114,13 +145,22 @@ def handle_exercise_messages():
         elif message.msg_type == MessageType.POSTURE_SUCCESS:
             # 자세 성공
             stage = message.data.get('stage', current_stage)
+            if stage != current_stage or paused:
+                # NEXT 명령 등으로 이미 넘어간 자세이거나 일시정지 중 도착한 결과는 무시
+                print(f"[EXERCISE] 지난 자세({stage}) 성공 메시지 무시")
+                continue
             print(f"[EXERCISE] {stage} 자세 성공!")
             
-            # 성공 안내 음성 재생
+            # 이전 단계에서 대기 중인 안내(실패 안내 등)와 타이머는 더 이상 의미가 없으므로 취소
+            audio_executor.cancel_pending(tag=stage)
+            audio_scheduler.cancel(tag=stage)
+            timer_scheduler.cancel(tag=stage)
+            
+            # 성공 안내 음성 재생 (재생 중인 실패 안내는 끊고 바로 재생)
             if stage in success_mp3_map:
-                safe_arduino_command(ArduinoCommunication.play_specific_mp3, 
-                                   ArduinoCommunication.speaker_controller, 
-                                   success_mp3_map[stage])
+                ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller,
+                                                  success_mp3_map[stage],
+                                                  AudioPriority.SUCCESS)
             
             safe_arduino_command(ArduinoCommunication.control_led, 
                                ArduinoCommunication.speaker_controller, 'green')
@@ -145,23 +185,31 @@ def handle_exercise_messages():
             
             # 다음 자세 안내
             if current_stage in stage_mp3_map:
-                time.sleep(2)  # 2초 대기 후 다음 자세 안내
-                safe_arduino_command(ArduinoCommunication.play_specific_mp3, 
-                                   ArduinoCommunication.speaker_controller, 
-                                   stage_mp3_map[current_stage])
+                # 2초 뒤 다음 자세 안내 (메시지 루프는 그동안 계속 동작)
+                # (성공 안내가 아직 재생 중이면 끝난 뒤 재생)
+                timer_scheduler.schedule(2.0, ArduinoCommunication.schedule_mp3,
+                                         ArduinoCommunication.speaker_controller,
+                                         stage_mp3_map[current_stage],
+                                         AudioPriority.CUE,
+                                         current_stage,
+                                         tag=current_stage)
         
         elif message.msg_type == MessageType.POSTURE_FAIL:
             # 자세 실패
             stage = message.data.get('stage', current_stage)
             fail_count = message.data.get('fail_count', 0)
+            if stage != current_stage or paused:
+                print(f"[EXERCISE] 지난 자세({stage}) 실패 메시지 무시")
+                continue
             print(f"[EXERCISE] {stage} 자세 실패 (실패 횟수: {fail_count})")
             
             # posture1과 posture2는 사람 인식만 되면 성공하므로 실패 메시지 재생하지 않음
             # posture3만 실패 메시지 재생
             if stage == "posture3" and stage in fail_mp3_map:
-                safe_arduino_command(ArduinoCommunication.play_specific_mp3, 
-                                   ArduinoCommunication.speaker_controller, 
-                                   fail_mp3_map[stage])
+                ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller,
+                                                  fail_mp3_map[stage],
+                                                  AudioPriority.FAIL,
+                                                  tag=stage)
             elif stage in ["posture1", "posture2"]:
                 print(f"[EXERCISE] {stage}는 사람 인식 대기 중... (실패 메시지 재생 안함)")
         
@@ -185,6 +233,64 @@ def handle_exercise_messages():
             exercise_running = False
             return False
         
+        elif message.msg_type == MessageType.VOICE_COMMAND:
+            # 운동 중 음성 명령
+            command = message.data.get('command')
+            print(f"[EXERCISE] 음성 명령: {command}")
+            
+            if command == STOP:
+                print("[EXERCISE] 음성 명령으로 운동을 종료합니다.")
+                exercise_running = False
+                break
+            
+            elif command == PAUSE and not paused:
+                paused = True
+                thread_manager.shared_data.set('paused', True)
+                thread_manager.send_to_video_thread(MessageType.PAUSE_EXERCISE)
+                # 일시정지 동안 안내 음성이 나오지 않도록 대기 중인 안내 취소
+                audio_scheduler.cancel()
+                timer_scheduler.cancel(tag=current_stage)
+            
+            elif command in (RESUME, PAUSE) and paused:
+                # 일시정지 중에 한 번 더 '잠깐'이라고 해도 다시 시작
+                paused = False
+                thread_manager.shared_data.set('paused', False)
+                thread_manager.send_to_video_thread(MessageType.RESUME_EXERCISE)
+                if current_stage in stage_mp3_map:
+                    ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller,
+                                                      stage_mp3_map[current_stage],
+                                                      AudioPriority.CUE,
+                                                      current_stage)
+            
+            elif command == NEXT:
+                # 현재 자세를 건너뛰고 다음 자세로
+                audio_scheduler.cancel(tag=current_stage)
+                timer_scheduler.cancel(tag=current_stage)
+                current_stage = NEXT_STAGE.get(current_stage, 'done')
+                if current_stage == "done":
+                    print("[EXERCISE] 마지막 자세를 건너뛰어 운동을 마칩니다.")
+                    exercise_running = False
+                    break
+                thread_manager.shared_data.set('current_stage', current_stage)
+                thread_manager.send_to_video_thread(MessageType.NEXT_POSTURE)
+                if paused:
+                    paused = False
+                    thread_manager.shared_data.set('paused', False)
+                    thread_manager.send_to_video_thread(MessageType.RESUME_EXERCISE)
+                ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller,
+                                                  stage_mp3_map[current_stage],
+                                                  AudioPriority.CUE,
+                                                  current_stage)
+            
+            elif command == REPEAT:
+                # 현재 자세 안내와 참조 영상을 처음부터 다시
+                thread_manager.send_to_video_thread(MessageType.RESTART_VIDEO)
+                if current_stage in stage_mp3_map:
+                    ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller,
+                                                      stage_mp3_map[current_stage],
+                                                      AudioPriority.CUE,
+                                                      current_stage)
+        
         elif message.msg_type == MessageType.SHUTDOWN:
             # 종료 요청
             print("[EXERCISE] 종료 요청 수신")
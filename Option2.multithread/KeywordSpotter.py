@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 명령어 인식 모듈 ("운동하자" / "종료")
+MFCC 특징 + DTW(동적 시간 정합)로 녹음해 둔 명령어 샘플(템플릿)과 비교
+- 네트워크 없이 수백 ms 안에 고정 명령어를 인식
+- 어느 명령어와도 가깝지 않은 발화만 전체 음성 인식기(Google)로 넘김
+
+템플릿 위치: keywords/<명령어>/*.wav (명령어마다 2~5개 권장)
+
+사용법:
+    python KeywordSpotter.py enroll 운동하자 a.wav b.wav   -> 템플릿 등록 (WAV 복사)
+    python KeywordSpotter.py record 종료 3                 -> 마이크로 3번 녹음해 등록
+    python KeywordSpotter.py test x.wav y.wav              -> WAV 파일 인식 결과 출력
+"""
+
+import sys
+import time
+import shutil
+import wave
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from Logger import get_logger
+
+log = get_logger("KWS")
+
+KEYWORD_DIR = Path(__file__).parent / "keywords"
+KEYWORDS = ("운동하자", "종료")
+SAMPLE_RATE = 16000
+
+# MFCC 설정 (25 ms 창, 10 ms 간격)
+FRAME_LENGTH = 400
+FRAME_STEP = 160
+NFFT = 512
+NUM_FILTERS = 26
+NUM_CEPS = 13
+
+def _mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+def _hz(mel):
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+def _filterbank(sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """삼각 멜 필터뱅크 (NUM_FILTERS x NFFT/2+1)"""
+    mel_points = np.linspace(_mel(0.0), _mel(sample_rate / 2.0), NUM_FILTERS + 2)
+    bins = np.floor((NFFT + 1) * _hz(mel_points) / sample_rate).astype(int)
+    bank = np.zeros((NUM_FILTERS, NFFT // 2 + 1))
+    for i in range(1, NUM_FILTERS + 1):
+        left, center, right = bins[i - 1], bins[i], bins[i + 1]
+        for k in range(left, center):
+            bank[i - 1, k] = (k - left) / max(1, center - left)
+        for k in range(center, right):
+            bank[i - 1, k] = (right - k) / max(1, right - center)
+    return bank
+
+def _dct_matrix() -> np.ndarray:
+    """DCT-II 행렬 (NUM_CEPS x NUM_FILTERS, orthonormal)"""
+    n = np.arange(NUM_FILTERS)
+    k = np.arange(NUM_CEPS)[:, None]
+    matrix = np.cos(np.pi * k * (2 * n + 1) / (2 * NUM_FILTERS)) * np.sqrt(2.0 / NUM_FILTERS)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+_FILTERBANK = _filterbank()
+_DCT = _dct_matrix()
+_WINDOW = np.hamming(FRAME_LENGTH)
+
+def trim_silence(samples: np.ndarray, floor_db: float = 35.0) -> np.ndarray:
+    """앞뒤 무음 제거 (가장 큰 프레임보다 floor_db 이상 작은 구간)"""
+    if len(samples) < FRAME_LENGTH:
+        return samples
+    count = 1 + (len(samples) - FRAME_LENGTH) // FRAME_STEP
+    idx = np.arange(FRAME_LENGTH)[None, :] + FRAME_STEP * np.arange(count)[:, None]
+    energy = 10 * np.log10(np.mean(samples[idx] ** 2, axis=1) + 1e-10)
+    voiced = np.nonzero(energy > energy.max() - floor_db)[0]
+    if len(voiced) == 0:
+        return samples
+    return samples[voiced[0] * FRAME_STEP: voiced[-1] * FRAME_STEP + FRAME_LENGTH]
+
+def mfcc(samples: np.ndarray) -> np.ndarray:
+    """16 kHz float 신호 -> MFCC (프레임 수 x NUM_CEPS-1, 켑스트럼 평균 정규화)"""
+    signal = np.append(samples[0], samples[1:] - 0.97 * samples[:-1])  # 프리엠퍼시스
+    if len(signal) < FRAME_LENGTH:
+        signal = np.pad(signal, (0, FRAME_LENGTH - len(signal)))
+    count = 1 + (len(signal) - FRAME_LENGTH) // FRAME_STEP
+    idx = np.arange(FRAME_LENGTH)[None, :] + FRAME_STEP * np.arange(count)[:, None]
+    frames = signal[idx] * _WINDOW
+    power = np.abs(np.fft.rfft(frames, NFFT)) ** 2 / NFFT
+    energies = np.log(power @ _FILTERBANK.T + 1e-10)
+    ceps = energies @ _DCT.T
+    ceps = ceps[:, 1:]  # c0(음량)은 제외
+    return ceps - ceps.mean(axis=0)
+
+def dtw_distance(a: np.ndarray, b: np.ndarray, band: float = 0.4) -> float:
+    """두 MFCC 시퀀스의 DTW 거리 (정합 경로 길이로 정규화, band: Sakoe-Chiba 폭 비율)"""
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return float('inf')
+    if max(n, m) > 2.5 * min(n, m):
+        return float('inf')  # 길이 차이가 너무 크면 다른 말
+    cost = np.sqrt(((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2))
+    width = max(int(band * max(n, m)), abs(n - m) + 1)
+
+    acc = np.full((n + 1, m + 1), np.inf)
+    acc[0, 0] = 0.0
+    for i in range(1, n + 1):
+        center = int(round(i * m / n))
+        lo, hi = max(1, center - width), min(m, center + width)
+        prev = acc[i - 1]
+        row = acc[i]
+        for j in range(lo, hi + 1):
+            best = prev[j - 1]
+            if prev[j] < best:
+                best = prev[j]
+            if row[j - 1] < best:
+                best = row[j - 1]
+            row[j] = cost[i - 1, j - 1] + best
+    return float(acc[n, m] / (n + m))
+
+def to_float(raw: bytes, sample_width: int = 2) -> np.ndarray:
+    """16비트 PCM 바이트 -> -1.0 ~ 1.0 float 배열"""
+    if sample_width != 2:
+        raise ValueError("16비트 PCM만 지원합니다")
+    return np.frombuffer(raw, dtype='<i2').astype(np.float64) / 32768.0
+
+def read_wav(path) -> np.ndarray:
+    """WAV 파일을 16 kHz 모노 float 배열로 읽기"""
+    with wave.open(str(path), 'rb') as f:
+        channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+        samples = to_float(f.readframes(f.getnframes()), width)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE:
+        positions = np.arange(0, len(samples), rate / SAMPLE_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return samples
+
+def write_wav(path, raw: bytes, sample_rate: int = SAMPLE_RATE) -> None:
+    """16비트 모노 PCM을 WAV로 저장"""
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(raw)
+
+class KeywordSpotter:
+    """템플릿 DTW 기반 고정 명령어 인식기
+
+    threshold: 템플릿이 하나뿐인 명령어의 최대 허용 거리
+    (템플릿이 여러 개면 템플릿끼리의 거리로 명령어별 허용 거리를 자동 설정)
+    margin: 가장 가까운 명령어가 두 번째 명령어보다 이 비율 이상 가까워야 인정
+    """
+    def __init__(self, template_dir=KEYWORD_DIR, threshold: float = 6.0,
+                 margin: float = 0.85, slack: float = 1.4):
+        self.template_dir = Path(template_dir)
+        self.threshold = threshold
+        self.margin = margin
+        self.slack = slack
+        self.templates: Dict[str, List[np.ndarray]] = {}
+        self.thresholds: Dict[str, float] = {}
+        self.stats = {'spotted': 0, 'rejected': 0}
+        self.load_templates()
+
+    def load_templates(self) -> int:
+        """template_dir/<명령어>/*.wav 읽기 (읽은 템플릿 수 반환)"""
+        self.templates = {}
+        self.thresholds = {}
+        if not self.template_dir.is_dir():
+            log.info("명령어 템플릿이 없습니다 (모든 발화를 음성 인식기로 전달)", dir=self.template_dir)
+            return 0
+        for keyword_dir in sorted(self.template_dir.iterdir()):
+            if not keyword_dir.is_dir():
+                continue
+            features = []
+            for path in sorted(keyword_dir.glob("*.wav")):
+                try:
+                    features.append(mfcc(trim_silence(read_wav(path))))
+                except (OSError, EOFError, ValueError, wave.Error) as e:
+                    log.warning("템플릿 읽기 실패", file=path.name, error=e)
+            if features:
+                self.templates[keyword_dir.name] = features
+                self.thresholds[keyword_dir.name] = self._calibrate(features)
+        total = sum(len(v) for v in self.templates.values())
+        log.info("명령어 템플릿 로드", keywords=",".join(self.templates), templates=total)
+        return total
+
+    def _calibrate(self, features: List[np.ndarray]) -> float:
+        """같은 명령어 템플릿끼리의 최대 거리 x slack"""
+        if len(features) < 2:
+            return self.threshold
+        distances = [dtw_distance(a, b) for i, a in enumerate(features) for b in features[i + 1:]]
+        distances = [d for d in distances if np.isfinite(d)]
+        if not distances:
+            return self.threshold
+        return max(distances) * self.slack
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.templates)
+
+    def enroll(self, keyword: str, wav_path) -> Path:
+        """WAV 파일을 명령어 템플릿으로 복사하고 다시 로드"""
+        target_dir = self.template_dir / keyword
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / f"{int(time.time() * 1000)}.wav"
+        shutil.copyfile(wav_path, target)
+        self.load_templates()
+        return target
+
+    def score(self, samples: np.ndarray) -> Dict[str, float]:
+        """명령어별 최소 DTW 거리"""
+        features = mfcc(trim_silence(samples))
+        return {keyword: min(dtw_distance(features, t) for t in templates)
+                for keyword, templates in self.templates.items()}
+
+    def spot(self, samples: np.ndarray) -> Tuple[Optional[str], float]:
+        """16 kHz float 신호에서 명령어 인식 -> (명령어 또는 None, 최소 거리)"""
+        if not self.enabled or len(samples) == 0:
+            return None, float('inf')
+        scores = self.score(samples)
+        ranked = sorted(scores.items(), key=lambda item: item[1])
+        keyword, best = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else float('inf')
+        if best <= self.thresholds[keyword] and best <= second * self.margin:
+            self.stats['spotted'] += 1
+            return keyword, best
+        self.stats['rejected'] += 1
+        return None, best
+
+    def spot_audio(self, audio) -> Tuple[Optional[str], float]:
+        """speech_recognition.AudioData에서 명령어 인식"""
+        raw = audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+        return self.spot(to_float(raw))
+
+    def spot_wav(self, path) -> Tuple[Optional[str], float]:
+        """WAV 파일에서 명령어 인식"""
+        return self.spot(read_wav(path))
+
+_spotter = None
+
+def get_keyword_spotter() -> KeywordSpotter:
+    """전역 명령어 인식기 (처음 사용할 때 템플릿 로드)"""
+    global _spotter
+    if _spotter is None:
+        _spotter = KeywordSpotter()
+    return _spotter
+
+def _record(keyword: str, count: int) -> None:
+    from MicrophoneStream import microphone_stream
+    if not microphone_stream.start():
+        return
+    microphone_stream.wait_ready(timeout=3)
+    target_dir = KEYWORD_DIR / keyword
+    target_dir.mkdir(parents=True, exist_ok=True)
+    saved = 0
+    while saved < count:
+        print(f"[KWS] '{keyword}'라고 말하세요 ({saved + 1}/{count})")
+        utterance = microphone_stream.listen(timeout=10)
+        if utterance is None:
+            print("[KWS] 음성이 감지되지 않았습니다. 다시 말하세요.")
+            continue
+        raw = utterance.to_audio_data().get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+        path = target_dir / f"{int(time.time() * 1000)}.wav"
+        write_wav(path, raw)
+        print(f"[KWS] 저장: {path}")
+        saved += 1
+    microphone_stream.stop()
+
+def _test(paths: List[str]) -> None:
+    spotter = KeywordSpotter()
+    for path in paths:
+        started = time.perf_counter()
+        keyword, distance = spotter.spot_wav(path)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"[KWS] {path}: {keyword or '알 수 없음'} (거리 {distance:.2f}, {elapsed:.0f} ms)")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "enroll":
+        spotter = KeywordSpotter()
+        for wav_path in args[2:]:
+            print(f"[KWS] 등록: {spotter.enroll(args[1], wav_path)}")
+    elif len(args) >= 2 and args[0] == "record":
+        _record(args[1], int(args[2]) if len(args) > 2 else 3)
+    elif len(args) >= 2 and args[0] == "test":
+        _test(args[1:])
+    else:
+        print(__doc__)
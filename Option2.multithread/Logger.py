@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 구조화 로깅 모듈
+로그 레코드를 큐에 넣기만 하고, 포맷팅/콘솔 출력은 백그라운드 스레드가 처리
+(콘솔 출력이 영상 처리 스레드를 멈추지 않도록)
+"""
+
+import os
+import sys
+import time
+import queue
+import atexit
+import threading
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+class LogLevel(IntEnum):
+    """로그 레벨"""
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+def _level_from_env(default: LogLevel) -> LogLevel:
+    """환경변수 EXERCISE_LOG_LEVEL (DEBUG/INFO/WARNING/ERROR)로 레벨 지정"""
+    name = os.environ.get("EXERCISE_LOG_LEVEL", "").upper()
+    return LogLevel.__members__.get(name, default)
+
+class AsyncLogWriter:
+    """로그 레코드를 모아서 출력하는 백그라운드 작성기
+
+    - 같은 태그+메시지는 interval 초마다 최대 burst 개까지만 출력
+    - 생략된 개수는 다음 구간에 한 줄로 요약 출력
+    - stop() 이후에 들어온 레코드는 호출 스레드에서 바로 출력
+    """
+    def __init__(self, stream=None, burst: int = 5, interval: float = 1.0, batch_size: int = 100):
+        self.stream = stream if stream is not None else sys.stdout
+        self.burst = burst
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._queue = queue.SimpleQueue()
+        self._rate_windows = {}  # (tag, message) -> [구간 시작 시간, 출력 수, 생략 수]
+        self._last_sweep = time.monotonic()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 작성기 스레드와 stop() 이후 직접 출력 사이의 보호
+        self._stopped = False
+
+        self.written_count = 0
+        self.suppressed_count = 0
+
+    def submit(self, record: tuple) -> None:
+        """레코드 추가 (호출 스레드에서는 큐 삽입만 수행)"""
+        if self._stopped:
+            # 작성기 스레드가 종료됨 (atexit 이후의 로그 등): 바로 출력
+            with self._write_lock:
+                self._write_lines(self._format(record))
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put(record)
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """지금까지 들어온 레코드 출력 완료까지 대기"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """남은 레코드를 출력하고 작성기 스레드 종료"""
+        if self._thread is None or self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name="AsyncLogWriter")
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            waiters = []
+            with self._write_lock:
+                lines = []
+                for item in batch:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        lines.extend(self._format(item))
+                lines.extend(self._sweep_rate_windows())
+                self._write_lines(lines)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write_lines(self, lines: list) -> None:
+        if not lines:
+            return
+        try:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+        except Exception:
+            pass
+
+    def _sweep_rate_windows(self) -> list:
+        """구간이 끝난 반복 제한 항목 정리 (interval마다, 생략된 개수가 있으면 요약 출력)"""
+        now = time.monotonic()
+        if now - self._last_sweep < self.interval:
+            return []
+        self._last_sweep = now
+        lines = []
+        for key, window in list(self._rate_windows.items()):
+            if now - window[0] >= self.interval:
+                if window[2]:
+                    lines.append(f"[{key[0]}] (이전 메시지 {window[2]}회 생략) {key[1]}\n")
+                del self._rate_windows[key]
+        return lines
+
+    def _format(self, record: tuple) -> list:
+        created, level, tag, message, fields = record
+        lines = []
+
+        # 같은 메시지 반복 제한
+        key = (tag, message)
+        window = self._rate_windows.get(key)
+        if window is None or created - window[0] >= self.interval:
+            if window is not None and window[2]:
+                lines.append(f"[{tag}] (이전 메시지 {window[2]}회 생략) {message}\n")
+            window = [created, 0, 0]
+            self._rate_windows[key] = window
+        if window[1] >= self.burst:
+            window[2] += 1
+            self.suppressed_count += 1
+            return lines
+        window[1] += 1
+
+        text = f"[{tag}] {message}"
+        if level >= LogLevel.WARNING:
+            text = f"[{tag}] {level.name}: {message}"
+        if fields:
+            text += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        lines.append(text + "\n")
+        self.written_count += 1
+        return lines
+
+class FileLogSink:
+    """파일 로그 작성기 (파일을 열어둔 채로 백그라운드 스레드에서 모아서 기록)
+
+    - 호출 스레드에서는 큐 삽입만 수행 (줄마다 파일 열기/flush 없음)
+    - 파일이 max_bytes를 넘으면 path.1, path.2 ... 로 회전 (backup_count개 보관)
+    """
+    def __init__(self, path, max_bytes: int = 1024 * 1024, backup_count: int = 3,
+                 batch_size: int = 200, encoding: str = "utf-8"):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.encoding = encoding
+
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stopped = False
+
+        self.written_count = 0
+        self.rotation_count = 0
+
+    def write(self, tag: str, message: str) -> None:
+        """로그 한 줄 추가 (시간 포맷팅/파일 기록은 작성기 스레드에서 수행)"""
+        if self._stopped:
+            return
+        if self._thread is None:
+            self._start()
+        self._queue.put((time.time(), tag, message))
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """지금까지 들어온 로그가 파일에 기록될 때까지 대기"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """남은 로그를 기록하고 파일을 닫음"""
+        if self._thread is None or self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name="FileLogSink")
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            stop = False
+            waiters = []
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    created, tag, message = item
+                    timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+                    lines.append(f"[{timestamp}] [{tag}] {message}\n")
+
+            if lines:
+                self._write_lines(lines)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _write_lines(self, lines: list) -> None:
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding=self.encoding)
+            self._file.write("".join(lines))
+            self._file.flush()
+            self.written_count += len(lines)
+            if self.max_bytes and self._file.tell() >= self.max_bytes:
+                self._rotate()
+        except OSError:
+            pass
+
+    def _rotate(self) -> None:
+        """path -> path.1 -> path.2 ... (가장 오래된 파일 삭제)"""
+        self._file.close()
+        self._file = None
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotation_count += 1
+
+class Logger:
+    """태그별 로거 (레벨 미달 레코드는 큐에 넣지도 않음)"""
+    def __init__(self, tag: str, writer: AsyncLogWriter, level: LogLevel = LogLevel.INFO):
+        self.tag = tag
+        self.writer = writer
+        self.level = level
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        return level >= self.level
+
+    def log(self, level: LogLevel, message: str, **fields: Any) -> None:
+        if level < self.level:
+            return
+        self.writer.submit((time.monotonic(), level, self.tag, message, fields))
+
+    def debug(self, message: str, **fields: Any) -> None:
+        self.log(LogLevel.DEBUG, message, **fields)
+
+    def info(self, message: str, **fields: Any) -> None:
+        self.log(LogLevel.INFO, message, **fields)
+
+    def warning(self, message: str, **fields: Any) -> None:
+        self.log(LogLevel.WARNING, message, **fields)
+
+    def error(self, message: str, **fields: Any) -> None:
+        self.log(LogLevel.ERROR, message, **fields)
+
+# 전역 작성기 및 로거 목록
+log_writer = AsyncLogWriter()
+_default_level = _level_from_env(LogLevel.INFO)
+_loggers: Dict[str, Logger] = {}
+_loggers_lock = threading.Lock()
+_file_sinks: Dict[str, FileLogSink] = {}
+
+def get_logger(tag: str, level: Optional[LogLevel] = None) -> Logger:
+    """태그별 로거 반환 (예: get_logger("VIDEO"))"""
+    with _loggers_lock:
+        logger = _loggers.get(tag)
+        if logger is None:
+            logger = Logger(tag, log_writer, _default_level)
+            _loggers[tag] = logger
+        if level is not None:
+            logger.level = level
+        return logger
+
+def get_file_sink(path, **kwargs: Any) -> FileLogSink:
+    """경로별 파일 로그 작성기 반환 (같은 파일은 작성기 하나를 공유)"""
+    key = os.path.abspath(str(path))
+    with _loggers_lock:
+        sink = _file_sinks.get(key)
+        if sink is None or sink._stopped:
+            sink = FileLogSink(path, **kwargs)
+            _file_sinks[key] = sink
+        return sink
+
+def set_log_level(level: LogLevel) -> None:
+    """모든 로거의 레벨 변경"""
+    global _default_level
+    with _loggers_lock:
+        _default_level = level
+        for logger in _loggers.values():
+            logger.level = level
+
+def flush_logging(timeout: float = 2.0) -> None:
+    """대기 중인 로그 출력 완료까지 대기"""
+    log_writer.flush(timeout)
+    for sink in list(_file_sinks.values()):
+        sink.flush(timeout)
+
+def shutdown_logging(timeout: float = 2.0) -> None:
+    """남은 로그를 출력하고 작성기 종료 (파일 로그도 기록 후 닫음)"""
+    log_writer.stop(timeout)
+    for sink in list(_file_sinks.values()):
+        sink.close(timeout)
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상시 마이크 입력 스트림 모듈
+마이크를 한 번만 열고 백그라운드 스레드에서 계속 읽어 링 버퍼에 보관
+- 소음 보정은 시작할 때 한 번만 수행, 이후에는 조용한 구간의 RMS로 임계값을 계속 조정
+- 말소리가 시작되기 직전 구간(프리롤)을 함께 잘라 명령어 앞부분이 잘리지 않도록 함
+- 프레임 단위 VAD로 말소리 구간만 인식에 전달 (잡음/무음 구간은 걸러냄)
+명령 인식 지연 = 말하는 시간 (장치 열기 + 소음 보정 시간 없음)
+"""
+
+import math
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Optional
+from Logger import get_logger
+from VoiceActivity import VoiceActivityDetector
+
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
+
+try:
+    import audioop  # Python 3.13부터 제거됨
+except ImportError:
+    audioop = None
+
+log = get_logger("MIC")
+
+MIN_ENERGY_THRESHOLD = 50.0  # 아주 조용한 환경에서 작은 잡음까지 말소리로 판정하지 않도록
+
+def frame_rms(data: bytes, sample_width: int = 2) -> float:
+    """16비트 PCM 프레임의 RMS"""
+    if audioop is not None:
+        return audioop.rms(data, sample_width)
+    samples = array('h', data)
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+class Utterance:
+    """잘라낸 발화 구간"""
+    __slots__ = ('data', 'sample_rate', 'sample_width', 'started_at', 'ended_at')
+
+    def __init__(self, data: bytes, sample_rate: int, sample_width: int, started_at: float, ended_at: float):
+        self.data = data
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.started_at = started_at
+        self.ended_at = ended_at
+
+    @property
+    def duration(self) -> float:
+        return len(self.data) / float(self.sample_rate * self.sample_width)
+
+    def to_audio_data(self):
+        """speech_recognition.AudioData로 변환 (인식기에 그대로 전달 가능)"""
+        return sr.AudioData(self.data, self.sample_rate, self.sample_width)
+
+class MicrophoneStream:
+    """상시 열려 있는 마이크 입력 + 에너지 기반 발화 구간 분리
+
+    calibration: 시작 시 소음 측정 시간(초)
+    energy_ratio: 소음 RMS 대비 말소리 판정 배율
+    pre_roll: 발화 시작 전에 함께 포함할 시간(초)
+    pause: 이 시간(초) 동안 조용하면 발화 종료
+    hangover: 발화 끝에 남겨 둘 무음 길이(초)
+    min_phrase: 말소리 프레임이 이 시간(초)보다 짧은 구간은 인식에 전달하지 않음
+    max_read_errors: 연속으로 이만큼 읽기에 실패하면 장치 오류로 보고 스트림 종료
+    buffer_seconds: 링 버퍼 길이(초)
+    """
+    def __init__(self, calibration: float = 1.0, energy_ratio: float = 1.5,
+                 pre_roll: float = 0.3, pause: float = 0.6, hangover: float = 0.1, min_phrase: float = 0.2,
+                 max_phrase: float = 5.0, buffer_seconds: float = 10.0, damping: float = 0.15,
+                 max_read_errors: int = 20):
+        self.calibration = calibration
+        self.energy_ratio = energy_ratio
+        self.pre_roll = pre_roll
+        self.pause = pause
+        self.hangover = hangover
+        self.min_phrase = min_phrase
+        self.max_phrase = max_phrase
+        self.buffer_seconds = buffer_seconds
+        self.damping = damping
+        self.max_read_errors = max_read_errors
+        self.device_error = None  # 장치 오류로 종료된 경우 마지막 오류
+
+        self.energy_threshold = 300.0
+        self.sample_rate = 16000
+        self.sample_width = 2
+        self.chunk = 1024
+
+        self.vad = None
+        self._mic = None
+        self._source = None
+        self._thread = None
+        self._running = False
+        self._closed = False  # close() 이후에는 다시 열지 않음 (프로그램 종료)
+        self._ready = threading.Event()
+        self._utterances = queue.Queue(maxsize=16)
+        self.ring = deque()  # 최근 buffer_seconds초의 (시각, 프레임)
+
+        # forwarded: 인식에 전달한 구간, gated: 너무 짧아 걸러낸 구간,
+        # noise_frames: 에너지는 높지만 VAD가 말소리가 아니라고 판정한 프레임
+        self.stats = {'frames': 0, 'forwarded': 0, 'gated': 0, 'noise_frames': 0, 'dropped': 0}
+        self.cpu_seconds = 0.0  # 캡처 스레드가 지금까지 사용한 CPU 시간 (모든 캡처 스레드 합계)
+
+    @property
+    def frame_seconds(self) -> float:
+        return self.chunk / float(self.sample_rate)
+
+    def start(self) -> bool:
+        """마이크를 열고 캡처 스레드 시작 (이미 실행 중이면 그대로 사용)"""
+        if self._running:
+            return True
+        if self._closed:
+            return False
+        if sr is None:
+            log.error("speech_recognition이 설치되지 않았습니다")
+            return False
+        if self._mic is not None:
+            self.stop()  # 장치 오류로 멈춘 이전 스트림 정리
+        try:
+            self._mic = sr.Microphone()
+            self._source = self._mic.__enter__()
+        except Exception as e:
+            log.error("마이크 열기 실패", error=e)
+            self._mic = self._source = None
+            return False
+
+        self.sample_rate = self._source.SAMPLE_RATE
+        self.sample_width = self._source.SAMPLE_WIDTH
+        self.chunk = self._source.CHUNK
+        self.ring = deque(maxlen=max(1, int(self.buffer_seconds / self.frame_seconds)))
+        self.vad = VoiceActivityDetector(self.sample_rate)
+
+        self.device_error = None
+        self._running = True
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True, name="MicrophoneStream")
+        self._thread.start()
+        log.info("마이크 스트림 시작", rate=self.sample_rate, chunk=self.chunk)
+        return True
+
+    def stop(self) -> None:
+        """캡처 스레드 종료 후 마이크 닫기"""
+        self._running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+        if self._mic is not None:
+            try:
+                self._mic.__exit__(None, None, None)
+            except Exception:
+                pass
+        self._mic = self._source = None
+        log.info("마이크 스트림 종료", **self.stats)
+
+    def close(self) -> None:
+        """프로그램 종료: 스트림을 멈추고, 대기 중인 listen()은 바로 None을 반환"""
+        self._closed = True
+        self.stop()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """소음 보정 완료까지 대기"""
+        return self._ready.wait(timeout)
+
+    def listen(self, timeout: float = 5.0, max_age: float = 1.0) -> Optional[Utterance]:
+        """다음 발화 구간 반환 (timeout초 안에 말소리가 없으면 None)
+
+        호출 전에 끝난 지 max_age초가 넘은 발화는 버림 (대기하지 않던 동안의 소리)
+        """
+        if not self._running and not self.start():
+            return None
+        called_at = time.monotonic()
+        deadline = called_at + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                utterance = self._utterances.get(timeout=min(remaining, 0.2))
+            except queue.Empty:
+                if not self._running:
+                    return None  # 스트림 종료
+                continue
+            if utterance.ended_at >= called_at - max_age:
+                return utterance
+
+    def _read_frame(self) -> bytes:
+        return self._source.stream.read(self._source.CHUNK)
+
+    def _capture_loop(self) -> None:
+        cpu_base = self.cpu_seconds - time.thread_time()
+        try:
+            self._calibrate()
+        except Exception as e:
+            log.error("소음 보정 실패", error=e)
+        self._ready.set()
+
+        pre_roll_frames = max(1, int(self.pre_roll / self.frame_seconds))
+        pause_frames = max(1, int(self.pause / self.frame_seconds))
+        hangover_frames = int(self.hangover / self.frame_seconds)
+        max_frames = max(1, int(self.max_phrase / self.frame_seconds))
+        min_frames = max(1, int(self.min_phrase / self.frame_seconds))
+
+        history = deque(maxlen=pre_roll_frames)  # 발화 시작 전 프리롤
+        phrase = []
+        silent_frames = 0
+        speech_frames = 0
+        phrase_started = 0.0
+        read_errors = 0
+
+        while self._running:
+            try:
+                frame = self._read_frame()
+                read_errors = 0
+                self.cpu_seconds = cpu_base + time.thread_time()
+            except Exception as e:
+                read_errors += 1
+                log.error("마이크 읽기 오류", error=e, count=read_errors)
+                if read_errors >= self.max_read_errors:
+                    # 장치가 빠졌거나 멈춤: 스트림 종료 (다음 start()에서 다시 열기)
+                    self.device_error = e
+                    self._running = False
+                    break
+                time.sleep(0.1)
+                continue
+
+            now = time.monotonic()
+            self.ring.append((now, frame))
+            self.stats['frames'] += 1
+            energy = frame_rms(frame, self.sample_width)
+            speech = self.vad.is_speech(frame, energy, self.energy_threshold)
+            if not speech and energy > self.energy_threshold:
+                self.stats['noise_frames'] += 1
+
+            if not phrase:
+                if speech:
+                    # 발화 시작: 프리롤 포함
+                    phrase = list(history) + [frame]
+                    phrase_started = now - len(history) * self.frame_seconds
+                    speech_frames = 1
+                    silent_frames = 0
+                    history.clear()
+                else:
+                    # 말소리가 아닌 구간: 임계값을 주변 소음에 맞춰 계속 조정
+                    target = energy * self.energy_ratio
+                    self.energy_threshold += (target - self.energy_threshold) * self.damping
+                    self.energy_threshold = max(self.energy_threshold, MIN_ENERGY_THRESHOLD)
+                    history.append(frame)
+                continue
+
+            phrase.append(frame)
+            if speech:
+                speech_frames += 1
+                silent_frames = 0
+            else:
+                silent_frames += 1
+
+            if silent_frames >= pause_frames or len(phrase) >= max_frames:
+                # 끝부분의 무음은 hangover만 남기고 잘라냄
+                trim = max(0, silent_frames - hangover_frames)
+                frames = phrase[:len(phrase) - trim] if trim else phrase
+                if speech_frames >= min_frames:
+                    self._emit(Utterance(b"".join(frames), self.sample_rate, self.sample_width,
+                                         phrase_started, now - trim * self.frame_seconds))
+                else:
+                    self.stats['gated'] += 1
+                phrase = []
+
+    def _calibrate(self) -> None:
+        """시작할 때 한 번만 주변 소음 측정"""
+        frames = max(1, int(self.calibration / self.frame_seconds))
+        total = 0.0
+        for _ in range(frames):
+            frame = self._read_frame()
+            self.ring.append((time.monotonic(), frame))
+            total += frame_rms(frame, self.sample_width)
+        ambient = total / frames
+        self.energy_threshold = max(ambient * self.energy_ratio, MIN_ENERGY_THRESHOLD)
+        log.info("소음 보정 완료", ambient=round(ambient, 1), threshold=round(self.energy_threshold, 1))
+
+    def _emit(self, utterance: Utterance) -> None:
+        try:
+            self._utterances.put_nowait(utterance)
+        except queue.Full:
+            # 아무도 가져가지 않으면 가장 오래된 발화를 버림
+            try:
+                self._utterances.get_nowait()
+            except queue.Empty:
+                pass
+            self._utterances.put_nowait(utterance)
+            self.stats['dropped'] += 1
+        self.stats['forwarded'] += 1
+        log.debug("발화 구간 감지", seconds=round(utterance.duration, 2))
+
+# 전역 마이크 스트림 (처음 listen() 할 때 시작)
+microphone_stream = MicrophoneStream()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio 기반 전체 흐름 조정 모듈
+음성 인식, 운동 모드(영상 처리), 오디오, 콘솔/하드웨어 입출력을 하나의 이벤트 루프에서 조정
+블로킹 라이브러리(speech_recognition, MediaPipe, pygame 등)는 용도별 크기 제한 실행기에서 실행
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from SpeechProcess import speech_process
+from MicrophoneStream import microphone_stream
+from ExerciseMode import run_exercise_mode, safe_arduino_command
+import SpeakerCommunication as ArduinoCommunication  # 아두이노 대신 스피커 사용
+from AudioExecutor import audio_executor
+from AudioScheduler import AudioPriority
+from ThreadManager import thread_manager
+from Logger import shutdown_logging
+
+EXIT_PROMPT = "[MAIN] 프로그램을 종료하시겠습니까? (y/n): "
+
+class ExerciseOrchestrator:
+    """이벤트 루프 하나로 모든 하위 시스템을 조정하는 클래스
+
+    실행기 구분 (각각 워커 수 제한):
+    - speech: 음성 인식 결과 대기 (인식 자체는 SpeechProcess 프로세스에서 실행)
+    - exercise: 운동 모드 (영상 처리 스레드 관리, MediaPipe)
+    - io: 스피커 초기화 등 기타 블로킹 입출력
+    오디오 재생은 순서 보장을 위해 AudioExecutor(단일 워커)를 그대로 사용
+    """
+    def __init__(self, speech_workers=1, exercise_workers=1, io_workers=2):
+        self._executors = {
+            'speech': ThreadPoolExecutor(max_workers=speech_workers, thread_name_prefix="Speech"),
+            'exercise': ThreadPoolExecutor(max_workers=exercise_workers, thread_name_prefix="Exercise"),
+            'io': ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="IO"),
+        }
+        # 아직 끝나지 않은 음성 인식 / 콘솔 입력 (취소할 수 없으므로 다음 호출에서 재사용)
+        self._voice_future = None
+        self._console_future = None
+
+    async def run_blocking(self, lane, func, *args, **kwargs):
+        """블로킹 함수를 지정한 실행기에서 실행하고 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executors[lane], functools.partial(func, *args, **kwargs))
+
+    def speaker_command(self, func, *args):
+        """스피커 명령을 오디오 실행기에 추가 (await 하면 재생 완료까지 대기)"""
+        return asyncio.wrap_future(safe_arduino_command(func, *args))
+
+    def play_clips(self, clip_ids, priority=AudioPriority.CUE):
+        """안내 음성 클립을 우선순위 스케줄러에 추가 (여러 개면 끊김 없이 이어서 재생, await 하면 재생 완료까지 대기)"""
+        return asyncio.wrap_future(ArduinoCommunication.schedule_mp3(ArduinoCommunication.speaker_controller, clip_ids, priority))
+
+    def next_voice_command(self):
+        """음성 명령 인식 (진행 중인 인식이 있으면 그 결과를 공유)"""
+        if self._voice_future is None or self._voice_future.done():
+            loop = asyncio.get_running_loop()
+            self._voice_future = loop.run_in_executor(self._executors['speech'], speech_process.listen_command)
+        return self._voice_future
+
+    def next_console_line(self, prompt):
+        """콘솔 입력 (진행 중인 input()이 있으면 그 결과를 공유)
+
+        input()은 중단할 수 없으므로 실행기 대신 데몬 스레드에서 실행
+        (음성으로 종료했을 때 프로그램 종료가 Enter 입력을 기다리지 않도록)
+        """
+        if self._console_future is None or self._console_future.done():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+
+            def _resolve(value, error):
+                if future.done():
+                    return
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+
+            def _read_line():
+                value, error = None, None
+                try:
+                    value = input(prompt)
+                except Exception as e:
+                    error = e
+                try:
+                    loop.call_soon_threadsafe(_resolve, value, error)
+                except RuntimeError:
+                    pass  # 이벤트 루프가 이미 종료됨
+
+            threading.Thread(target=_read_line, daemon=True, name="ConsoleInput").start()
+            self._console_future = future
+        return self._console_future
+
+    async def start_speaker(self):
+        """1단계: 스피커 초기화 및 시작 안내"""
+        print("[MAIN] 1단계: 내장 스피커를 초기화합니다...")
+        if await self.run_blocking('io', ArduinoCommunication.initialize_speaker):
+            print("[MAIN] 스피커 초기화 성공")
+            self.speaker_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'green')  # 연결 성공 안내
+            await asyncio.sleep(1)  # 1초 대기 (이벤트 루프는 계속 동작)
+            self.speaker_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'off')  # 완료 안내
+
+            # 프로그램 정상 실행 확인 (안내 음성이 끝난 뒤 음성 인식 시작)
+            print("[MAIN] 프로그램이 정상적으로 실행되었습니다.")
+            await self.play_clips("0001")
+            return True
+
+        print("[MAIN] 스피커 초기화 실패")
+        print("[MAIN] 스피커 없이 프로그램을 계속 실행합니다.")
+        return False
+
+    async def run_exercise(self):
+        """운동 시작 안내와 운동 모드 초기화를 동시에 진행"""
+        print("[MAIN] 음성 안내를 시작합니다...")
+        # 0001 -> 0002(오늘도 재밌게 운동해 볼까요?) -> 0003(좋아요함께즐겁게운동해봐요) 끊김 없이 이어서 재생
+        intro = [
+            self.play_clips(["0001", "0002", "0003"]),
+            self.speaker_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'green'),
+        ]
+
+        # 안내 음성이 나오는 동안 카메라/MediaPipe 초기화 진행
+        print("[MAIN] 운동 모드를 시작합니다...")
+        exercise_success = await self.run_blocking('exercise', run_exercise_mode)
+        await asyncio.gather(*intro, return_exceptions=True)
+        return exercise_success
+
+    async def ask_exit(self):
+        """운동 완료 후 선택 (콘솔 입력과 음성 명령 중 먼저 들어온 것을 사용)
+
+        반환값: 'exit' (종료), 'exercise' (바로 다시 운동), 'wait' (명령 대기로 복귀)
+        """
+        console = self.next_console_line(EXIT_PROMPT)
+        while True:
+            voice = self.next_voice_command()
+            await asyncio.wait({console, voice}, return_when=asyncio.FIRST_COMPLETED)
+
+            if console.done():
+                try:
+                    choice = console.result().strip().lower()
+                except (EOFError, OSError):
+                    choice = 'y'
+                return 'exit' if choice == 'y' else 'wait'
+
+            command = voice.result()
+            if command == "종료":
+                print("[MAIN] 종료 명령을 받았습니다!")
+                return 'exit'
+            if command == "운동하자":
+                print("[MAIN] 운동하자 명령을 받았습니다!")
+                return 'exercise'
+
+    async def run(self):
+        """프로그램 메인 흐름"""
+        print("[MAIN] 프로그램을 시작합니다...")
+        # 음성 인식 프로세스는 스피커 초기화와 동시에 시작 (마이크 열기 + 소음 보정)
+        if speech_process.start():
+            print("[MAIN] 음성 인식 프로세스를 시작했습니다.")
+        await self.start_speaker()
+
+        # 2단계: 스피커 연결 상태 재확인
+        print("[MAIN] 2단계: 스피커 연결 상태를 재확인합니다...")
+        if ArduinoCommunication.speaker_controller is not None:
+            print(f"[MAIN] 스피커 연결 상태: {ArduinoCommunication.speaker_controller.is_connected}")
+        else:
+            print("[MAIN] 스피커 컨트롤러가 None입니다.")
+
+        print("[MAIN] 음성 명령을 기다리고 있습니다... ('운동하자' 또는 '종료')")
+        pending_command = None
+        while True:
+            command = pending_command or await self.next_voice_command()
+            pending_command = None
+
+            if command == "운동하자":
+                print("[MAIN] 운동하자 명령을 받았습니다!")
+                exercise_success = await self.run_exercise()
+
+                if exercise_success:
+                    print("[MAIN] 운동이 완료되었습니다!")
+                    self.play_clips(["0008", "0009"])  # 오늘은여기까지또만나요 -> 오늘하루더맑아질거예요요
+                    self.speaker_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'green')
+
+                    # 안내 음성이 나오는 동안 사용자 선택 대기
+                    decision = await self.ask_exit()
+                    if decision == 'exit':
+                        break
+                    self.speaker_command(ArduinoCommunication.control_led, ArduinoCommunication.speaker_controller, 'off')
+                    if decision == 'exercise':
+                        pending_command = "운동하자"
+                    continue
+                else:
+                    # 운동 모드 실패 (카메라나 영상 파일 문제)
+                    print("[MAIN] 운동 모드를 시작할 수 없습니다. 다시 시도해주세요.")
+                    await asyncio.sleep(2)  # 2초 대기 후 다시 명령 대기
+                    continue
+
+            elif command == "종료":
+                print("[MAIN] 종료 명령을 받았습니다!")
+                break
+            elif command is None:
+                # 음성 인식 실패 또는 타임아웃 - 다시 시도
+                continue
+            else:
+                print(f"[MAIN] 알 수 없는 명령: {command}")
+                print("[MAIN] '운동하자' 또는 '종료'라고 말해주세요.")
+                continue
+
+    def close(self):
+        """모든 하위 시스템 정리"""
+        print("[MAIN] 프로그램을 종료합니다...")
+
+        # 스레드 매니저 정리
+        try:
+            thread_manager.shutdown()
+            print("[MAIN] 스레드 정리 완료")
+        except Exception as e:
+            print(f"[MAIN] 스레드 정리 중 오류: {e}")
+
+        # 오디오 실행기 정리 (스피커 해제 전에 실행 중인 명령 마무리)
+        audio_executor.shutdown()
+
+        # 음성 인식 프로세스 종료 (CPU 사용 시간 보고)
+        # 마이크 스트림도 닫아 대기 중인 음성 인식이 바로 끝나도록 함
+        speech_process.stop()
+        microphone_stream.close()
+
+        # 블로킹 실행기 정리 (실행기 스레드는 종료 시 join되므로 시작 전인 작업은 취소)
+        # 콘솔 입력은 데몬 스레드에서 실행되므로 종료를 막지 않음
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # 스피커 정리
+        ArduinoCommunication.cleanup_speaker()
+        print("[MAIN] 프로그램 종료 완료")
+        shutdown_logging()
+
+def run_orchestrator():
+    """이벤트 루프를 만들고 프로그램 실행"""
+    orchestrator = ExerciseOrchestrator()
+    try:
+        asyncio.run(orchestrator.run())
+    except KeyboardInterrupt:
+        print("\n[MAIN] 프로그램이 중단되었습니다.")
+    except Exception as e:
+        print(f"[MAIN] 오류 발생: {e}")
+    finally:
+        orchestrator.close()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 인식 엔진 모듈
+인식 엔진을 같은 인터페이스로 교체할 수 있도록 분리
+- google: Google Web Speech API (네트워크 필요)
+- vosk: 오프라인 인식 (vosk 패키지와 한국어 모델 필요)
+- stub: 정해진 결과를 돌려주는 테스트용 엔진 (WAV 픽스처 / 대본)
+
+모든 호출은 호출별 지연 예산(초)을 받고, 소요 시간 정보가 담긴 RecognitionResult를 반환
+엔진 선택: 환경변수 EXERCISE_SPEECH_BACKEND (google/vosk/stub, 기본 google)
+google 인코딩: 환경변수 EXERCISE_GOOGLE_ENCODING (legacy/auto/flac/l16, 기본 legacy)
+
+사용법 (지연 시간 측정):
+    python RecognizerBackends.py bench stub fixtures/*.wav
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+import wave
+from abc import ABC, abstractmethod
+from array import array
+from io import BytesIO
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from Logger import get_logger
+
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
+
+try:
+    # speech_recognition 기본 API 키가 들어간 요청 주소 생성 (키를 이 저장소에 복사하지 않음)
+    from speech_recognition.recognizers.google import create_request_builder
+except ImportError:
+    create_request_builder = None
+
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
+try:
+    import numpy as np
+    import soundfile  # FLAC 인코딩 (libsndfile, 외부 프로세스 없음)
+except ImportError:
+    soundfile = None
+
+log = get_logger("ASR")
+
+SAMPLE_RATE = 16000
+DEFAULT_BUDGET = 3.0  # 인식 한 번에 기다리는 최대 시간(초)
+VOSK_MODEL_PATH = Path(__file__).parent / "models" / "vosk-model-small-ko-0.22"
+STUB_FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+@dataclass
+class RecognitionResult:
+    """인식 결과와 소요 시간 정보"""
+    text: Optional[str]
+    backend: str
+    elapsed_ms: float = 0.0
+    audio_seconds: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # 단계별 소요 시간(ms)
+
+    @property
+    def ok(self) -> bool:
+        return self.text is not None and not self.timed_out and self.error is None
+
+class RecognizerBackend(ABC):
+    """인식 엔진 공통 인터페이스
+
+    하위 클래스는 _recognize(audio, budget, timings)만 구현
+    (인식 결과 문자열 반환, 알아들을 수 없으면 None, 실패는 예외)
+    """
+    name = "base"
+
+    # 예산을 넘긴 호출은 결과를 기다리지 않고 반환 (아직 시작하지 않았으면 취소,
+    # 이미 실행 중이면 백그라운드에서 마무리되지만 결과와 소요 시간은 버림)
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Recognizer")
+
+    def recognize(self, audio, budget: Optional[float] = DEFAULT_BUDGET) -> RecognitionResult:
+        """speech_recognition.AudioData 인식 (budget초 안에 끝나지 않으면 timed_out)"""
+        result = RecognitionResult(None, self.name, audio_seconds=audio_duration(audio))
+        timings: Dict[str, float] = {}  # 호출별 (시간 초과된 호출이 나중에 결과에 쓰지 않도록)
+        started = time.perf_counter()
+        try:
+            if budget is None:
+                result.text = self._recognize(audio, budget, timings)
+            else:
+                future = self._executor.submit(self._recognize, audio, budget, timings)
+                try:
+                    result.text = future.result(timeout=budget)
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise
+            result.timings.update(timings)
+        except FutureTimeoutError:
+            result.timed_out = True
+        except Exception as e:
+            result.error = str(e) or e.__class__.__name__
+            result.timings.update(timings)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        log.debug("인식 완료", backend=self.name, elapsed_ms=result.elapsed_ms,
+                  timed_out=result.timed_out, **result.timings)
+        return result
+
+    @abstractmethod
+    def _recognize(self, audio, budget: Optional[float], timings: Dict[str, float]) -> Optional[str]:
+        """인식 결과 문자열 (알아들을 수 없으면 None, 실패는 예외)"""
+
+GOOGLE_ENDPOINT = "http://www.google.com/speech-api/v2/recognize"
+
+class GoogleBackend(RecognizerBackend):
+    """Google Web Speech API
+
+    speech_recognition의 recognize_google은 요청마다 외부 flac 프로그램을 실행해 인코딩하므로
+    요청 본문을 프로세스 안에서 직접 만들 수 있음 (아직 검증 중이라 선택 사항)
+    encoding: 'legacy' (기존 recognize_google 사용, 기본값),
+              'auto' (soundfile이 있으면 FLAC, 없으면 L16), 'flac', 'l16'
+              지정하지 않으면 환경변수 EXERCISE_GOOGLE_ENCODING, 그것도 없으면 'legacy'
+    timings: encode_ms (인코딩) / network_ms (요청~응답)
+    key: API 키 (없으면 환경변수 GOOGLE_SPEECH_API_KEY, 그것도 없으면 speech_recognition 기본 키)
+    """
+    name = "google"
+
+    def __init__(self, language: str = "ko-KR", encoding: Optional[str] = None, key: Optional[str] = None):
+        self.language = language
+        self.key = key or os.environ.get("GOOGLE_SPEECH_API_KEY") or None
+        if encoding is None:
+            encoding = os.environ.get("EXERCISE_GOOGLE_ENCODING", "legacy").lower()
+        if encoding not in ("legacy", "auto", "flac", "l16"):
+            raise ValueError(f"알 수 없는 인코딩: {encoding} (legacy/auto/flac/l16)")
+        if encoding == "auto":
+            encoding = "flac" if soundfile is not None else "l16"
+        if encoding == "flac" and soundfile is None:
+            raise RuntimeError("FLAC 인코딩에는 soundfile이 필요합니다 (pip install soundfile)")
+        if encoding != "legacy" and self.key is None and create_request_builder is None:
+            # 이 버전의 speech_recognition은 기본 키를 따로 제공하지 않음 -> recognize_google 사용
+            log.warning("GOOGLE_SPEECH_API_KEY가 없어 recognize_google로 인식합니다")
+            encoding = "legacy"
+        self.encoding = encoding
+        self.url = self._build_url() if encoding != "legacy" else None
+        self._local = threading.local()  # Recognizer는 스레드별로 하나씩
+
+    def _recognizer(self):
+        recognizer = getattr(self._local, 'recognizer', None)
+        if recognizer is None:
+            recognizer = self._local.recognizer = sr.Recognizer()
+        return recognizer
+
+    def _build_url(self) -> str:
+        if self.key is None:
+            builder = create_request_builder(endpoint=GOOGLE_ENDPOINT, language=self.language, filter_level=0)
+            return builder.build_url()
+        return f"{GOOGLE_ENDPOINT}?{urlencode({'client': 'chromium', 'lang': self.language, 'key': self.key, 'pFilter': 0})}"
+
+    def _recognize(self, audio, budget, timings):
+        if self.encoding == "legacy":
+            recognizer = self._recognizer()
+            recognizer.operation_timeout = budget  # 네트워크 요청도 예산 안에서 끊음
+            try:
+                return recognizer.recognize_google(audio, key=self.key, language=self.language)
+            except sr.UnknownValueError:
+                return None
+
+        started = time.perf_counter()
+        body, content_type = self.encode(audio)
+        encode_seconds = time.perf_counter() - started
+        timings['encode_ms'] = round(encode_seconds * 1000, 1)
+        timings['upload_bytes'] = len(body)
+
+        # 네트워크 요청은 인코딩에 쓰고 남은 예산 안에서 끊음
+        timeout = None
+        if budget is not None:
+            timeout = budget - encode_seconds
+            if timeout <= 0:
+                raise sr.RequestError("인코딩에 예산을 모두 사용했습니다")
+
+        request = Request(self.url, data=body, headers={"Content-Type": content_type})
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                response_text = response.read().decode("utf-8")
+        except HTTPError as e:
+            raise sr.RequestError(f"recognition request failed: {e.reason}")
+        except URLError as e:
+            raise sr.RequestError(f"recognition connection failed: {e.reason}")
+        finally:
+            timings['network_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return parse_google_response(response_text)
+
+    def encode(self, audio):
+        """요청 본문과 Content-Type (16 kHz 16비트 모노로 변환 후 FLAC 또는 L16)"""
+        raw = audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+        if self.encoding == "flac":
+            buffer = BytesIO()
+            soundfile.write(buffer, np.frombuffer(raw, dtype='<i2'), SAMPLE_RATE, format='FLAC', subtype='PCM_16')
+            return buffer.getvalue(), f"audio/x-flac; rate={SAMPLE_RATE}"
+        # L16은 빅엔디언 PCM (RFC 2586)
+        samples = array('h', raw)
+        if sys.byteorder == 'little':
+            samples.byteswap()
+        return samples.tobytes(), f"audio/l16; rate={SAMPLE_RATE}"
+
+def parse_google_response(response_text: str) -> Optional[str]:
+    """Google 응답(줄마다 JSON)에서 첫 번째 인식 결과 문장 (결과가 없으면 None)"""
+    for line in response_text.split("\n"):
+        if not line:
+            continue
+        result = json.loads(line).get("result", [])
+        if result:
+            alternatives = result[0].get("alternative", [])
+            if alternatives and "transcript" in alternatives[0]:
+                return alternatives[0]["transcript"]
+            return None
+    return None
+
+class VoskBackend(RecognizerBackend):
+    """vosk 오프라인 인식 (모델은 처음 사용할 때 로드)"""
+    name = "vosk"
+
+    def __init__(self, model_path=None):
+        if vosk is None:
+            raise RuntimeError("vosk가 설치되지 않았습니다 (pip install vosk)")
+        self.model_path = Path(model_path or os.environ.get("VOSK_MODEL_PATH", VOSK_MODEL_PATH))
+        if not self.model_path.is_dir():
+            raise RuntimeError(f"vosk 모델이 없습니다: {self.model_path}")
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _recognize(self, audio, budget, timings):
+        with self._lock:
+            if self._model is None:
+                started = time.perf_counter()
+                vosk.SetLogLevel(-1)
+                self._model = vosk.Model(str(self.model_path))
+                timings['model_load_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        recognizer = vosk.KaldiRecognizer(self._model, SAMPLE_RATE)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get('text', '').strip()
+        return text or None
+
+class StubBackend(RecognizerBackend):
+    """정해진 결과를 돌려주는 테스트용 엔진 (네트워크/마이크 없이 지연 시간 측정용)
+
+    fixtures_dir: <이름>.wav + <이름>.txt(정답 문장) 목록, 같은 음성이 들어오면 정답 반환
+                  (.txt가 없으면 파일 이름을 정답으로 사용)
+    script: 픽스처에 없는 음성이 들어올 때 순서대로 돌려줄 문장 목록
+    delay: 인식마다 추가할 지연(초)
+    """
+    name = "stub"
+
+    def __init__(self, fixtures_dir=STUB_FIXTURE_DIR, script: Iterable[Optional[str]] = (), delay: float = 0.0):
+        self.delay = delay
+        self._script = list(script)
+        self._lock = threading.Lock()
+        self.transcripts: Dict[str, str] = {}
+        fixtures_dir = Path(fixtures_dir)
+        if fixtures_dir.is_dir():
+            for path in sorted(fixtures_dir.glob("*.wav")):
+                transcript = path.with_suffix(".txt")
+                text = transcript.read_text(encoding="utf-8").strip() if transcript.exists() else path.stem
+                self.transcripts[_fingerprint(load_wav(path))] = text
+
+    def _recognize(self, audio, budget, timings):
+        if self.delay:
+            time.sleep(self.delay)
+        text = self.transcripts.get(_fingerprint(audio))
+        if text is not None:
+            return text
+        with self._lock:
+            return self._script.pop(0) if self._script else None
+
+def _fingerprint(audio) -> str:
+    return hashlib.sha1(audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)).hexdigest()
+
+def audio_duration(audio) -> float:
+    """AudioData 길이(초)"""
+    return round(len(audio.frame_data) / float(audio.sample_rate * audio.sample_width), 3)
+
+def load_wav(path):
+    """WAV 파일을 speech_recognition.AudioData로 읽기 (픽스처 / 벤치마크용)"""
+    with wave.open(str(path), 'rb') as f:
+        data = f.readframes(f.getnframes())
+        width, rate, channels = f.getsampwidth(), f.getframerate(), f.getnchannels()
+    if channels != 1:
+        raise ValueError(f"모노 WAV만 지원합니다: {path}")
+    return sr.AudioData(data, rate, width)
+
+BACKENDS = {
+    'google': GoogleBackend,
+    'vosk': VoskBackend,
+    'stub': StubBackend,
+}
+
+def create_backend(name: str, **kwargs) -> RecognizerBackend:
+    """이름으로 인식 엔진 생성"""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 인식 엔진: {name} ({'/'.join(BACKENDS)})")
+    return backend_class(**kwargs)
+
+_backend = None
+
+def get_recognizer_backend() -> RecognizerBackend:
+    """전역 인식 엔진 (EXERCISE_SPEECH_BACKEND, 생성 실패 시 google)"""
+    global _backend
+    if _backend is None:
+        name = os.environ.get("EXERCISE_SPEECH_BACKEND", "google").lower()
+        try:
+            _backend = create_backend(name)
+        except (ValueError, RuntimeError) as e:
+            log.warning("인식 엔진을 만들 수 없어 google을 사용합니다", backend=name, error=e)
+            _backend = GoogleBackend(encoding="legacy")
+        log.info("음성 인식 엔진", backend=_backend.name)
+    return _backend
+
+def set_recognizer_backend(backend: RecognizerBackend) -> None:
+    """전역 인식 엔진 교체"""
+    global _backend
+    _backend = backend
+
+def _bench(name: str, paths, budget: Optional[float]) -> None:
+    backend = create_backend(name)
+    for path in paths:
+        result = backend.recognize(load_wav(path), budget=budget)
+        status = "시간 초과" if result.timed_out else (result.error or result.text or "인식 불가")
+        extra = " ".join(f"{k}={v}" for k, v in result.timings.items())
+        print(f"[ASR] {Path(path).name}: {status} ({result.elapsed_ms:.0f} ms, "
+              f"음성 {result.audio_seconds:.2f}초) {extra}".rstrip())
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "bench":
+        _bench(args[1], args[2:], float(os.environ.get("EXERCISE_SPEECH_BUDGET", DEFAULT_BUDGET)))
+    else:
+        print(__doc__)
@@ -9,7 +9,15 @@ import os
 import time
 import threading
 import random
+from concurrent.futures import Future
 from pathlib import Path
+from Logger import get_logger, get_file_sink, shutdown_logging
+from AudioCache import AudioClipCache
+from AudioAssets import AudioAssetIndex, normalize_clip_id
+from AudioScheduler import AudioPriority, audio_scheduler
+from AudioMixer import ChannelMixer, VOICE, EFFECTS, MUSIC
+
+log = get_logger("SPEAKER")
 
 # TTS (Text-to-Speech) 라이브러리 - 비활성화 (print 사용)
 # try:
@@ -19,22 +27,58 @@ from pathlib import Path
 #     print("[SPEAKER] pyttsx3가 설치되지 않았습니다. 'pip install pyttsx3' 명령으로 설치해주세요.")
 #     TTS_AVAILABLE = False
 TTS_AVAILABLE = False
-print("[SPEAKER] TTS 비활성화 - print 출력 사용")
 
-# MP3 파일 재생용
+# MP3 파일 재생용 (믹서 초기화는 start_audio_backend()에서 백그라운드로 진행)
 try:
     import pygame
-    pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
-    pygame.mixer.init()
     PYGAME_AVAILABLE = True
-    print("[SPEAKER] pygame 초기화 완료")
 except ImportError:
-    print("[SPEAKER] pygame이 설치되지 않았습니다. 'pip install pygame' 명령으로 설치해주세요.")
-    PYGAME_AVAILABLE = False
-except Exception as e:
-    print(f"[SPEAKER] pygame 초기화 실패: {e}")
     PYGAME_AVAILABLE = False
 
+_backend_future = None
+_backend_lock = threading.Lock()
+
+def _init_mixer():
+    """pygame.mixer 초기화 (백그라운드 스레드에서 실행, 성공 여부 반환)"""
+    global PYGAME_AVAILABLE
+    if not PYGAME_AVAILABLE:
+        log.warning("pygame이 설치되지 않았습니다. 'pip install pygame' 명령으로 설치해주세요.")
+        return False
+    try:
+        pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init()
+        log.info("pygame 초기화 완료")
+        return True
+    except Exception as e:
+        log.error("pygame 초기화 실패", error=e)
+        PYGAME_AVAILABLE = False
+        return False
+
+def start_audio_backend():
+    """오디오 백엔드 초기화를 백그라운드에서 시작 (한 번만, 준비 완료 Future 반환)"""
+    global _backend_future
+    with _backend_lock:
+        if _backend_future is None:
+            _backend_future = Future()
+            future = _backend_future
+
+            def _run():
+                future.set_result(_init_mixer())
+
+            threading.Thread(target=_run, daemon=True, name="AudioBackendInit").start()
+        return _backend_future
+
+# 시작할 때 미리 디코딩해 두는 안내 음성 클립 (0001 ~ 0015)
+GUIDANCE_CLIP_IDS = [f"{i:04d}" for i in range(1, 16)]
+
+# MP3 디렉토리 후보 (앞에서부터 MP3 파일이 있는 첫 번째 경로 사용)
+MP3_DIRECTORY_CANDIDATES = [
+    Path(r"C:\Users\PC2403\Desktop\mp3"),  # 원본 경로
+    Path("C:/Users/PC2403/Desktop/mp3"),   # 슬래시 구분자
+    Path.home() / "Desktop" / "mp3",       # 홈 디렉토리 기준
+    Path(__file__).parent / "mp3",         # 프로그램 폴더 내
+]
+
 class SpeakerController:
     """내장 스피커 제어 클래스"""
     
@@ -42,48 +86,25 @@ class SpeakerController:
         self.is_connected = True  # 내장 스피커는 항상 사용 가능
         self.tts_engine = None
         
-        # 디버그 로그 파일 생성
+        # 디버그 로그 파일 (백그라운드에서 모아서 기록, 크기 초과 시 회전)
         self.debug_log_path = Path(__file__).parent / "speaker_debug.log"
+        self.debug_log = get_file_sink(self.debug_log_path)
         
-        # MP3 파일 경로 설정 (여러 방법으로 시도)
-        self.mp3_files_path = self._find_mp3_directory()
+        # MP3 파일 색인 (스캔은 백그라운드 초기화에서 한 번만, 이후 조회는 딕셔너리 조회)
+        self.asset_index = AudioAssetIndex(MP3_DIRECTORY_CANDIDATES)
+        self.mp3_files_path = MP3_DIRECTORY_CANDIDATES[0]
         self.audio_files_path = Path(__file__).parent / "audio_files"  # 백업용
         
         # TTS 엔진 비활성화 (print로 대체)
         self.tts_engine = None
-        print("[SPEAKER] TTS 대신 print 출력을 사용합니다.")
         
-        # 오디오 파일 디렉토리 생성
-        self.audio_files_path.mkdir(exist_ok=True)
+        # 예약 채널과 클립 캐시 (백그라운드 초기화에서 채움)
+        self.mixer = None
+        self.clip_cache = AudioClipCache()
         
-        # MP3 파일 경로 확인 및 디버깅
-        print(f"[SPEAKER] MP3 파일 경로 확인: {self.mp3_files_path}")
-        print(f"[SPEAKER] 경로 타입: {type(self.mp3_files_path)}")
-        print(f"[SPEAKER] 절대 경로: {self.mp3_files_path.absolute()}")
-        
-        if not self.mp3_files_path.exists():
-            print(f"[SPEAKER] 경고: MP3 파일 경로가 존재하지 않습니다!")
-            print(f"[SPEAKER] 해당 경로에 000n.mp3 파일들을 배치해주세요.")
-            
-            # 상위 디렉토리 확인
-            parent_path = self.mp3_files_path.parent
-            print(f"[SPEAKER] 상위 디렉토리 확인: {parent_path} (존재: {parent_path.exists()})")
-        else:
-            print(f"[SPEAKER] ✅ MP3 파일 경로 확인됨: {self.mp3_files_path}")
-            
-            # 디렉토리 내 MP3 파일 확인
-            try:
-                mp3_files = list(self.mp3_files_path.glob("*.mp3"))
-                print(f"[SPEAKER] 발견된 MP3 파일 수: {len(mp3_files)}")
-                
-                if mp3_files:
-                    print("[SPEAKER] 발견된 MP3 파일들:")
-                    for mp3_file in sorted(mp3_files)[:5]:  # 처음 5개만 표시
-                        print(f"[SPEAKER]   - {mp3_file.name}")
-                    if len(mp3_files) > 5:
-                        print(f"[SPEAKER]   ... 및 {len(mp3_files) - 5}개 더")
-            except Exception as e:
-                print(f"[SPEAKER] MP3 파일 검색 중 오류: {e}")
+        # 스케줄러가 재생 중인 안내 음성 채널 (디코딩할 수 없는 클립은 mixer.music으로 스트리밍)
+        self._voice_channel = None
+        self._streaming = False
         
         # 백업용 TTS 메시지들 (MP3 파일이 없을 때 사용)
         self.backup_messages = {
@@ -123,11 +144,84 @@ class SpeakerController:
             'complete': "모든 운동이 완료되었습니다. 수고하셨습니다!",
             'goodbye': "오늘 운동은 여기까지입니다. 안녕히 가세요!"
         }
+        
+        # 믹서 초기화, 디렉토리 스캔, 클립 미리 불러오기는 백그라운드에서 진행
+        # (첫 재생 요청은 wait_ready()로 준비 완료를 기다림)
+        self.ready = Future()
+        threading.Thread(target=self._initialize_backend, daemon=True, name="SpeakerInit").start()
+    
+    def _initialize_backend(self):
+        """백그라운드 초기화 (믹서 -> MP3 색인 -> 예약 채널 -> ready 완료 -> 클립 미리 불러오기)"""
+        try:
+            mixer_ready = start_audio_backend().result()
+            log.info("TTS 비활성화 - print 출력 사용")
+            
+            self.asset_index.refresh()
+            self.mp3_files_path = self.asset_index.directory or MP3_DIRECTORY_CANDIDATES[0]
+            
+            # 오디오 파일 디렉토리 생성
+            self.audio_files_path.mkdir(exist_ok=True)
+            
+            # MP3 파일 경로 확인 및 디버깅
+            log.info(f"MP3 파일 경로 확인: {self.mp3_files_path}")
+            
+            if not self.mp3_files_path.exists():
+                log.warning("MP3 파일 경로가 존재하지 않습니다!")
+                log.info("해당 경로에 000n.mp3 파일들을 배치해주세요.")
+                
+                # 상위 디렉토리 확인
+                parent_path = self.mp3_files_path.parent
+                log.info(f"상위 디렉토리 확인: {parent_path} (존재: {parent_path.exists()})")
+            else:
+                log.info(f"✅ MP3 파일 경로 확인됨: {self.mp3_files_path}")
+                
+                # 색인된 MP3 파일 확인
+                clip_ids = self.asset_index.clip_ids()
+                log.info(f"발견된 MP3 파일 수: {len(clip_ids)}")
+
+                if clip_ids:
+                    log.info("발견된 MP3 파일들:")
+                    for clip_id in clip_ids[:5]:  # 처음 5개만 표시
+                        asset = self.asset_index.lookup(clip_id)
+                        log.info(f"  - {asset.path.name}", bytes=asset.size, duration=asset.duration)
+                    if len(clip_ids) > 5:
+                        log.info(f"  ... 및 {len(clip_ids) - 5}개 더")
+            
+            
+            # 안내 음성 / 효과음 / 배경 음악 예약 채널 (서로 끊지 않고 동시에 재생)
+            if mixer_ready:
+                try:
+                    self.mixer = ChannelMixer()
+                except pygame.error as e:
+                    log.error("예약 채널 설정 실패", error=e)
+            
+        except Exception as e:
+            log.error("오디오 백엔드 초기화 오류", error=e)
+            self.ready.set_result(False)
+            return
+        
+        # 믹서와 채널이 준비되면 바로 재생 가능 (아직 캐시에 없는 클립은 재생할 때 디코딩)
+        self.ready.set_result(mixer_ready)
+        
+        # 안내 음성 클립은 이 스레드에서 이어서 미리 디코딩 (이후 재생 시 파일 입출력 없음)
+        if mixer_ready and self.asset_index.directory is not None:
+            try:
+                self.clip_cache.preload(GUIDANCE_CLIP_IDS, self._find_mp3_file)
+            except Exception as e:
+                log.error("클립 미리 불러오기 오류", error=e)
+    
+    def wait_ready(self, timeout=10.0):
+        """백그라운드 초기화 완료까지 대기 (믹서를 사용할 수 있으면 True)"""
+        try:
+            return self.ready.result(timeout=timeout)
+        except Exception:
+            log.warning("오디오 백엔드 준비 대기 시간 초과", timeout=timeout)
+            return False
     
     def connect(self):
         """스피커 연결 (항상 성공)"""
         self.is_connected = True
-        print("[SPEAKER] 내장 스피커 연결 완료")
+        log.info("내장 스피커 연결 완료")
         return True
     
     def disconnect(self):
@@ -141,141 +235,34 @@ class SpeakerController:
             except:
                 pass
         
-        # pygame 정리
+        # 채널 재생 중지, 캐시된 클립 해제 후 pygame 정리
+        if self.mixer:
+            self.mixer.close()
+        self.clip_cache.clear()
         if PYGAME_AVAILABLE:
             try:
                 if pygame.mixer.get_init():
                     pygame.mixer.music.stop()
                     pygame.mixer.quit()
             except Exception as e:
-                print(f"[SPEAKER] pygame 정리 중 오류: {e}")
+                log.error("pygame 정리 중 오류", error=e)
         
-        print("[SPEAKER] 내장 스피커 연결 해제 완료")
+        log.info("내장 스피커 연결 해제 완료")
     
     def _log(self, message):
-        """디버그 로그 기록"""
-        try:
-            with open(self.debug_log_path, "a", encoding="utf-8") as f:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                f.write(f"[{timestamp}] {message}\n")
-                f.flush()
-        except:
-            pass
-        
-        # 콘솔에도 출력
-        print(message)
-    
-    def _find_mp3_directory(self):
-        """MP3 디렉토리를 찾는 메서드 (여러 경로 시도)"""
-        # 절대 경로 직접 지정 (확실히 존재하는 경로)
-        direct_path = Path(r"C:\Users\PC2403\Desktop\mp3")
-        
-        # 경로가 존재하면 바로 반환
-        if direct_path.exists() and any(direct_path.glob("*.mp3")):
-            self._log(f"[SPEAKER] ✅ 직접 경로로 MP3 디렉토리 발견: {direct_path}")
-            return direct_path
-        
-        # 백업 경로들
-        possible_paths = [
-            Path(r"C:\Users\PC2403\Desktop\mp3"),  # 원본 경로
-            Path("C:/Users/PC2403/Desktop/mp3"),   # 슬래시 구분자
-            Path.home() / "Desktop" / "mp3",       # 홈 디렉토리 기준
-            Path(__file__).parent / "mp3",         # 프로그램 폴더 내
-        ]
-        
-        self._log("[SPEAKER] MP3 디렉토리 검색 중...")
-        
-        for i, path in enumerate(possible_paths, 1):
-            self._log(f"[SPEAKER] {i}. 경로 시도: {path}")
-            try:
-                if path.exists():
-                    # MP3 파일이 실제로 있는지 확인
-                    mp3_files = list(path.glob("*.mp3"))
-                    if mp3_files:
-                        self._log(f"[SPEAKER] ✅ MP3 디렉토리 발견: {path} ({len(mp3_files)}개 파일)")
-                        for mp3_file in sorted(mp3_files)[:5]:  # 처음 5개 파일만 로그
-                            self._log(f"[SPEAKER]   - {mp3_file.name}")
-                        return path
-                    else:
-                        self._log(f"[SPEAKER] ⚠️  디렉토리는 존재하지만 MP3 파일이 없음: {path}")
-                else:
-                    self._log(f"[SPEAKER] ❌ 경로가 존재하지 않음: {path}")
-            except Exception as e:
-                self._log(f"[SPEAKER] ❌ 경로 확인 오류: {path} - {e}")
+        """디버그 로그 기록 (파일 입출력은 작성기 스레드에서 수행)"""
+        self.debug_log.write("SPEAKER", message)
         
-        # 기본 경로 반환 (없어도 일단 반환)
-        default_path = possible_paths[0]
-        self._log(f"[SPEAKER] ⚠️  MP3 디렉토리를 찾지 못했습니다. 기본 경로 사용: {default_path}")
-        return default_path
+        # 콘솔에도 출력 (비동기 로거)
+        log.debug(message)
     
     def _find_mp3_file(self, mp3_filename):
-        """특정 MP3 파일을 찾는 메서드 (여러 파일명 패턴 시도)"""
-        # 디렉토리가 존재하지 않으면 None 반환
-        if not self.mp3_files_path.exists():
-            self._log(f"[SPEAKER] MP3 디렉토리가 존재하지 않음: {self.mp3_files_path}")
+        """색인에서 MP3 파일 경로 조회 (0001 / 1 / 0001.MP3 모두 같은 파일, 없으면 None)"""
+        asset = self.asset_index.lookup(mp3_filename)
+        if asset is None:
+            self._log(f"❌ {mp3_filename} 파일을 찾을 수 없습니다. (색인된 파일 {len(self.asset_index)}개)")
             return None
-        
-        # 다양한 파일명 패턴 시도
-        possible_names = [
-            f"{mp3_filename}.mp3",           # 0001.mp3
-            f"{mp3_filename}.MP3",           # 0001.MP3 (대문자)
-        ]
-        
-        # 숫자 변환 가능한 경우 추가 패턴
-        try:
-            num = int(mp3_filename)
-            possible_names.extend([
-                f"{num:d}.mp3",              # 1.mp3 (앞의 0 제거)
-                f"{num:04d}.mp3",            # 0001.mp3 (재포맷)
-                f"{num:04d}.MP3",            # 0001.MP3 (재포맷 + 대문자)
-            ])
-        except ValueError:
-            pass
-        
-        self._log(f"[SPEAKER] {mp3_filename} 파일 검색 시도...")
-        
-        # 각 패턴으로 파일 찾기
-        for i, filename in enumerate(possible_names, 1):
-            try:
-                file_path = self.mp3_files_path / filename
-                self._log(f"[SPEAKER] {i}. 시도: {file_path}")
-                
-                if file_path.exists():
-                    self._log(f"[SPEAKER] ✅ 파일 발견: {file_path}")
-                    return file_path
-                else:
-                    self._log(f"[SPEAKER] ❌ 파일 없음: {filename}")
-                    
-            except Exception as e:
-                self._log(f"[SPEAKER] ❌ 파일 확인 오류: {filename} - {e}")
-                continue
-        
-        # 모든 패턴이 실패한 경우, 디렉토리 내 실제 파일들 확인
-        self._log(f"[SPEAKER] 모든 패턴 실패. 디렉토리 내 파일 목록 확인...")
-        try:
-            all_files = list(self.mp3_files_path.iterdir())
-            mp3_files = [f for f in all_files if f.suffix.lower() in ['.mp3']]
-            
-            self._log(f"[SPEAKER] 디렉토리 내 총 파일 수: {len(all_files)}")
-            self._log(f"[SPEAKER] 디렉토리 내 MP3 파일 수: {len(mp3_files)}")
-            
-            if mp3_files:
-                self._log("[SPEAKER] 실제 존재하는 MP3 파일들:")
-                for mp3_file in sorted(mp3_files)[:10]:  # 최대 10개만 표시
-                    self._log(f"[SPEAKER]   - {mp3_file.name}")
-                    
-                # 파일명에 요청한 번호가 포함된 파일 찾기
-                for mp3_file in mp3_files:
-                    if mp3_filename in mp3_file.name:
-                        self._log(f"[SPEAKER] 🎯 부분 매칭 파일 발견: {mp3_file}")
-                        return mp3_file
-                        
-        except Exception as e:
-            self._log(f"[SPEAKER] 디렉토리 스캔 오류: {e}")
-        
-        self._log(f"[SPEAKER] ❌ {mp3_filename} 파일을 찾을 수 없습니다.")
-        return None
+        return asset.path
     
     def speak_text(self, text, async_mode=True):
         """텍스트를 print로 출력 (TTS 대신)"""
@@ -283,7 +270,7 @@ class SpeakerController:
             return False
         
         def _speak():
-            print(f"[SPEAKER] 🔊 음성 안내: {text}")
+            log.info(f"🔊 음성 안내: {text}")
         
         if async_mode:
             # 비동기로 실행하여 메인 스레드를 블록하지 않음
@@ -293,75 +280,215 @@ class SpeakerController:
         
         return True
     
+    def play_cached_clip(self, clip_id, async_mode=True):
+        """캐시에 디코딩된 클립을 재생 (캐시에 없으면 False)
+        
+        안내 음성 채널은 스케줄러만 사용하므로 AMBIENT 우선순위로 스케줄러에 요청
+        (재생 중인 높은 우선순위 클립을 끊지 않음)
+        """
+        if not self.is_connected or not self.wait_ready():
+            return False
+        
+        clip_id = normalize_clip_id(clip_id)
+        if self.clip_cache.get(clip_id) is None:
+            return False
+        
+        future = audio_scheduler.play(clip_id, AudioPriority.AMBIENT)
+        log.info("🎵 캐시 클립 재생 예약", clip=clip_id)
+        if not async_mode:
+            future.result()
+        return True
+    
+    def _play_voice(self, sound):
+        """안내 음성 채널에서 재생 (스케줄러 스레드 전용, 예약 채널이 없으면 빈 채널 사용)"""
+        if self.mixer:
+            return self.mixer.play(VOICE, sound)
+        return sound.play()
+    
+    def set_channel_volume(self, role, volume):
+        """채널 볼륨 설정 (role: VOICE / EFFECTS / MUSIC, volume: 0.0 ~ 1.0)"""
+        if self.mixer:
+            self.mixer.set_volume(role, volume)
+    
+    def play_music(self, clip_id, loops=-1):
+        """배경 음악 채널에서 클립 반복 재생 (안내 음성이 나오는 동안 볼륨이 낮아짐)"""
+        if not self.is_connected or not self.wait_ready() or not self.mixer:
+            return False
+        sound = self._clip_sound(clip_id)
+        if sound is None:
+            return False
+        self.mixer.play(MUSIC, sound, loops=loops)
+        log.info("🎵 배경 음악 재생 시작", clip=clip_id)
+        return True
+    
+    def _clip_sound(self, clip_id):
+        """클립의 Sound 반환 (캐시에 없으면 색인에서 찾아 디코딩 후 캐시에 추가)"""
+        clip_id = normalize_clip_id(clip_id)
+        sound = self.clip_cache.get(clip_id)
+        if sound is None:
+            mp3_path = self._find_mp3_file(clip_id)
+            if mp3_path is not None:
+                sound = self.clip_cache.load(clip_id, mp3_path)
+        return sound
+    
+    # AudioScheduler 재생기 인터페이스 (스케줄러 스레드에서만 호출)
+    def start_clip(self, clip_id):
+        """클립 재생 시작 (재생할 수 없으면 백업 메시지 출력 후 False)"""
+        if not self.is_connected:
+            return False
+        if not self.wait_ready():
+            backup_message = self.backup_messages.get(normalize_clip_id(clip_id), f"메시지 번호 {clip_id}")
+            log.info(f"🔊 음성 안내: {backup_message}")
+            return False
+        sound = self._clip_sound(clip_id)
+        if sound is None:
+            # 디코딩할 수 없는 클립 (메모리 부족, 지원하지 않는 형식 등)은 스트리밍으로 재생
+            return self._stream_clip(clip_id)
+        try:
+            self._streaming = False
+            self._voice_channel = self._play_voice(sound)
+        except pygame.error as e:
+            log.error("클립 재생 오류", clip=clip_id, error=e)
+            return False
+        if self._voice_channel is None:
+            log.warning("재생할 수 있는 채널이 없습니다", clip=clip_id)
+            return False
+        log.info("🎵 클립 재생 시작", clip=clip_id)
+        return True
+    
+    def _stream_clip(self, clip_id):
+        """디코딩할 수 없는 클립을 mixer.music으로 스트리밍 재생 (파일도 없으면 백업 메시지 출력 후 False)"""
+        mp3_path = self._find_mp3_file(normalize_clip_id(clip_id))
+        if mp3_path is None:
+            backup_message = self.backup_messages.get(normalize_clip_id(clip_id), f"메시지 번호 {clip_id}")
+            log.info(f"🔊 음성 안내: {backup_message}")
+            return False
+        try:
+            pygame.mixer.music.load(str(mp3_path))
+            pygame.mixer.music.play()
+        except pygame.error as e:
+            log.error("클립 스트리밍 재생 오류", clip=clip_id, error=e)
+            return False
+        self._streaming = True
+        log.info("🎵 클립 스트리밍 재생 시작", clip=clip_id)
+        return True
+    
+    def queue_clip(self, clip_id):
+        """현재 클립이 끝나면 바로 이어서 재생되도록 채널 대기열에 추가"""
+        channel = self._voice_channel
+        if channel is None or not channel.get_busy() or channel.get_queue() is not None:
+            return False
+        sound = self._clip_sound(clip_id)
+        if sound is None:
+            return False
+        if self.mixer:
+            self.mixer.queue(VOICE, sound)
+        else:
+            channel.queue(sound)
+        log.debug("클립 이어서 재생 예약", clip=clip_id)
+        return True
+    
+    def clip_busy(self):
+        """스케줄러 클립 재생 중 여부"""
+        channel = self._voice_channel
+        try:
+            if self._streaming:
+                return pygame.mixer.music.get_busy()
+            return channel is not None and channel.get_busy()
+        except pygame.error:
+            return False
+    
+    def stop_clip(self):
+        """스케줄러 클립 재생 중지"""
+        channel = self._voice_channel
+        self._voice_channel = None
+        if self._streaming:
+            self._streaming = False
+            try:
+                pygame.mixer.music.stop()
+            except pygame.error:
+                pass
+        if channel is not None:
+            try:
+                channel.stop()
+                if self.mixer:
+                    self.mixer.unduck()
+            except pygame.error:
+                pass
+    
     def play_mp3_file(self, mp3_filename, async_mode=True):
         """MP3 파일을 직접 재생"""
         if not self.is_connected:
             return False
         
+        # 미리 디코딩된 클립이 있으면 파일 입출력 없이 재생
+        if self.play_cached_clip(mp3_filename, async_mode):
+            return True
+        
         def _play_mp3():
             try:
+                self.wait_ready()
+                
                 # MP3 파일을 여러 방법으로 찾기
                 mp3_path = self._find_mp3_file(mp3_filename)
                 
-                self._log(f"[SPEAKER] MP3 파일 재생 시도: {mp3_filename}")
+                self._log(f"MP3 파일 재생 시도: {mp3_filename}")
                 
                 if mp3_path and mp3_path.exists():
                     file_size = mp3_path.stat().st_size
-                    self._log(f"[SPEAKER] ✅ 파일 발견: {mp3_path}")
-                    self._log(f"[SPEAKER] 파일 크기: {file_size:,} bytes")
+                    self._log(f"✅ 파일 발견: {mp3_path}")
+                    self._log(f"파일 크기: {file_size:,} bytes")
                 else:
-                    self._log(f"[SPEAKER] ❌ MP3 파일을 찾을 수 없습니다: {mp3_filename}")
+                    self._log(f"❌ MP3 파일을 찾을 수 없습니다: {mp3_filename}")
                     
-                    # 디렉토리 내 파일 목록 확인
-                    if self.mp3_files_path.exists():
-                        try:
-                            existing_files = list(self.mp3_files_path.glob("*.mp3"))
-                            self._log(f"[SPEAKER] 디렉토리 내 MP3 파일 수: {len(existing_files)}")
-                            if existing_files:
-                                self._log("[SPEAKER] 존재하는 MP3 파일들:")
-                                for existing_file in sorted(existing_files)[:5]:
-                                    self._log(f"[SPEAKER]   - {existing_file.name}")
-                        except Exception as e:
-                            self._log(f"[SPEAKER] 파일 목록 확인 오류: {e}")
+                    # 색인된 파일 목록 확인
+                    clip_ids = self.asset_index.clip_ids()
+                    self._log(f"색인된 MP3 파일 수: {len(clip_ids)}")
+                    if clip_ids:
+                        self._log(f"존재하는 MP3 파일들: {', '.join(clip_ids[:5])}")
                     
                     # 백업: print로 대체
                     backup_message = self.backup_messages.get(mp3_filename, f"메시지 번호 {mp3_filename}")
-                    self._log(f"[SPEAKER] 🔊 백업 메시지 출력: {backup_message}")
-                    print(f"[SPEAKER] 🔊 음성 안내: {backup_message}")
+                    self._log(f"🔊 백업 메시지 출력: {backup_message}")
+                    log.info(f"🔊 음성 안내: {backup_message}")
                     return False
                 
                 if not PYGAME_AVAILABLE:
-                    print("[SPEAKER] pygame을 사용할 수 없습니다. print로 대체합니다.")
+                    log.info("pygame을 사용할 수 없습니다. print로 대체합니다.")
                     backup_message = self.backup_messages.get(mp3_filename, f"메시지 번호 {mp3_filename}")
-                    print(f"[SPEAKER] 🔊 음성 안내: {backup_message}")
+                    log.info(f"🔊 음성 안내: {backup_message}")
                     return False
                 
-                print(f"[SPEAKER] 🎵 MP3 파일 재생 시작: {mp3_path.name}")
+                # 디코딩해서 캐시에 넣고 재생 (다음 재생부터는 메모리에서 바로 재생)
+                if self.clip_cache.load(normalize_clip_id(mp3_filename), mp3_path) is not None:
+                    return self.play_cached_clip(mp3_filename, async_mode)
+                
+                log.info("🎵 MP3 파일 재생 시작", clip=mp3_path.name)
                 
                 # pygame으로 MP3 파일 재생
                 try:
                     pygame.mixer.music.load(str(mp3_path))
                     pygame.mixer.music.play()
-                    print(f"[SPEAKER] ✅ pygame 재생 시작됨")
+                    log.debug("✅ pygame 재생 시작됨")
                     
                     # 재생 완료까지 대기 (동기 모드인 경우)
                     if not async_mode:
-                        print(f"[SPEAKER] 재생 완료 대기 중...")
+                        log.debug("재생 완료 대기 중...")
                         while pygame.mixer.music.get_busy():
                             time.sleep(0.1)
-                        print(f"[SPEAKER] 재생 완료")
+                        log.debug("재생 완료")
                             
                 except pygame.error as e:
-                    print(f"[SPEAKER] ❌ pygame 재생 오류: {e}")
+                    log.error("❌ pygame 재생 오류", error=e)
                     raise Exception(f"pygame 재생 실패: {e}")
                 
                 return True
                 
             except Exception as e:
-                print(f"[SPEAKER] MP3 재생 오류: {e}")
+                log.error("MP3 재생 오류", error=e)
                 # 오류 시 print 백업
                 backup_message = self.backup_messages.get(mp3_filename, f"메시지 번호 {mp3_filename}")
-                print(f"[SPEAKER] 🔊 백업 메시지 출력: {backup_message}")
+                log.info(f"🔊 백업 메시지 출력: {backup_message}")
                 return False
         
         if async_mode:
@@ -373,10 +500,19 @@ class SpeakerController:
         return True
     
     def play_system_sound(self, sound_type='default'):
-        """시스템 효과음 재생"""
+        """시스템 효과음 재생 (효과음 채널이 있으면 안내 음성과 겹쳐서 바로 재생)"""
         if not self.is_connected:
             return False
         
+        # 백엔드 준비 전이면 기다리지 않고 시스템 비프음 사용
+        if self.ready.done() and self.mixer:
+            try:
+                if self.mixer.play_effect(sound_type) is not None:
+                    log.debug("효과음 채널 재생", sound=sound_type)
+                    return True
+            except pygame.error as e:
+                log.error("효과음 재생 오류", error=e)
+        
         def _play_sound():
             try:
                 if os.name == 'nt':  # Windows
@@ -392,9 +528,9 @@ class SpeakerController:
                 else:  # Linux/Mac
                     os.system('echo -e "\a"')  # 시스템 비프음
                 
-                print(f"[SPEAKER] 시스템 효과음 재생: {sound_type}")
+                log.debug("시스템 효과음 재생", sound=sound_type)
             except Exception as e:
-                print(f"[SPEAKER] 효과음 재생 오류: {e}")
+                log.error("효과음 재생 오류", error=e)
         
         threading.Thread(target=_play_sound, daemon=True).start()
         return True
@@ -405,19 +541,20 @@ speaker_controller = None
 def initialize_speaker():
     """스피커 초기화"""
     global speaker_controller
-    print("[SPEAKER] 내장 스피커 초기화 시작")
+    log.info("내장 스피커 초기화 시작")
     
     try:
         speaker_controller = SpeakerController()
         if speaker_controller.connect():
-            print("[SPEAKER] 내장 스피커 초기화 완료")
+            audio_scheduler.attach(speaker_controller)
+            log.info("내장 스피커 초기화 완료")
             return True
         else:
-            print("[SPEAKER] 내장 스피커 초기화 실패")
+            log.info("내장 스피커 초기화 실패")
             speaker_controller = None
             return False
     except Exception as e:
-        print(f"[SPEAKER] 스피커 초기화 중 오류: {e}")
+        log.error("스피커 초기화 중 오류", error=e)
         speaker_controller = None
         return False
 
@@ -425,10 +562,11 @@ def cleanup_speaker():
     """스피커 정리"""
     global speaker_controller
     if speaker_controller:
-        print("[SPEAKER] 스피커 정리 시작...")
+        log.info("스피커 정리 시작...")
+        audio_scheduler.shutdown()
         speaker_controller.disconnect()
         speaker_controller = None
-        print("[SPEAKER] 스피커 정리 완료")
+        log.info("스피커 정리 완료")
 
 # 기존 아두이노 함수들을 스피커 버전으로 대체
 def play_sound(speaker, sound_type):
@@ -479,70 +617,40 @@ def play_random_mp3(speaker):
         return play_specific_mp3(speaker, selected)
     return False
 
-def play_specific_mp3(speaker, mp3_file):
+def schedule_mp3(speaker, mp3_files, priority=AudioPriority.CUE, tag=None):
     """
-    특정 MP3 파일 재생 (실제 MP3 파일 사용)
+    우선순위 스케줄러로 MP3 재생 요청 (완료 Future 반환)
+    mp3_files: 클립 하나 또는 끊김 없이 이어서 재생할 클립 목록
+    priority: AudioPriority (높은 우선순위 클립은 재생 중인 낮은 우선순위 클립을 끊음)
+    tag: 요청이 속한 자세 단계 (audio_scheduler.cancel(tag)로 취소)
+    """
+    if not speaker or not speaker.is_connected:
+        log.warning("스피커가 연결되지 않았습니다.")
+        future = Future()
+        future.set_result(False)
+        return future
+    
+    if isinstance(mp3_files, (str, int)):
+        mp3_files = [mp3_files]
+    clip_ids = [normalize_clip_id(mp3_file) for mp3_file in mp3_files]
+    log.info("MP3 재생 예약", clips=",".join(clip_ids), priority=AudioPriority(priority).name,
+             depth=audio_scheduler.queue_depth())
+    return audio_scheduler.play_sequence(clip_ids, priority, tag)
+
+def play_specific_mp3(speaker, mp3_file, priority=None):
+    """
+    특정 MP3 파일 재생 (우선순위 스케줄러를 통해 안내 음성 채널에서 재생)
     mp3_file: 재생할 MP3 파일명 (예: "0001", "0002", "0003", "0004")
+    priority: 스케줄러 우선순위 (지정하지 않으면 AMBIENT - 다른 안내 음성을 끊지 않음)
+    반환값: 재생 완료 Future (재생이 끝나면 True, 끊기거나 취소되면 False), 스피커가 없으면 False
     """
     if not speaker or not speaker.is_connected:
-        print("[SPEAKER] 스피커가 연결되지 않았습니다.")
+        log.warning("스피커가 연결되지 않았습니다.")
         return False
     
-    # MP3 파일명 정규화
-    if isinstance(mp3_file, int):
-        mp3_filename = f"{mp3_file:04d}"
-    else:
-        mp3_filename = str(mp3_file).zfill(4) if str(mp3_file).isdigit() else str(mp3_file)
-    
-    print(f"[SPEAKER] MP3 재생 요청: {mp3_filename}")
-    
-    # 직접 경로로 파일 확인 및 재생 시도
-    try:
-        from pathlib import Path
-        
-        # 직접 경로 지정 - 확실히 존재하는 경로
-        mp3_path = Path(r"C:\Users\PC2403\Desktop\mp3") / f"{mp3_filename}.mp3"
-        print(f"[SPEAKER] 파일 경로 확인: {mp3_path}")
-        print(f"[SPEAKER] 파일 존재 여부: {mp3_path.exists()}")
-        
-        if mp3_path.exists():
-            file_size = mp3_path.stat().st_size
-            print(f"[SPEAKER] 파일 크기: {file_size:,} bytes")
-            
-            # pygame으로 직접 재생
-            if PYGAME_AVAILABLE:
-                try:
-                    import pygame
-                    if pygame.mixer.get_init():
-                        pygame.mixer.music.load(str(mp3_path))
-                        pygame.mixer.music.play()
-                        print(f"[SPEAKER] ✅ {mp3_filename}.mp3 재생 시작됨")
-                        return True
-                    else:
-                        print("[SPEAKER] pygame.mixer가 초기화되지 않았습니다.")
-                except Exception as e:
-                    print(f"[SPEAKER] pygame 재생 오류: {e}")
-            else:
-                print("[SPEAKER] pygame을 사용할 수 없습니다.")
-        else:
-            print(f"[SPEAKER] ❌ 파일이 존재하지 않습니다: {mp3_path}")
-            
-            # 디렉토리 내 실제 파일들 확인
-            mp3_dir = Path(r"C:\Users\PC2403\Desktop\mp3")
-            if mp3_dir.exists():
-                existing_files = list(mp3_dir.glob("*.mp3"))
-                print(f"[SPEAKER] 디렉토리 내 MP3 파일 수: {len(existing_files)}")
-                if existing_files:
-                    print("[SPEAKER] 존재하는 파일들:")
-                    for f in sorted(existing_files)[:5]:
-                        print(f"[SPEAKER]   - {f.name}")
-            
-    except Exception as e:
-        print(f"[SPEAKER] 직접 재생 시도 오류: {e}")
-    
-    # 기존 방식으로 폴백
-    print("[SPEAKER] 기존 방식으로 재생 시도...")
-    return speaker.play_mp3_file(mp3_filename, async_mode=True)
+    if priority is None:
+        priority = AudioPriority.AMBIENT
+    return schedule_mp3(speaker, mp3_file, priority)
 
 # 테스트 함수
 def test_speaker_connection():
@@ -572,3 +680,4 @@ if __name__ == "__main__":
     # 단독 실행시 테스트
     print("내장 스피커 통신 테스트 시작")
     test_speaker_connection()
+    shutdown_logging()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 인식 전용 프로세스 모듈
+마이크 캡처, VAD, 리샘플링, 인코딩, 인식을 별도 프로세스에서 실행해
+영상 처리 스레드와 GIL을 두고 다투지 않도록 함
+- 메인 프로세스와는 작은 명령 큐 / 결과 큐로만 통신
+- 오디오 장치 오류 등으로 프로세스가 끝나면 자동으로 다시 시작
+- 음성 프로세스의 CPU 시간은 따로 집계해 보고
+
+환경변수 EXERCISE_SPEECH_PROCESS=0 이면 프로세스 없이 기존처럼 같은 프로세스에서 인식
+"""
+
+import os
+import queue
+import threading
+import time
+import multiprocessing
+from typing import Callable, Dict, Optional
+from Logger import get_logger
+
+log = get_logger("SPEECH_PROC")
+
+# 자식 프로세스 종료 코드
+EXIT_OK = 0
+EXIT_DEVICE_ERROR = 2
+
+def _speech_worker(commands, results, cpu_interval: float) -> None:
+    """음성 프로세스 본체 (자식 프로세스에서 실행)
+
+    명령: ('listen', bool) 인식 켜기/끄기, ('stop',)
+    결과: ('ready',), ('text', 문장 또는 None, 발화 종료 시각), ('cpu', CPU 초), ('error', 내용)
+    """
+    from MicrophoneStream import microphone_stream
+    from SpeechRecognition import recognize_command
+
+    if not microphone_stream.start():
+        results.put(('error', "마이크를 열 수 없습니다"))
+        raise SystemExit(EXIT_DEVICE_ERROR)
+    microphone_stream.wait_ready(timeout=3)
+    results.put(('ready',))
+
+    listening = False
+    last_report = time.monotonic()
+    exit_code = EXIT_OK
+    try:
+        while True:
+            # 쌓인 명령 처리
+            try:
+                while True:
+                    command = commands.get_nowait()
+                    if command[0] == 'stop':
+                        return
+                    if command[0] == 'listen':
+                        listening = command[1]
+            except queue.Empty:
+                pass
+
+            if microphone_stream.device_error is not None:
+                results.put(('error', f"오디오 장치 오류: {microphone_stream.device_error}"))
+                exit_code = EXIT_DEVICE_ERROR
+                return
+
+            # 인식을 꺼 둔 동안 들어온 발화는 꺼내서 버림
+            utterance = microphone_stream.listen(timeout=0.2)
+            if utterance is not None and listening:
+                text = recognize_command(utterance.to_audio_data())
+                # 모노토닉 시각은 프로세스마다 기준이 다르므로 벽시계 시각으로 변환
+                ended_at = time.time() - (time.monotonic() - utterance.ended_at)
+                results.put(('text', text, ended_at))
+
+            if time.monotonic() - last_report >= cpu_interval:
+                results.put(('cpu', time.process_time()))
+                last_report = time.monotonic()
+    finally:
+        results.put(('cpu', time.process_time()))
+        microphone_stream.stop()
+        if exit_code != EXIT_OK:
+            raise SystemExit(exit_code)
+
+class SpeechProcess:
+    """음성 인식 프로세스 관리 (메인 프로세스 쪽)
+
+    listen_command(): 다음 명령 하나 인식 (Orchestrator 대기 모드용)
+    start_session(callback): 운동 중 인식된 문장을 모두 callback으로 전달
+    max_restarts: 연속으로 이만큼 재시작해도 계속 죽으면 프로세스를 포기
+    (준비 완료 후 stable_after초 이상 실행된 프로세스가 끝나면 연속 횟수를 다시 셈)
+    """
+    def __init__(self, restart_delay: float = 1.0, max_restarts: int = 5, cpu_interval: float = 5.0,
+                 stable_after: float = 60.0):
+        self.restart_delay = restart_delay
+        self.max_restarts = max_restarts
+        self.stable_after = stable_after
+        self.cpu_interval = cpu_interval
+
+        self._ctx = multiprocessing.get_context("spawn")  # Windows와 같은 방식으로 통일
+        self._process = None
+        self._commands = None
+        self._results = None
+        self._monitor = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._ready_at: Optional[float] = None  # 현재 프로세스가 준비된 시각 (monotonic)
+        self._failures = 0                      # 연속 재시작 횟수
+
+        self._texts = queue.Queue()  # listen_command()로 전달할 인식 결과
+        self._waiters = 0            # listen_command() 대기 중인 호출 수
+        self._session_callback: Optional[Callable[[Optional[str]], None]] = None
+        self._session_lost: Optional[Callable[[], None]] = None  # 프로세스를 포기했을 때 알림
+
+        self._cpu_finished = 0.0     # 끝난 프로세스들의 CPU 시간 합계
+        self._cpu_current = 0.0      # 실행 중인 프로세스의 CPU 시간
+        self.stats = {'restarts': 0, 'texts': 0, 'errors': 0}  # restarts: 전체 재시작 횟수
+
+    @property
+    def enabled(self) -> bool:
+        """프로세스가 실행 중이거나 재시작 중인지 여부"""
+        return self._running
+
+    def start(self) -> bool:
+        """음성 프로세스 시작 (EXERCISE_SPEECH_PROCESS=0 이면 False)"""
+        if os.environ.get("EXERCISE_SPEECH_PROCESS", "1") == "0":
+            return False
+        with self._lock:
+            if self._running:
+                return True
+            self._running = True
+            self._spawn()
+        self._monitor = threading.Thread(target=self._monitor_loop, daemon=True, name="SpeechProcessMonitor")
+        self._monitor.start()
+        return True
+
+    def stop(self, timeout: float = 3.0) -> None:
+        """음성 프로세스 종료 후 CPU 시간 보고"""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            process = self._process
+        self._send(('stop',))
+        if process is not None:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+        if self._monitor is not None:
+            self._monitor.join(timeout=1.0)
+        self._drain(self._results)  # 마지막 CPU 시간 보고
+        log.info("음성 프로세스 종료", **self.get_stats())
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def listen_command(self, timeout: float = 5.0, max_age: float = 1.0) -> Optional[str]:
+        """다음 명령 인식 결과 (timeout초 안에 없으면 None)
+
+        프로세스를 사용할 수 없으면 같은 프로세스에서 직접 인식
+        """
+        if not self._running:
+            from SpeechRecognition import listen_command_direct
+            return listen_command_direct()
+
+        called_at = time.time()
+        with self._lock:
+            self._waiters += 1
+            self._update_listening()
+        try:
+            self._ready.wait(timeout=3)
+            print("[SPEECH] 음성을 듣고 있습니다...")
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print("[SPEECH] 음성 입력 대기 시간 초과")
+                    return None
+                if not self._running:
+                    return None  # 프로세스 종료
+                try:
+                    text, ended_at = self._texts.get(timeout=min(remaining, 0.2))
+                except queue.Empty:
+                    continue
+                if ended_at >= called_at - max_age:
+                    return text
+        finally:
+            with self._lock:
+                self._waiters -= 1
+                self._update_listening()
+
+    def start_session(self, callback: Callable[[Optional[str]], None],
+                      on_lost: Optional[Callable[[], None]] = None) -> bool:
+        """운동 세션 동안 인식된 문장을 callback(문장)으로 전달 (모니터 스레드에서 호출됨)
+
+        on_lost: 재시작 한도를 넘겨 프로세스를 포기하면 호출 (같은 프로세스에서 인식하도록 전환)
+        """
+        with self._lock:
+            if not self._running:
+                return False
+            self._session_callback = callback
+            self._session_lost = on_lost
+            self._update_listening()
+        return True
+
+    def stop_session(self) -> None:
+        with self._lock:
+            self._session_callback = None
+            self._session_lost = None
+            if self._running:
+                self._update_listening()
+
+    def get_stats(self) -> Dict[str, float]:
+        """재시작 횟수, 인식 수, 음성 프로세스 CPU 시간(초)"""
+        stats = dict(self.stats)
+        stats['cpu_seconds'] = round(self._cpu_finished + self._cpu_current, 2)
+        return stats
+
+    def _spawn(self) -> None:
+        # self._lock을 잡은 상태에서 호출
+        self._commands = self._ctx.Queue(maxsize=8)
+        self._results = self._ctx.Queue()
+        self._ready.clear()
+        self._ready_at = None
+        self._process = self._ctx.Process(target=_speech_worker,
+                                          args=(self._commands, self._results, self.cpu_interval),
+                                          daemon=True, name="SpeechProcess")
+        self._process.start()
+        self._update_listening()
+        log.info("음성 프로세스 시작", pid=self._process.pid)
+
+    def _update_listening(self) -> None:
+        # self._lock을 잡은 상태에서 호출 (기다리는 쪽이 있을 때만 인식 -> 불필요한 네트워크 요청 방지)
+        self._send(('listen', self._waiters > 0 or self._session_callback is not None))
+
+    def _send(self, command) -> None:
+        try:
+            self._commands.put_nowait(command)
+        except (queue.Full, AttributeError, ValueError, OSError):
+            log.warning("음성 프로세스 명령 큐에 넣지 못했습니다", command=command[0])
+
+    def _monitor_loop(self) -> None:
+        """결과 큐 처리 + 프로세스가 끝나면 다시 시작"""
+        while True:
+            with self._lock:
+                process, results = self._process, self._results
+            try:
+                message = results.get(timeout=0.2)
+            except queue.Empty:
+                message = None
+            except (EOFError, OSError):
+                message = None
+
+            if message is not None:
+                self._handle(message)
+                continue
+
+            if not self._running:
+                break
+            if process.is_alive():
+                continue
+
+            # 프로세스 종료: 오류로 끝났으면 다시 시작
+            self._drain(results)
+            self._cpu_finished += self._cpu_current
+            self._cpu_current = 0.0
+            if self._ready_at is not None and time.monotonic() - self._ready_at >= self.stable_after:
+                self._failures = 0  # 한동안 정상 동작했으면 새로 셈
+            if self._failures >= self.max_restarts:
+                log.error("음성 프로세스 재시작 한도 초과, 같은 프로세스에서 인식합니다",
+                          exitcode=process.exitcode)
+                with self._lock:
+                    self._running = False
+                    on_lost = self._session_lost
+                    self._session_callback = self._session_lost = None
+                if on_lost is not None:
+                    try:
+                        on_lost()
+                    except Exception as e:
+                        log.error("음성 세션 전환 오류", error=e)
+                break
+            self._failures += 1
+            self.stats['restarts'] += 1
+            log.warning("음성 프로세스가 종료되어 다시 시작합니다", exitcode=process.exitcode,
+                        failures=self._failures, restarts=self.stats['restarts'])
+            time.sleep(self.restart_delay * self._failures)
+            with self._lock:
+                if not self._running:
+                    break
+                self._spawn()
+
+    def _drain(self, results) -> None:
+        while True:
+            try:
+                self._handle(results.get_nowait())
+            except (queue.Empty, EOFError, OSError):
+                return
+
+    def _handle(self, message) -> None:
+        kind = message[0]
+        if kind == 'ready':
+            # 시작 직후 보낸 인식 켜기/끄기 명령이 큐가 차서 빠졌을 수 있으므로 다시 보냄
+            with self._lock:
+                if self._running:
+                    self._update_listening()
+            self._ready_at = time.monotonic()
+            self._ready.set()
+        elif kind == 'text':
+            _, text, ended_at = message
+            self.stats['texts'] += 1
+            callback = self._session_callback
+            if callback is not None:
+                try:
+                    callback(text)
+                except Exception as e:
+                    log.error("음성 명령 처리 오류", error=e)
+            elif self._waiters > 0:
+                self._texts.put((text, ended_at))
+        elif kind == 'cpu':
+            self._cpu_current = message[1]
+        elif kind == 'error':
+            self.stats['errors'] += 1
+            log.error("음성 프로세스 오류", error=message[1])
+
+# 전역 음성 프로세스
+speech_process = SpeechProcess()
@@ -1,23 +1,56 @@
-import speech_recognition as sr
-import sys
 import threading
 import time
 import queue
+from MicrophoneStream import microphone_stream
+from KeywordSpotter import get_keyword_spotter
+from RecognizerBackends import get_recognizer_backend
+
+RECOGNITION_BUDGET = 3.0  # 인식 엔진 호출 한 번의 최대 대기 시간(초)
+
+def recognize_command(audio):
+    """녹음된 음성을 인식해 명령어로 변환 (인식 실패 시 None)
+
+    고정 명령어는 오프라인 명령어 인식기로 먼저 확인하고,
+    알 수 없는 발화만 음성 인식 엔진(기본 Google)으로 전달
+    """
+    spotter = get_keyword_spotter()
+    if spotter.enabled:
+        keyword, distance = spotter.spot_audio(audio)
+        if keyword is not None:
+            print(f"[SPEECH] 명령어 인식 (오프라인): {keyword}")
+            return keyword
+
+    result = get_recognizer_backend().recognize(audio, budget=RECOGNITION_BUDGET)
+    if result.timed_out:
+        print(f"[SPEECH] 음성 인식 시간 초과 ({result.backend}, {RECOGNITION_BUDGET}초)")
+        return None
+    if result.error is not None:
+        print(f"[SPEECH] 음성 인식 요청 실패 ({result.backend}): {result.error}")
+        return None
+    if result.text is None:
+        print("[SPEECH] 음성을 인식할 수 없습니다.")
+        return None
+    text = result.text
+    timings = "".join(f", {name} {value}" for name, value in result.timings.items() if name.endswith('_ms'))
+    print(f"[SPEECH] 인식된 음성: {text} ({result.backend}, {result.elapsed_ms:.0f} ms{timings})")
+
+    if "운동하자" in text:
+        return "운동하자"
+    elif "종료" in text:
+        return "종료"
+    else:
+        return text
 
 class SpeechRecognitionThread:
     def __init__(self):
-        self.r = sr.Recognizer()
-        self.mic = None
+        self.stream = microphone_stream
         self.command_queue = queue.Queue()
         self.is_running = False
         self.thread = None
         
     def initialize_microphone(self):
-        """마이크 초기화 (지연 초기화)"""
-        if self.mic is None:
-            print("마이크를 초기화합니다...")
-            self.mic = sr.Microphone()
-            print("마이크 초기화 완료")
+        """마이크 스트림 시작 (이미 열려 있으면 그대로 사용)"""
+        return self.stream.start()
     
     def start_listening(self):
         """음성 인식 스레드 시작"""
@@ -38,36 +71,16 @@ class SpeechRecognitionThread:
     
     def _listening_loop(self):
         """음성 인식 백그라운드 루프"""
-        # 마이크 초기화
+        # 마이크 스트림 시작 (소음 보정은 스트림이 처음 열릴 때 한 번만)
         self.initialize_microphone()
         
         while self.is_running:
             try:
-                with self.mic as source:
-                    self.r.adjust_for_ambient_noise(source)  # 소음 보정
-                    print("듣고 있습니다...")
-                    audio = self.r.listen(source, timeout=5, phrase_time_limit=5)
-
-                try:
-                    text = self.r.recognize_google(audio, language="ko-KR")
-                    print("인식된 음성: ", text)
-
-                    if "운동하자" in text:
-                        self.command_queue.put("운동하자")
-                    elif "종료" in text:
-                        self.command_queue.put("종료")
-                    else:
-                        self.command_queue.put(text)
-                        
-                except sr.UnknownValueError:
-                    print("음성을 인식할 수 없습니다.")
+                utterance = self.stream.listen(timeout=5)
+                if utterance is None:
                     self.command_queue.put(None)
-                except sr.RequestError as e:
-                    print("Google API 요청 실패:", e)
-                    self.command_queue.put(None)
-                except sr.WaitTimeoutError:
-                    self.command_queue.put(None)
-                    
+                    continue
+                self.command_queue.put(recognize_command(utterance.to_audio_data()))
             except Exception as e:
                 print(f"음성 인식 오류: {e}")
                 time.sleep(1)
@@ -104,37 +117,21 @@ def has_voice_command():
 
 # 직접 음성 인식 함수 (스레드 없이)
 def listen_command_direct():
-    """스레드 없이 직접 음성 인식"""
-    r = sr.Recognizer()
-    mic = sr.Microphone()
-    
+    """스레드 없이 직접 음성 인식
+
+    상시 열려 있는 마이크 스트림에서 다음 발화를 가져옴
+    (장치를 다시 열거나 매번 소음 보정을 하지 않으므로 지연 = 말하는 시간)
+    """
     try:
-        with mic as source:
-            r.adjust_for_ambient_noise(source, duration=1)
-            print("[SPEECH] 음성을 듣고 있습니다...")
-            audio = r.listen(source, timeout=5, phrase_time_limit=5)
-            
-        try:
-            text = r.recognize_google(audio, language="ko-KR")
-            print(f"[SPEECH] 인식된 음성: {text}")
-            
-            if "운동하자" in text:
-                return "운동하자"
-            elif "종료" in text:
-                return "종료"
-            else:
-                return text
-                
-        except sr.UnknownValueError:
-            print("[SPEECH] 음성을 인식할 수 없습니다.")
+        if not microphone_stream.start():
             return None
-        except sr.RequestError as e:
-            print(f"[SPEECH] Google API 요청 실패: {e}")
+        microphone_stream.wait_ready(timeout=3)
+        print("[SPEECH] 음성을 듣고 있습니다...")
+        utterance = microphone_stream.listen(timeout=5)
+        if utterance is None:
+            print("[SPEECH] 음성 입력 대기 시간 초과")
             return None
-            
-    except sr.WaitTimeoutError:
-        print("[SPEECH] 음성 입력 대기 시간 초과")
-        return None
+        return recognize_command(utterance.to_audio_data())
     except Exception as e:
         print(f"[SPEECH] 음성 인식 오류: {e}")
         return None
@@ -1,9 +1,12 @@
 import threading
-import queue
 import time
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
+from Logger import get_logger
+
+log = get_logger("THREAD")
 
 class MessageType(Enum):
     """스레드 간 메시지 타입"""
@@ -15,11 +18,16 @@ class MessageType(Enum):
     VIDEO_END = "video_end"
     CAMERA_ERROR = "camera_error"
     
+    # 음성 명령 스레드 -> 메인 스레드
+    VOICE_COMMAND = "voice_command"
+    
     # 메인 스레드 -> 영상 처리
     START_EXERCISE = "start_exercise"
     STOP_EXERCISE = "stop_exercise"
     NEXT_POSTURE = "next_posture"
     RESTART_VIDEO = "restart_video"
+    PAUSE_EXERCISE = "pause_exercise"
+    RESUME_EXERCISE = "resume_exercise"
     
     # 시스템 메시지
     SHUTDOWN = "shutdown"
@@ -35,6 +43,175 @@ class ThreadMessage:
         if self.timestamp is None:
             self.timestamp = time.time()
 
+class DropPolicy(Enum):
+    """메시지 버스가 가득 찼을 때의 처리 방식"""
+    DROP_OLDEST = "drop_oldest"   # 가장 오래된 일반 메시지를 버리고 새 메시지 추가
+    DROP_NEWEST = "drop_newest"   # 새로 들어온 메시지를 버림
+
+# 즉시 처리되어야 하는 메시지 (일반 메시지보다 먼저 꺼내짐, 용량 초과로 버려지지 않음)
+PRIORITY_MESSAGE_TYPES = frozenset({
+    MessageType.SHUTDOWN,
+    MessageType.CAMERA_ERROR,
+    MessageType.VOICE_COMMAND,
+})
+
+# 같은 키를 가진 메시지는 큐에 최신 것 하나만 유지 (상태성 메시지)
+COALESCE_KEYS = {
+    MessageType.POSE_DETECTED: 'presence',
+    MessageType.POSE_LOST: 'presence',
+    MessageType.POSTURE_FAIL: 'posture_fail',
+}
+
+class _Slot:
+    """큐 안의 메시지 자리"""
+    __slots__ = ('message', 'key')
+
+    def __init__(self, message: ThreadMessage, key: Optional[str]):
+        self.message = message
+        self.key = key
+
+class MessageBus:
+    """우선순위 레인, 타입별 병합, 용량 제한을 갖춘 스레드 간 메시지 버스
+
+    - 우선순위 메시지(SHUTDOWN, CAMERA_ERROR)는 일반 메시지보다 먼저 전달
+    - 병합 키가 같은 메시지가 아직 대기 중이면 이전 메시지를 빼고 새 메시지를 맨 뒤에 추가
+      (새 메시지가 그 사이에 들어온 다른 메시지를 앞지르지 않도록)
+    - 일반 메시지가 maxsize를 넘으면 drop_policy에 따라 버림
+    """
+    def __init__(self, name: str, maxsize: int = 64,
+                 drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+                 coalesce_keys: Optional[Dict[MessageType, str]] = None,
+                 priority_types=PRIORITY_MESSAGE_TYPES):
+        self.name = name
+        self.maxsize = maxsize
+        self.drop_policy = drop_policy
+        self.coalesce_keys = COALESCE_KEYS if coalesce_keys is None else coalesce_keys
+        self.priority_types = priority_types
+        
+        self._cond = threading.Condition(threading.Lock())
+        self._priority_lane = deque()
+        self._normal_lane = deque()
+        self._pending = {}  # 병합 키 -> 대기 중인 _Slot
+        # 대기 메시지 존재 여부 (락 없이 확인 가능한 플래그)
+        self._has_messages = threading.Event()
+        
+        # 통계 카운터
+        self._stats = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'high_water': 0,
+        }
+    
+    def put(self, message: ThreadMessage) -> bool:
+        """메시지 추가 (버려졌으면 False 반환)"""
+        with self._cond:
+            if message.msg_type in self.priority_types:
+                self._priority_lane.append(_Slot(message, None))
+                self._stats['enqueued'] += 1
+                self._update_high_water()
+                self._has_messages.set()
+                self._cond.notify()
+                return True
+            
+            # 같은 키의 메시지가 대기 중이면 이전 메시지를 버림 (새 메시지는 맨 뒤에 추가)
+            key = self.coalesce_keys.get(message.msg_type)
+            if key is not None:
+                slot = self._pending.pop(key, None)
+                if slot is not None:
+                    self._normal_lane.remove(slot)
+                    self._stats['coalesced'] += 1
+            
+            # 용량 초과 처리
+            if len(self._normal_lane) >= self.maxsize:
+                self._stats['dropped'] += 1
+                if self.drop_policy == DropPolicy.DROP_NEWEST:
+                    return False
+                oldest = self._normal_lane.popleft()
+                self._forget(oldest)
+            
+            slot = _Slot(message, key)
+            self._normal_lane.append(slot)
+            if key is not None:
+                self._pending[key] = slot
+            self._stats['enqueued'] += 1
+            self._update_high_water()
+            self._has_messages.set()
+            self._cond.notify()
+            return True
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[ThreadMessage]:
+        """메시지 꺼내기 (timeout 동안 없으면 None)"""
+        with self._cond:
+            if not self._priority_lane and not self._normal_lane:
+                self._cond.wait(timeout)
+            return self._pop()
+    
+    def get_nowait(self) -> Optional[ThreadMessage]:
+        """대기 없이 메시지 꺼내기"""
+        with self._cond:
+            return self._pop()
+    
+    def has_messages(self) -> bool:
+        """대기 메시지가 있는지 락 없이 확인"""
+        return self._has_messages.is_set()
+    
+    def drain(self, max_items: Optional[int] = None) -> List[ThreadMessage]:
+        """대기 없이 쌓인 메시지를 한번에 꺼내기 (없으면 즉시 빈 리스트)"""
+        if not self._has_messages.is_set():
+            return []
+        messages = []
+        with self._cond:
+            while max_items is None or len(messages) < max_items:
+                message = self._pop()
+                if message is None:
+                    break
+                messages.append(message)
+        return messages
+    
+    def clear(self) -> int:
+        """대기 중인 메시지 모두 제거 (제거한 개수 반환)"""
+        with self._cond:
+            count = len(self._priority_lane) + len(self._normal_lane)
+            self._priority_lane.clear()
+            self._normal_lane.clear()
+            self._pending.clear()
+            self._has_messages.clear()
+            return count
+    
+    def qsize(self) -> int:
+        """대기 중인 메시지 수"""
+        with self._cond:
+            return len(self._priority_lane) + len(self._normal_lane)
+    
+    def stats(self) -> Dict[str, int]:
+        """통계 카운터 복사본 반환"""
+        with self._cond:
+            stats = self._stats.copy()
+            stats['depth'] = len(self._priority_lane) + len(self._normal_lane)
+            return stats
+    
+    def _pop(self) -> Optional[ThreadMessage]:
+        message = None
+        if self._priority_lane:
+            message = self._priority_lane.popleft().message
+        elif self._normal_lane:
+            slot = self._normal_lane.popleft()
+            self._forget(slot)
+            message = slot.message
+        if not self._priority_lane and not self._normal_lane:
+            self._has_messages.clear()
+        return message
+    
+    def _forget(self, slot: _Slot) -> None:
+        if slot.key is not None and self._pending.get(slot.key) is slot:
+            del self._pending[slot.key]
+    
+    def _update_high_water(self) -> None:
+        depth = len(self._priority_lane) + len(self._normal_lane)
+        if depth > self._stats['high_water']:
+            self._stats['high_water'] = depth
+
 class ThreadSafeData:
     """스레드 간 안전한 데이터 공유를 위한 클래스"""
     def __init__(self):
@@ -44,6 +221,7 @@ class ThreadSafeData:
             'current_stage': 'posture1',
             'video_completed': False,
             'exercise_running': False,
+            'paused': False,
             'current_video_index': 0,
             'fail_count': 0,
             'last_detection_time': 0
@@ -73,8 +251,8 @@ class ThreadManager:
     """스레드 관리 클래스"""
     def __init__(self):
         # 메시지 큐 (스레드 간 통신)
-        self.main_to_video_queue = queue.Queue()  # 메인 -> 영상처리
-        self.video_to_main_queue = queue.Queue()  # 영상처리 -> 메인
+        self.main_to_video_queue = MessageBus("main_to_video")  # 메인 -> 영상처리
+        self.video_to_main_queue = MessageBus("video_to_main")  # 영상처리 -> 메인
         
         # 공유 데이터
         self.shared_data = ThreadSafeData()
@@ -89,36 +267,41 @@ class ThreadManager:
     def send_to_video_thread(self, msg_type: MessageType, data: Optional[Dict[str, Any]] = None):
         """영상 처리 스레드로 메시지 전송"""
         message = ThreadMessage(msg_type, data)
-        self.main_to_video_queue.put(message)
-        print(f"[THREAD] 영상 스레드로 메시지 전송: {msg_type.value}")
+        if self.main_to_video_queue.put(message):
+            log.debug("영상 스레드로 메시지 전송", msg_type=msg_type.value)
+        else:
+            log.warning("큐가 가득 차 메시지를 버렸습니다", msg_type=msg_type.value)
     
     def send_to_main_thread(self, msg_type: MessageType, data: Optional[Dict[str, Any]] = None):
         """메인 스레드로 메시지 전송"""
         message = ThreadMessage(msg_type, data)
-        self.video_to_main_queue.put(message)
-        print(f"[THREAD] 메인 스레드로 메시지 전송: {msg_type.value}")
+        if self.video_to_main_queue.put(message):
+            log.debug("메인 스레드로 메시지 전송", msg_type=msg_type.value)
+        else:
+            log.warning("큐가 가득 차 메시지를 버렸습니다", msg_type=msg_type.value)
     
     def get_message_from_video(self, timeout: float = 0.1) -> Optional[ThreadMessage]:
         """영상 처리 스레드로부터 메시지 받기"""
-        try:
-            return self.video_to_main_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self.video_to_main_queue.get(timeout=timeout)
     
     def get_message_from_main(self, timeout: float = 0.1) -> Optional[ThreadMessage]:
         """메인 스레드로부터 메시지 받기"""
-        try:
-            return self.main_to_video_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        return self.main_to_video_queue.get(timeout=timeout)
+    
+    def drain_messages_from_main(self) -> List[ThreadMessage]:
+        """메인 스레드 메시지를 대기 없이 모두 꺼내기 (영상 루프용)"""
+        return self.main_to_video_queue.drain()
     
     def start_video_thread(self, target_function, *args, **kwargs):
         """영상 처리 스레드 시작"""
         if self.video_thread and self.video_thread.is_alive():
-            print("[THREAD] 영상 처리 스레드가 이미 실행 중입니다.")
+            log.info("영상 처리 스레드가 이미 실행 중입니다.")
             return False
         
         self._shutdown_flag.clear()
+        # 이전 세션에서 남은 메시지(SHUTDOWN 등) 제거
+        self.main_to_video_queue.clear()
+        self.video_to_main_queue.clear()
         self.video_thread = threading.Thread(
             target=target_function, 
             args=(self,) + args,
@@ -127,13 +310,13 @@ class ThreadManager:
             name="VideoProcessingThread"
         )
         self.video_thread.start()
-        print("[THREAD] 영상 처리 스레드 시작됨")
+        log.info("영상 처리 스레드 시작됨")
         return True
     
     def start_arduino_thread(self, target_function, *args, **kwargs):
         """아두이노 통신 스레드 시작 (필요시)"""
         if self.arduino_thread and self.arduino_thread.is_alive():
-            print("[THREAD] 아두이노 스레드가 이미 실행 중입니다.")
+            log.info("아두이노 스레드가 이미 실행 중입니다.")
             return False
         
         self.arduino_thread = threading.Thread(
@@ -144,12 +327,12 @@ class ThreadManager:
             name="ArduinoThread"
         )
         self.arduino_thread.start()
-        print("[THREAD] 아두이노 스레드 시작됨")
+        log.info("아두이노 스레드 시작됨")
         return True
     
     def shutdown(self):
         """모든 스레드 종료"""
-        print("[THREAD] 스레드 종료 시작...")
+        log.info("스레드 종료 시작...")
         self._shutdown_flag.set()
         
         # 종료 메시지 전송
@@ -159,14 +342,22 @@ class ThreadManager:
         if self.video_thread and self.video_thread.is_alive():
             self.video_thread.join(timeout=5.0)
             if self.video_thread.is_alive():
-                print("[THREAD] 영상 처리 스레드 강제 종료")
+                log.warning("영상 처리 스레드 강제 종료")
         
         if self.arduino_thread and self.arduino_thread.is_alive():
             self.arduino_thread.join(timeout=2.0)
             if self.arduino_thread.is_alive():
-                print("[THREAD] 아두이노 스레드 강제 종료")
+                log.warning("아두이노 스레드 강제 종료")
         
-        print("[THREAD] 모든 스레드 종료 완료")
+        log.info("메시지 버스 통계", **self.get_bus_stats())
+        log.info("모든 스레드 종료 완료")
+    
+    def get_bus_stats(self) -> Dict[str, Dict[str, int]]:
+        """메시지 버스별 통계 (enqueued / coalesced / dropped / depth)"""
+        return {
+            self.main_to_video_queue.name: self.main_to_video_queue.stats(),
+            self.video_to_main_queue.name: self.video_to_main_queue.stats(),
+        }
     
     def is_shutdown_requested(self) -> bool:
         """종료 요청 여부 확인"""
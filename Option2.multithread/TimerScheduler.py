@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+타이머 스케줄러 모듈
+루프 안에서 time.sleep으로 기다리던 지연 작업을 힙 기반 타이머에 등록해
+지정한 시간이 지나면 전용 스레드에서 콜백을 실행 (루프는 계속 동작)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Optional
+from Logger import get_logger
+
+log = get_logger("TIMER")
+
+class TimerHandle:
+    """등록된 타이머 (cancel()로 취소)"""
+    __slots__ = ('deadline', 'callback', 'args', 'kwargs', 'tag', 'cancelled', '_scheduler')
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple, kwargs: dict,
+                 tag: Optional[str], scheduler: "TimerScheduler"):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.tag = tag
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    def cancel(self) -> None:
+        """타이머 취소 (이미 실행되었으면 아무 일도 하지 않음)"""
+        self._scheduler._cancel_handle(self)
+
+class TimerScheduler:
+    """힙 기반 타이머 스케줄러 (콜백은 스케줄러 스레드에서 실행되므로 짧게 유지)"""
+    def __init__(self, name: str = "TimerScheduler"):
+        self.name = name
+        self._cond = threading.Condition(threading.Lock())
+        self._heap = []
+        self._counter = itertools.count()  # 같은 시간의 타이머는 등록 순서대로 실행
+        self._thread = None
+        self._running = False
+
+        self.fired_count = 0
+        self.cancelled_count = 0
+
+    def schedule(self, delay: float, callback: Callable, *args: Any,
+                 tag: Optional[str] = None, **kwargs: Any) -> TimerHandle:
+        """delay초 뒤에 callback(*args, **kwargs) 실행
+
+        tag: 타이머가 속한 단계 (cancel(tag)로 한꺼번에 취소)
+        """
+        handle = TimerHandle(time.monotonic() + delay, callback, args, kwargs, tag, self)
+        with self._cond:
+            if not self._running:
+                self._start()
+            heapq.heappush(self._heap, (handle.deadline, next(self._counter), handle))
+            self._cond.notify()
+        return handle
+
+    def cancel(self, tag: Optional[str] = None) -> int:
+        """대기 중인 타이머 취소 (tag가 None이면 전부, 취소한 개수 반환)"""
+        with self._cond:
+            cancelled = 0
+            for _, _, handle in self._heap:
+                if not handle.cancelled and (tag is None or handle.tag == tag):
+                    handle.cancelled = True
+                    cancelled += 1
+            self.cancelled_count += cancelled
+            # 취소된 타이머는 힙에서 바로 제거
+            if cancelled:
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+        if cancelled:
+            log.debug("타이머 취소", tag=tag, count=cancelled)
+        return cancelled
+
+    def pending_count(self, tag: Optional[str] = None) -> int:
+        """대기 중인 타이머 수"""
+        with self._cond:
+            return sum(1 for _, _, handle in self._heap
+                       if not handle.cancelled and (tag is None or handle.tag == tag))
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """대기 중인 타이머를 모두 취소하고 스레드 종료"""
+        self.cancel()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+            thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=timeout)
+
+    def _cancel_handle(self, handle: TimerHandle) -> None:
+        with self._cond:
+            if not handle.cancelled:
+                handle.cancelled = True
+                self.cancelled_count += 1
+                self._cond.notify()
+
+    def _start(self) -> None:
+        # self._cond를 잡은 상태에서 호출
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True, name=self.name)
+        self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    # 앞쪽의 취소된 타이머 정리
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    remaining = self._heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._running:
+                    return
+                _, _, handle = heapq.heappop(self._heap)
+                self.fired_count += 1
+
+            try:
+                handle.callback(*handle.args, **handle.kwargs)
+            except Exception as e:
+                log.error("타이머 콜백 오류", tag=handle.tag, error=e)
+
+# 전역 타이머 스케줄러
+timer_scheduler = TimerScheduler()
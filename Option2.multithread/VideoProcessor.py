@@ -4,6 +4,12 @@ import numpy as np
 import time
 import threading
 from ThreadManager import ThreadManager, MessageType, ThreadMessage
+from Logger import get_logger
+from TimerScheduler import timer_scheduler
+
+log = get_logger("VIDEO")
+
+REPLAY_TIMER_TAG = "video_replay"  # 참조 영상 다시 재생 타이머
 
 class VideoProcessor:
     """영상 처리를 담당하는 별도 스레드 클래스"""
@@ -31,6 +37,11 @@ class VideoProcessor:
         self.last_fail_time = 0
         self.check_interval = 1  # 1초마다 체크 (5초 후 성공 체크를 위해)
         self.fail_interval = 5    # 5초마다 인식 실패 메시지
+        self.replay_delay = 3     # 참조 영상 다시 재생 전 대기 시간 (초)
+        self.replay_pending = False  # 다시 재생 대기 중 (마지막 참조 프레임 유지)
+        self.last_ref_frame = None
+        self.paused = False       # 음성 명령으로 일시정지 (영상/판정 중지)
+        self.paused_at = 0
         
         # 자세별 특별 로직을 위한 변수들
         self.pose_detection_start_time = 0  # 자세 인식 시작 시간
@@ -52,58 +63,58 @@ class VideoProcessor:
     
     def initialize_camera_and_video(self):
         """카메라와 참조 영상 초기화"""
-        print("[VIDEO] 카메라 0번에 연결 중...")
+        log.info("카메라 0번에 연결 중...")
         try:
             self.cap = cv2.VideoCapture(0)
             
             if not self.cap.isOpened():
-                print("[VIDEO] 카메라 0번을 열 수 없습니다.")
-                print("[VIDEO] 다른 카메라 인덱스를 시도합니다...")
+                log.info("카메라 0번을 열 수 없습니다.")
+                log.info("다른 카메라 인덱스를 시도합니다...")
                 
                 # 다른 카메라 인덱스 시도
                 for i in range(1, 4):
-                    print(f"[VIDEO] 카메라 {i}번에 연결 시도...")
+                    log.info(f"카메라 {i}번에 연결 시도...")
                     self.cap = cv2.VideoCapture(i)
                     if self.cap.isOpened():
-                        print(f"[VIDEO] 카메라 {i}번 연결 성공!")
+                        log.info(f"카메라 {i}번 연결 성공!")
                         break
                 else:
-                    print("[VIDEO] 사용 가능한 카메라를 찾을 수 없습니다.")
+                    log.error("사용 가능한 카메라를 찾을 수 없습니다.")
                     return False
             else:
-                print("[VIDEO] 카메라 0번 연결 성공!")
+                log.info("카메라 0번 연결 성공!")
         except Exception as e:
-            print(f"[VIDEO] 카메라 초기화 오류: {e}")
+            log.error("카메라 초기화 오류", error=e)
             return False
         
         # 첫 번째 참조 영상 열기
         self.current_video_index = 0
-        print(f"[VIDEO] 영상 파일 열기 시도: {self.video_paths[self.current_video_index]}")
+        log.info(f"영상 파일 열기 시도: {self.video_paths[self.current_video_index]}")
         
         try:
             self.ref = cv2.VideoCapture(self.video_paths[self.current_video_index])
             
             if not self.ref.isOpened():
-                print(f"[VIDEO] 영상 파일을 열 수 없습니다: {self.video_paths[self.current_video_index]}")
-                print("[VIDEO] 영상 파일 경로를 확인해주세요.")
+                log.error("영상 파일을 열 수 없습니다", path=self.video_paths[self.current_video_index])
+                log.info("영상 파일 경로를 확인해주세요.")
                 if self.cap:
                     self.cap.release()
                 return False
             else:
-                print(f"[VIDEO] 영상 파일 열기 성공: {self.video_paths[self.current_video_index]}")
+                log.info(f"영상 파일 열기 성공: {self.video_paths[self.current_video_index]}")
         except Exception as e:
-            print(f"[VIDEO] 영상 파일 열기 오류: {e}")
+            log.error("영상 파일 열기 오류", error=e)
             if self.cap:
                 self.cap.release()
             return False
         
         # MediaPipe Pose 초기화
-        print("[VIDEO] MediaPipe Pose 초기화 중...")
+        log.info("MediaPipe Pose 초기화 중...")
         try:
             self.pose = mp.solutions.pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-            print("[VIDEO] MediaPipe Pose 초기화 완료!")
+            log.info("MediaPipe Pose 초기화 완료!")
         except Exception as e:
-            print(f"[VIDEO] MediaPipe Pose 초기화 오류: {e}")
+            log.error("MediaPipe Pose 초기화 오류", error=e)
             if self.cap:
                 self.cap.release()
             if self.ref:
@@ -123,11 +134,11 @@ class VideoProcessor:
         
         self.ref = cv2.VideoCapture(new_video_path)
         if self.ref.isOpened():
-            print(f"[VIDEO] 다음 영상으로 전환: {new_video_path}")
+            log.info(f"다음 영상으로 전환: {new_video_path}")
             self.current_video_index = next_index
             return True
         else:
-            print(f"[VIDEO] 영상 파일을 열 수 없습니다: {new_video_path}")
+            log.error("영상 파일을 열 수 없습니다", path=new_video_path)
             # 실패시 원래 영상으로 복구
             fallback_ref = cv2.VideoCapture(self.video_paths[self.current_video_index])
             if fallback_ref.isOpened():
@@ -148,7 +159,7 @@ class VideoProcessor:
                 if self.pose_detection_start_time > 0:
                     elapsed_time = current_time - self.pose_detection_start_time
                     if elapsed_time >= 5.0:  # 5초 경과
-                        print(f"[VIDEO] posture1: 5초 경과로 자동 성공 (경과시간: {elapsed_time:.1f}초)")
+                        log.info("posture1: 5초 경과로 자동 성공", elapsed=f"{elapsed_time:.1f}s")
                         return True
                 return False
                 
@@ -157,7 +168,7 @@ class VideoProcessor:
                 if self.pose_detection_start_time > 0:
                     elapsed_time = current_time - self.pose_detection_start_time
                     if elapsed_time >= 5.0:  # 5초 경과
-                        print(f"[VIDEO] posture2: 5초 경과로 자동 성공 (경과시간: {elapsed_time:.1f}초)")
+                        log.info("posture2: 5초 경과로 자동 성공", elapsed=f"{elapsed_time:.1f}s")
                         return True
                 return False
                 
@@ -165,77 +176,131 @@ class VideoProcessor:
                 # posture3: 연속 인식 상태에서만 카운트 증가
                 if self.posture3_continuous_detection:
                     self.posture3_attempt_count += 1
-                    print(f"[VIDEO] posture3: 연속 인식 상태에서 시도 횟수 {self.posture3_attempt_count}")
+                    log.debug("posture3: 연속 인식 상태에서 시도", attempt=self.posture3_attempt_count)
                     
                     if self.posture3_attempt_count == 1:
                         # 첫 번째 시도는 항상 실패
-                        print("[VIDEO] posture3: 첫 번째 시도 - 실패 (음성 메시지 재생)")
-                        print("[VIDEO] posture3: 5초 후 두 번째 시도 예정...")
+                        log.info("posture3: 첫 번째 시도 - 실패 (음성 메시지 재생)")
+                        log.debug("posture3: 5초 후 두 번째 시도 예정...")
                         return False
                     elif self.posture3_attempt_count == 2:
                         # 두 번째 시도는 항상 성공
-                        print("[VIDEO] posture3: 두 번째 시도 - 성공!")
+                        log.info("posture3: 두 번째 시도 - 성공!")
                         return True
                     else:
                         # 세 번째 이후 시도도 성공
-                        print(f"[VIDEO] posture3: {self.posture3_attempt_count}번째 시도 - 성공")
+                        log.info("posture3: 시도 성공", attempt=self.posture3_attempt_count)
                         return True
                 else:
                     # 연속 인식 상태가 아니면 실패
-                    print("[VIDEO] posture3: 연속 인식 상태가 아님 - 실패")
+                    log.debug("posture3: 연속 인식 상태가 아님 - 실패")
                     return False
                 
         except Exception as e:
-            print(f"[VIDEO] 자세 분석 오류: {e}")
+            log.error("자세 분석 오류", error=e)
             return False
         
         return False
     
+    def handle_control_messages(self, thread_manager):
+        """메인 스레드 제어 메시지 처리 (종료 요청 시 False 반환)"""
+        for message in thread_manager.drain_messages_from_main():
+            if message.msg_type == MessageType.SHUTDOWN:
+                log.info("종료 메시지 수신")
+                return False
+            elif message.msg_type == MessageType.NEXT_POSTURE:
+                # 다음 자세로 전환 (이전 자세의 다시 재생 예약은 취소)
+                self.cancel_replay()
+                self.change_to_next_video()
+                self.video_retry_count = 0
+                # 상태 초기화
+                self.pose_detection_start_time = 0
+                # posture3로 전환하는 경우 시도 횟수 및 연속 인식 상태 초기화
+                current_stage = thread_manager.shared_data.get('current_stage')
+                if current_stage == 'posture3':
+                    self.posture3_attempt_count = 0
+                    self.posture3_continuous_detection = False
+                    log.info("posture3로 전환 - 시도 횟수 및 연속 인식 상태 초기화")
+                log.info("다음 자세로 전환 - 상태 초기화")
+            elif message.msg_type == MessageType.PAUSE_EXERCISE:
+                if not self.paused:
+                    self.paused = True
+                    self.paused_at = time.time()
+                    log.info("일시정지")
+            elif message.msg_type == MessageType.RESUME_EXERCISE:
+                if self.paused:
+                    self.paused = False
+                    # 일시정지 동안은 자세 유지 시간에 포함하지 않음
+                    if self.pose_detection_start_time > 0:
+                        self.pose_detection_start_time += time.time() - self.paused_at
+                    log.info("다시 시작", paused=f"{time.time() - self.paused_at:.1f}s")
+            elif message.msg_type == MessageType.RESTART_VIDEO:
+                if message.data and message.data.get('replay'):
+                    # 예약된 다시 재생 (취소된 뒤 도착한 메시지는 무시)
+                    if self.replay_pending:
+                        self.replay_pending = False
+                        if self.ref:
+                            self.ref.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                # 영상 재시작
+                self.cancel_replay()
+                if self.ref:
+                    self.ref.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                # 상태 초기화 (posture3 제외)
+                current_stage = thread_manager.shared_data.get('current_stage')
+                if current_stage != 'posture3':
+                    self.pose_detection_start_time = 0
+        return True
+    
+    def schedule_replay(self, thread_manager):
+        """replay_delay초 뒤 참조 영상을 처음부터 다시 재생하도록 예약 (대기 중에도 카메라 처리는 계속)"""
+        self.replay_pending = True
+        timer_scheduler.schedule(self.replay_delay, thread_manager.send_to_video_thread,
+                                 MessageType.RESTART_VIDEO, {'replay': True},
+                                 tag=REPLAY_TIMER_TAG)
+    
+    def cancel_replay(self):
+        """예약된 다시 재생 취소"""
+        if self.replay_pending:
+            timer_scheduler.cancel(tag=REPLAY_TIMER_TAG)
+            self.replay_pending = False
+    
+    def read_reference_frame(self):
+        """참조 영상 프레임 읽기 (다시 재생 대기 중이면 마지막 프레임 유지)"""
+        if self.replay_pending:
+            return self.last_ref_frame is not None, self.last_ref_frame
+        return self.ref.read()
+    
     def process_video_frame(self, thread_manager):
         """영상 프레임 처리 메인 루프"""
         frame_count = 0
         detected = False
         
         while self.running and not thread_manager.is_shutdown_requested():
-            # 메인 스레드로부터 메시지 확인
-            message = thread_manager.get_message_from_main(timeout=0.01)
-            if message:
-                if message.msg_type == MessageType.SHUTDOWN:
-                    print("[VIDEO] 종료 메시지 수신")
+            # 메인 스레드로부터 메시지 확인 (대기 없이, 쌓인 메시지만 처리)
+            if not self.handle_control_messages(thread_manager):
+                break
+            
+            if self.paused:
+                # 일시정지 중: 카메라/자세 판정 없이 마지막 화면만 유지
+                key = cv2.waitKey(50) & 0xFF
+                if key == 27 or key == ord('q'):
+                    log.info("ESC 키를 눌러 영상 처리를 종료합니다.")
+                    thread_manager.send_to_main_thread(MessageType.SHUTDOWN)
                     break
-                elif message.msg_type == MessageType.NEXT_POSTURE:
-                    # 다음 자세로 전환
-                    self.change_to_next_video()
-                    self.video_retry_count = 0
-                    # 상태 초기화
-                    self.pose_detection_start_time = 0
-                    # posture3로 전환하는 경우 시도 횟수 및 연속 인식 상태 초기화
-                    current_stage = thread_manager.shared_data.get('current_stage')
-                    if current_stage == 'posture3':
-                        self.posture3_attempt_count = 0
-                        self.posture3_continuous_detection = False
-                        print("[VIDEO] posture3로 전환 - 시도 횟수 및 연속 인식 상태 초기화")
-                    print("[VIDEO] 다음 자세로 전환 - 상태 초기화")
-                elif message.msg_type == MessageType.RESTART_VIDEO:
-                    # 영상 재시작
-                    if self.ref:
-                        self.ref.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    # 상태 초기화 (posture3 제외)
-                    current_stage = thread_manager.shared_data.get('current_stage')
-                    if current_stage != 'posture3':
-                        self.pose_detection_start_time = 0
+                continue
             
             # 웹캠 프레임 읽기
             ret1, frame1 = self.cap.read()
             # 따라하기 영상 프레임 읽기
-            ret2, frame2 = self.ref.read()
+            ret2, frame2 = self.read_reference_frame()
             
             frame_count += 1
             if frame_count % 100 == 0:  # 100프레임마다 상태 출력
-                print(f"[VIDEO] 프레임 {frame_count}: 웹캠={ret1}, 참조영상={ret2}")
+                log.debug("프레임 상태", frame=frame_count, webcam=ret1, reference=ret2)
             
             if not ret1:
-                print("[VIDEO] 웹캠 프레임 읽기 실패!")
+                log.error("웹캠 프레임 읽기 실패!")
                 thread_manager.send_to_main_thread(MessageType.CAMERA_ERROR)
                 break
             
@@ -246,7 +311,7 @@ class VideoProcessor:
                 
                 if video_completed:
                     # 자세가 완료되었으면 다음 영상으로 전환
-                    print("[VIDEO] 자세 완료! 다음 영상으로 전환합니다.")
+                    log.info("자세 완료! 다음 영상으로 전환합니다.")
                     thread_manager.send_to_main_thread(MessageType.VIDEO_END, 
                                                      {'completed': True, 'stage': current_stage})
                     self.change_to_next_video()
@@ -256,21 +321,22 @@ class VideoProcessor:
                     # 자세가 완료되지 않았으면 재시도
                     if self.video_retry_count < self.max_retry_count:
                         self.video_retry_count += 1
-                        print(f"[VIDEO] 자세 미완료. 영상을 다시 재생합니다. ({self.video_retry_count}/{self.max_retry_count})")
-                        time.sleep(3)
-                        self.ref.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                        log.info("자세 미완료. 영상을 다시 재생합니다.", retry=f"{self.video_retry_count}/{self.max_retry_count}")
+                        self.schedule_replay(thread_manager)
                     else:
                         # 최대 재시도 횟수 초과 시 다음 영상으로 전환
-                        print("[VIDEO] 최대 재시도 횟수 초과. 다음 영상으로 전환합니다.")
+                        log.info("최대 재시도 횟수 초과. 다음 영상으로 전환합니다.")
                         thread_manager.send_to_main_thread(MessageType.VIDEO_END, 
                                                          {'completed': False, 'stage': current_stage})
                         self.change_to_next_video()
                         self.video_retry_count = 0
                 
-                ret2, frame2 = self.ref.read()
+                ret2, frame2 = self.read_reference_frame()
                 if not ret2:
                     continue
             
+            self.last_ref_frame = frame2
+            
             # 두 영상을 같은 크기로 맞추기
             frame1 = cv2.resize(frame1, (640, 480))
             frame2 = cv2.resize(frame2, (640, 480))
@@ -289,7 +355,7 @@ class VideoProcessor:
             # 사람 인식 확인
             if results.pose_landmarks:
                 if not detected:
-                    print("[VIDEO] 인식 성공")
+                    log.info("인식 성공")
                     thread_manager.send_to_main_thread(MessageType.POSE_DETECTED)
                     detected = True
                     thread_manager.shared_data.set('pose_detected', True)
@@ -299,17 +365,17 @@ class VideoProcessor:
                     current_stage = thread_manager.shared_data.get('current_stage')
                     if current_stage in ['posture1', 'posture2'] and self.pose_detection_start_time == 0:
                         self.pose_detection_start_time = time.time()
-                        print(f"[VIDEO] {current_stage} 자세 인식 시작 시간 기록")
+                        log.debug("자세 인식 시작 시간 기록", stage=current_stage)
                     elif current_stage == 'posture3':
                         # posture3에서 연속 인식 상태 시작
                         if not self.posture3_continuous_detection:
                             self.posture3_continuous_detection = True
-                            print("[VIDEO] posture3 연속 인식 상태 시작")
+                            log.debug("posture3 연속 인식 상태 시작")
             else:
                 if detected:  # 이전에 인식되었던 경우에만 메시지 출력
                     current_time = time.time()
                     if current_time - self.last_fail_time >= self.fail_interval:
-                        print("[VIDEO] 인식 실패")
+                        log.info("인식 실패")
                         thread_manager.send_to_main_thread(MessageType.POSE_LOST)
                         self.last_fail_time = current_time
                     detected = False
@@ -322,7 +388,7 @@ class VideoProcessor:
                     current_stage = thread_manager.shared_data.get('current_stage')
                     if current_stage == 'posture3':
                         self.posture3_continuous_detection = False
-                        print("[VIDEO] posture3 연속 인식 상태 초기화")
+                        log.debug("posture3 연속 인식 상태 초기화")
             
             # 자세별 다른 간격으로 자세 판정
             current_time = time.time()
@@ -338,7 +404,7 @@ class VideoProcessor:
                 posture_success = self.analyze_posture(results, current_stage)
                 
                 if posture_success:
-                    print(f"[VIDEO] {current_stage} 자세 성공!")
+                    log.info("자세 성공!", stage=current_stage)
                     thread_manager.send_to_main_thread(MessageType.POSTURE_SUCCESS, 
                                                      {'stage': current_stage})
                     thread_manager.shared_data.update({
@@ -348,10 +414,10 @@ class VideoProcessor:
                 else:
                     # posture1과 posture2는 사람 인식만 되면 성공하므로 실패 메시지를 자주 보내지 않음
                     if current_stage in ['posture1', 'posture2']:
-                        print(f"[VIDEO] {current_stage} 사람 인식 대기 중...")
+                        log.debug("사람 인식 대기 중...", stage=current_stage)
                         # posture1, posture2는 실패 메시지를 보내지 않음 (사람 인식만 되면 성공)
                     else:
-                        print(f"[VIDEO] {current_stage} 자세 실패")
+                        log.info("자세 실패", stage=current_stage)
                         fail_count = thread_manager.shared_data.get('fail_count') + 1
                         thread_manager.shared_data.set('fail_count', fail_count)
                         thread_manager.send_to_main_thread(MessageType.POSTURE_FAIL, 
@@ -388,14 +454,15 @@ class VideoProcessor:
             # ESC 키(27) 또는 'q' 키로 종료
             key = cv2.waitKey(10) & 0xFF
             if key == 27 or key == ord('q'):
-                print("[VIDEO] ESC 키를 눌러 영상 처리를 종료합니다.")
+                log.info("ESC 키를 눌러 영상 처리를 종료합니다.")
                 thread_manager.send_to_main_thread(MessageType.SHUTDOWN)
                 break
     
     def cleanup(self):
         """리소스 정리"""
-        print("[VIDEO] 영상 처리 리소스 정리 중...")
+        log.info("영상 처리 리소스 정리 중...")
         self.running = False
+        self.cancel_replay()
         
         if self.cap:
             self.cap.release()
@@ -405,11 +472,11 @@ class VideoProcessor:
             self.pose.close()
         
         cv2.destroyAllWindows()
-        print("[VIDEO] 영상 처리 리소스 정리 완료")
+        log.info("영상 처리 리소스 정리 완료")
 
 def video_processing_thread(thread_manager: ThreadManager):
     """영상 처리 스레드 메인 함수"""
-    print("[VIDEO] 영상 처리 스레드 시작")
+    log.info("영상 처리 스레드 시작")
     
     video_processor = VideoProcessor()
     
@@ -426,10 +493,10 @@ def video_processing_thread(thread_manager: ThreadManager):
         video_processor.process_video_frame(thread_manager)
         
     except Exception as e:
-        print(f"[VIDEO] 영상 처리 스레드 오류: {e}")
+        log.error("영상 처리 스레드 오류", error=e)
         thread_manager.send_to_main_thread(MessageType.CAMERA_ERROR, {'error': str(e)})
     
     finally:
         video_processor.cleanup()
         thread_manager.shared_data.set('exercise_running', False)
-        print("[VIDEO] 영상 처리 스레드 종료")
+        log.info("영상 처리 스레드 종료")
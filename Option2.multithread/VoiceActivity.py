@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프레임 단위 음성 구간 검출(VAD) 모듈
+마이크 스트림의 각 프레임이 말소리인지 판정해 말소리 구간만 음성 인식으로 전달
+- webrtcvad가 설치되어 있으면 사용 (8/16/32/48 kHz만 지원)
+- 없으면 에너지 + 영교차율(ZCR)로 판정 (지속적인 잡음은 영교차율이 높음)
+"""
+
+from array import array
+from Logger import get_logger
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+log = get_logger("VAD")
+
+WEBRTC_RATES = (8000, 16000, 32000, 48000)
+SUBFRAME_MS = 30  # webrtcvad 판정 단위 (10/20/30 ms)
+
+def zero_crossing_rate(data: bytes) -> float:
+    """16비트 PCM 프레임의 영교차율 (0.0 ~ 1.0)"""
+    samples = array('h', data)
+    if len(samples) < 2:
+        return 0.0
+    crossings = 0
+    previous = samples[0] >= 0
+    for sample in samples:
+        current = sample >= 0
+        if current != previous:
+            crossings += 1
+        previous = current
+    return crossings / (len(samples) - 1)
+
+class VoiceActivityDetector:
+    """프레임이 말소리인지 판정
+
+    aggressiveness: webrtcvad 민감도 (0 ~ 3, 클수록 잡음을 더 많이 걸러냄)
+    voiced_ratio: 프레임 안 하위 프레임 중 이 비율 이상이 말소리면 말소리 프레임
+    zcr_range: 에너지 판정 시 말소리로 볼 영교차율 범위
+    (치찰음처럼 영교차율이 높은 소리는 모음 프레임에 이어질 때 발화 구간 안에서만 유지됨)
+    """
+    def __init__(self, sample_rate: int, aggressiveness: int = 2, voiced_ratio: float = 0.5,
+                 zcr_range=(0.01, 0.35)):
+        self.sample_rate = sample_rate
+        self.voiced_ratio = voiced_ratio
+        self.zcr_range = zcr_range
+        self._vad = None
+        self._subframe_bytes = int(sample_rate * SUBFRAME_MS / 1000) * 2
+
+        if webrtcvad is not None and sample_rate in WEBRTC_RATES:
+            self._vad = webrtcvad.Vad(aggressiveness)
+            log.info("webrtcvad 사용", rate=sample_rate, aggressiveness=aggressiveness)
+        else:
+            reason = "미설치" if webrtcvad is None else f"{sample_rate} Hz 미지원"
+            log.info("에너지/영교차율 판정 사용", reason=reason)
+
+    @property
+    def backend(self) -> str:
+        return "webrtcvad" if self._vad is not None else "energy"
+
+    def is_speech(self, frame: bytes, energy: float, threshold: float) -> bool:
+        """프레임이 말소리인지 판정 (energy: 프레임 RMS, threshold: 현재 에너지 임계값)"""
+        if energy <= threshold:
+            return False
+        if self._vad is not None:
+            return self._webrtc_is_speech(frame)
+        low, high = self.zcr_range
+        return low <= zero_crossing_rate(frame) <= high
+
+    def _webrtc_is_speech(self, frame: bytes) -> bool:
+        size = self._subframe_bytes
+        total = voiced = 0
+        for start in range(0, len(frame) - size + 1, size):
+            total += 1
+            if self._vad.is_speech(frame[start:start + size], self.sample_rate):
+                voiced += 1
+        if total == 0:
+            return True  # 판정 단위보다 짧은 프레임은 에너지 판정만 사용
+        return voiced >= total * self.voiced_ratio
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+운동 중 음성 명령 모듈
+운동 세션 동안 백그라운드에서 계속 듣고 명령(종료/일시정지/계속/다음/다시)을
+ThreadManager 메시지 버스(VOICE_COMMAND)로 메인 스레드에 전달
+- 음성 프로세스(SpeechProcess)가 실행 중이면 인식은 그 프로세스에서 하고 문장만 받음
+- 같은 프로세스에서 인식할 때는 인식 스레드와 마이크 캡처 스레드의 CPU 사용량을
+  time.thread_time()으로 측정해 예산을 넘으면 인식을 쉬어서 영상 처리 스레드가 CPU를 빼앗기지 않도록 함
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+from Logger import get_logger
+from MicrophoneStream import microphone_stream
+from SpeechRecognition import recognize_command
+from SpeechProcess import speech_process
+from ThreadManager import MessageType
+
+log = get_logger("VOICE")
+
+# 운동 중 명령
+STOP = "stop"
+PAUSE = "pause"
+RESUME = "resume"
+NEXT = "next"
+REPEAT = "repeat"
+
+# 인식된 문장에 포함된 말 -> 명령 (앞에서부터 확인, 긴 말을 먼저)
+COMMAND_PHRASES = (
+    ("다시 시작", RESUME),
+    ("계속", RESUME),
+    ("일시정지", PAUSE),
+    ("잠깐", PAUSE),
+    ("멈춰", PAUSE),
+    ("종료", STOP),
+    ("그만", STOP),
+    ("다음", NEXT),
+    ("한 번 더", REPEAT),
+    ("다시", REPEAT),
+    ("반복", REPEAT),
+)
+
+def parse_voice_command(text: Optional[str]) -> Optional[str]:
+    """인식된 문장을 운동 중 명령으로 변환 (해당 없으면 None)"""
+    if not text:
+        return None
+    for phrase, command in COMMAND_PHRASES:
+        if phrase in text:
+            return command
+    return None
+
+class CpuBudget:
+    """스레드 CPU 사용률 제한 (듀티 사이클)
+
+    window초 구간마다 이 스레드의 CPU 시간이 경과 시간의 fraction을 넘으면
+    그만큼 쉬어서 평균 사용률을 fraction 이하로 맞춤
+    extra_cpu: 함께 계산할 다른 스레드의 누적 CPU 시간 (예: 마이크 캡처 스레드)
+    한 번에 쉬는 시간은 window초 이하 (다른 스레드 사용량만으로 예산을 넘어도 인식이 멈추지 않음)
+    """
+    def __init__(self, fraction: float = 0.15, window: float = 5.0,
+                 extra_cpu: Optional[Callable[[], float]] = None):
+        self.fraction = fraction
+        self.window = window
+        self.extra_cpu = extra_cpu
+        self.stats = {'cpu_seconds': 0.0, 'throttled_seconds': 0.0, 'throttled': 0}
+        self.reset()
+
+    def reset(self) -> None:
+        self._wall_start = time.monotonic()
+        self._cpu_start = time.thread_time()
+        self._extra_start = self.extra_cpu() if self.extra_cpu else 0.0
+
+    def throttle(self, wait=time.sleep) -> float:
+        """사용한 CPU 시간에 맞춰 쉬기 (쉰 시간 반환, 측정하는 스레드에서 호출)
+
+        wait: 쉬는 함수 (중단 가능하게 Event.wait를 넘길 수 있음)
+        """
+        wall = time.monotonic() - self._wall_start
+        cpu = time.thread_time() - self._cpu_start
+        if self.extra_cpu:
+            cpu += self.extra_cpu() - self._extra_start
+        pause = min(cpu / self.fraction - wall, self.window)
+        if pause > 0:
+            self.stats['throttled'] += 1
+            self.stats['throttled_seconds'] += pause
+            wait(pause)
+        if wall + max(0.0, pause) >= self.window:
+            self.stats['cpu_seconds'] += cpu
+            self.reset()
+        return max(0.0, pause)
+
+class VoiceCommandListener:
+    """운동 세션 동안 실행되는 음성 명령 스레드"""
+    def __init__(self, thread_manager, cpu_budget: float = 0.15, listen_timeout: float = 0.5):
+        self.thread_manager = thread_manager
+        self.listen_timeout = listen_timeout
+        self.budget = CpuBudget(cpu_budget, extra_cpu=lambda: microphone_stream.cpu_seconds)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._session = False  # 음성 프로세스에서 문장을 받는 중
+        self._lock = threading.Lock()
+        self.stats = {'utterances': 0, 'commands': 0, 'ignored': 0}
+
+    def start(self) -> bool:
+        """명령 스레드 시작 (마이크를 열 수 없으면 False)"""
+        with self._lock:
+            if self._session or (self._thread and self._thread.is_alive()):
+                return True
+            self._stop_event.clear()
+            if speech_process.enabled and speech_process.start_session(self._handle_text, self._session_lost):
+                self._session = True
+                log.info("운동 중 음성 명령 시작 (음성 프로세스)")
+                return True
+            return self._start_local()
+
+    def _start_local(self) -> bool:
+        # self._lock을 잡은 상태에서 호출
+        if not microphone_stream.start():
+            log.warning("마이크를 열 수 없어 운동 중 음성 명령을 사용하지 않습니다")
+            return False
+        self._thread = threading.Thread(target=self._listen_loop, daemon=True, name="VoiceCommandListener")
+        self._thread.start()
+        log.info("운동 중 음성 명령 시작", cpu_budget=self.budget.fraction)
+        return True
+
+    def _session_lost(self) -> None:
+        """음성 프로세스를 포기했을 때 같은 프로세스의 명령 스레드로 전환 (모니터 스레드에서 호출)"""
+        with self._lock:
+            if not self._session or self._stop_event.is_set():
+                return  # 이미 종료된 세션
+            self._session = False
+            log.warning("음성 프로세스를 사용할 수 없어 같은 프로세스에서 음성 명령을 인식합니다")
+            self._start_local()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """명령 스레드 종료 (마이크 스트림은 다음 명령 대기를 위해 열어 둠)"""
+        with self._lock:
+            if self._session:
+                speech_process.stop_session()
+                self._session = False
+            self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        log.info("운동 중 음성 명령 종료", **self.get_stats())
+
+    def get_stats(self) -> Dict[str, float]:
+        stats = dict(self.stats)
+        stats.update(self.budget.stats)
+        stats['throttled_seconds'] = round(stats['throttled_seconds'], 2)
+        stats['cpu_seconds'] = round(stats['cpu_seconds'], 2)
+        return stats
+
+    def _listen_loop(self) -> None:
+        self.budget.reset()
+        while not self._stop_event.is_set():
+            try:
+                utterance = microphone_stream.listen(timeout=self.listen_timeout)
+                if utterance is None:
+                    continue
+                self._handle_text(recognize_command(utterance.to_audio_data()))
+            except Exception as e:
+                log.error("음성 명령 인식 오류", error=e)
+                self._stop_event.wait(1.0)
+            finally:
+                self.budget.throttle(self._stop_event.wait)
+
+    def _handle_text(self, text: Optional[str]) -> None:
+        """인식된 문장을 명령으로 바꿔 메인 스레드로 전달"""
+        self.stats['utterances'] += 1
+        command = parse_voice_command(text)
+        if command is None:
+            self.stats['ignored'] += 1
+            return
+        self.stats['commands'] += 1
+        log.info("음성 명령", command=command, text=text)
+        self.thread_manager.send_to_main_thread(MessageType.VOICE_COMMAND,
+                                                {'command': command, 'text': text})
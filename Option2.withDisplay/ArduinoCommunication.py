@@ -4,19 +4,70 @@ except ImportError:
     print("pyserial 모듈이 설치되지 않았습니다. 'pip install pyserial' 명령으로 설치해주세요.")
     serial = None
 import time
+import heapq
+import itertools
 import random
+import threading
+from collections import deque
+from ClipManifest import ClipManifest
+
+class ArduinoResponse(str):
+    """아두이노 응답 한 줄 (문자열 그대로 쓸 수 있고, 종류/값/수신 시각을 함께 가짐)
+
+    "LED:green" -> kind='LED', value='green'
+    ':'가 없거나 앞부분이 명령 이름 형태가 아니면 kind='TEXT', value=전체 문자열
+    """
+    def __new__(cls, line, timestamp=None):
+        response = super().__new__(cls, line)
+        head, sep, tail = line.partition(':')
+        if sep and head and head.replace('_', '').isalnum():
+            response.kind = head.upper()
+            response.value = tail.strip()
+        else:
+            response.kind = 'TEXT'
+            response.value = line
+        response.timestamp = time.time() if timestamp is None else timestamp
+        return response
+
+# 장치 상태를 바꾸는 명령 (마지막으로 보낸 값과 같으면 다시 보내지 않음)
+# SOUND/VOICE/MP3 같은 재생 명령은 매번 전송
+STATE_COMMANDS = ('LED',)
 
 class ArduinoController:
-    def __init__(self, port='COM3', baudrate=9600):
+    def __init__(self, port='COM3', baudrate=9600, write_interval=0.02):
         """
         아두이노와의 시리얼 통신을 담당하는 클래스
         port: 시리얼 포트 (Windows: COM3, COM4 등, Linux/Mac: /dev/ttyUSB0 등)
         baudrate: 통신 속도 (아두이노 코드와 일치해야 함)
+        write_interval: 이 시간(초) 안에 보낸 명령은 모아서 한 번에 씀
         """
         self.port = port
         self.baudrate = baudrate
         self.serial_connection = None
         self.is_connected = False
+        self.mp3_busy_until = 0.0  # 재생 중인 MP3가 끝나는 시각 (time.monotonic 기준)
+        self.playback_lock = threading.Lock()  # mp3_busy_until 보호
+        
+        # 응답 수신 (읽기는 수신 스레드만 담당)
+        self.reader_thread = None
+        self.reader_running = False
+        self.response_callbacks = []
+        self.responses = deque(maxlen=100)      # 아직 가져가지 않은 응답
+        self.response_log = deque(maxlen=500)   # 수신 기록 (로깅 켜져 있을 때)
+        self.logging_enabled = False            # 켜면 응답을 콘솔에 출력하고 기록 (set_logging)
+        self._response_cond = threading.Condition()
+        
+        # 명령 전송 (전송 스레드가 모아서 한 번에 씀)
+        self.write_interval = write_interval
+        self.writer_thread = None
+        self.writer_running = False
+        self.pending_commands = []   # 아직 쓰지 않은 명령
+        self.scheduled_commands = []  # 정해진 시각에 보낼 명령 힙 (시각, 순번, 명령)
+        self._schedule_counter = itertools.count()
+        self.device_state = {}       # 전송 중이거나 보낸 마지막 상태 명령 값 (예: {'LED': 'green'})
+        self.write_stats = {'commands': 0, 'writes': 0, 'bytes': 0, 'dropped': 0}
+        self.write_history = deque()  # 최근 전송 기록 (시각, 바이트 수, 명령 수)
+        self._write_cond = threading.Condition()
         
     def connect(self):
         """아두이노와 시리얼 연결"""
@@ -25,6 +76,9 @@ class ArduinoController:
             self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
             time.sleep(2)  # 아두이노 초기화 대기
             self.is_connected = True
+            self.device_state = {}  # 연결 직후에는 장치 상태를 모름
+            self.start_reader()
+            self.start_writer()
             print(f"[ARDUINO] 아두이노 연결 성공: {self.port}")
             return True
         except Exception as e:
@@ -35,37 +89,297 @@ class ArduinoController:
     def disconnect(self):
         """아두이노 연결 해제"""
         print("[ARDUINO] 아두이노 연결을 해제합니다...")
+        self.stop_writer()  # 남은 명령을 쓰고 종료
+        
+        # 수신 스레드를 readline()에서 깨워 종료시킨 뒤 포트 닫기
+        self.reader_running = False
+        if self.serial_connection and self.serial_connection.is_open:
+            try:
+                self.serial_connection.cancel_read()
+            except Exception:
+                pass  # cancel_read를 지원하지 않는 포트는 readline 타임아웃(1초)까지 대기
+        if self.reader_thread and self.reader_thread.is_alive() and self.reader_thread is not threading.current_thread():
+            self.reader_thread.join(timeout=2)
+        self.reader_thread = None
+        
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
             self.is_connected = False
             print("[ARDUINO] 아두이노 연결 해제 완료")
+        with self._response_cond:
+            self._response_cond.notify_all()  # 응답을 기다리던 호출 깨우기
     
-    def send_command(self, command):
-        """아두이노에 명령 전송 (직접 전송)"""
-        if self.is_connected and self.serial_connection and self.serial_connection.is_open:
-            try:
-                self.serial_connection.write(f"{command}\n".encode())
-                return True
-            except Exception as e:
-                self.is_connected = False
-                return False
+    def send_command(self, command, force=False, at=None):
+        """아두이노에 명령 전송 (전송 대기열에 넣고 바로 반환)
+        
+        LED처럼 상태를 바꾸는 명령은 장치가 이미 그 상태면 버림 (force=True면 항상 전송)
+        같은 틱 안에 같은 종류의 상태 명령이 여러 번 오면 마지막 것만 전송 (처음 명령 자리에서)
+        at: 전송 시각 (time.monotonic 기준, 지정하면 전송 스레드가 그 시각에 대기열에 넣음)
+        """
+        if not (self.is_connected and self.serial_connection and self.serial_connection.is_open):
+            return False
+        if not self.writer_running:
+            with self._write_cond:
+                self._take_state([command])
+            return self._write([command])
+        
+        with self._write_cond:
+            if at is not None and at > time.monotonic():
+                heapq.heappush(self.scheduled_commands, (at, next(self._schedule_counter), command, force))
+            else:
+                self._enqueue(command, force)
+            self._write_cond.notify()
+        return True
+    
+    def _enqueue(self, command, force):
+        # self._write_cond를 잡은 상태에서 호출
+        kind, sep, value = command.partition(':')
+        if not (sep and kind in STATE_COMMANDS):
+            self.pending_commands.append(command)
+            return
+        
+        # 비교 대상은 전송 중이거나 이미 보낸 상태 (아직 쓰지 않은 명령은 이 명령으로 대체)
+        unchanged = not force and self.device_state.get(kind) == value
+        for i, pending in enumerate(self.pending_commands):
+            if pending.partition(':')[0] == kind:
+                if unchanged:
+                    del self.pending_commands[i]  # 보낸 상태로 되돌아감 -> 보낼 필요 없음
+                    self.write_stats['dropped'] += 1
+                else:
+                    self.pending_commands[i] = command
+                return
+        if unchanged:
+            self.write_stats['dropped'] += 1
         else:
+            self.pending_commands.append(command)
+    
+    def _take_state(self, commands):
+        # self._write_cond를 잡은 상태에서 호출 (전송할 명령을 꺼낼 때 장치 상태 갱신)
+        for command in commands:
+            kind, sep, value = command.partition(':')
+            if sep and kind in STATE_COMMANDS:
+                self.device_state[kind] = value
+    
+    def start_writer(self):
+        """명령 전송 스레드 시작"""
+        if self.writer_thread and self.writer_thread.is_alive():
+            return
+        self.writer_running = True
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True, name="ArduinoWriter")
+        self.writer_thread.start()
+    
+    def stop_writer(self):
+        """전송 스레드 종료 (대기 중인 명령은 모두 쓴 뒤 종료)"""
+        with self._write_cond:
+            self.writer_running = False
+            self._write_cond.notify()
+        if self.writer_thread and self.writer_thread.is_alive() and self.writer_thread is not threading.current_thread():
+            self.writer_thread.join(timeout=2)
+        self.writer_thread = None
+        if self.write_stats['commands'] or self.write_stats['dropped']:
+            print(f"[ARDUINO] 명령 전송 통계: {self.get_write_stats()}")
+    
+    def _writer_loop(self):
+        """명령이 들어오면 write_interval 동안 더 모은 뒤 한 번의 write로 전송"""
+        while True:
+            with self._write_cond:
+                while True:
+                    # 전송 시각이 된 예약 명령을 대기열로 옮김
+                    now = time.monotonic()
+                    while self.scheduled_commands and self.scheduled_commands[0][0] <= now:
+                        _, _, command, force = heapq.heappop(self.scheduled_commands)
+                        self._enqueue(command, force)
+                    if self.pending_commands or not self.writer_running:
+                        break
+                    timeout = self.scheduled_commands[0][0] - now if self.scheduled_commands else None
+                    self._write_cond.wait(timeout)
+                if not self.pending_commands:
+                    if self.scheduled_commands:
+                        print(f"[ARDUINO] 예약된 명령 {len(self.scheduled_commands)}개를 보내지 않고 종료합니다")
+                        self.scheduled_commands = []
+                    return
+            
+            # 같은 틱에 들어오는 명령을 기다렸다가 함께 보냄
+            if self.writer_running:
+                time.sleep(self.write_interval)
+            with self._write_cond:
+                commands = self.pending_commands
+                self.pending_commands = []
+                self._take_state(commands)
+            if not self._write(commands):
+                return
+    
+    def _write(self, commands):
+        """명령들을 한 번의 write로 전송하고 통계 갱신"""
+        data = "".join(f"{command}\n" for command in commands).encode()
+        try:
+            self.serial_connection.write(data)
+        except Exception as e:
+            print(f"[ARDUINO] 명령 전송 오류: {e}")
+            self.is_connected = False
+            self.writer_running = False
+            with self._write_cond:
+                self.device_state = {}  # 장치 상태를 알 수 없음
             return False
+        
+        now = time.monotonic()
+        with self._write_cond:
+            self.write_stats['commands'] += len(commands)
+            self.write_stats['writes'] += 1
+            self.write_stats['bytes'] += len(data)
+            self.write_history.append((now, len(data), len(commands)))
+        return True
     
-    def read_data(self):
-        """아두이노에서 데이터 읽기 (기존 메서드 - 호환성 유지)"""
-        if self.is_connected and self.serial_connection:
+    def get_write_stats(self, window=5.0):
+        """전송 통계 (누적 명령/쓰기/바이트/버린 명령 수, 최근 window초 동안의 초당 바이트/명령 수)"""
+        now = time.monotonic()
+        with self._write_cond:
+            while self.write_history and now - self.write_history[0][0] > window:
+                self.write_history.popleft()
+            recent_bytes = sum(entry[1] for entry in self.write_history)
+            recent_commands = sum(entry[2] for entry in self.write_history)
+            stats = dict(self.write_stats)
+        stats['bytes_per_second'] = round(recent_bytes / window, 1)
+        stats['commands_per_second'] = round(recent_commands / window, 2)
+        return stats
+    
+    def start_reader(self):
+        """응답 수신 스레드 시작 (시리얼 입력은 이 스레드만 읽음)"""
+        if self.reader_thread and self.reader_thread.is_alive():
+            return
+        self.reader_running = True
+        self.reader_thread = threading.Thread(target=self._reader_loop, daemon=True, name="ArduinoReader")
+        self.reader_thread.start()
+    
+    def _reader_loop(self):
+        """한 줄씩 읽어 응답으로 변환하고 대기열/기록/콜백에 전달 (readline 타임아웃 1초)"""
+        while self.reader_running:
+            try:
+                raw = self.serial_connection.readline()
+            except Exception as e:
+                if self.reader_running:
+                    print(f"[ARDUINO] 응답 수신 오류: {e}")
+                    self.is_connected = False
+                break
+            line = raw.decode(errors='replace').strip()
+            if line:
+                self._dispatch(ArduinoResponse(line))
+        
+        self.reader_running = False
+        with self._response_cond:
+            self._response_cond.notify_all()
+    
+    def _dispatch(self, response):
+        with self._response_cond:
+            self.responses.append(response)
+            if self.logging_enabled:
+                self.response_log.append(f"[{time.strftime('%H:%M:%S', time.localtime(response.timestamp))}] {response}")
+            self._response_cond.notify_all()
+            callbacks = list(self.response_callbacks)
+        
+        if self.logging_enabled:
+            print(f"[ARDUINO] 응답: {response}")
+        for callback in callbacks:
             try:
-                if self.serial_connection.in_waiting > 0:
-                    data = self.serial_connection.readline().decode().strip()
-                    return data
+                callback(response)
             except Exception as e:
-                pass
+                print(f"[ARDUINO] 응답 콜백 오류: {e}")
+    
+    def read_data(self):
+        """아두이노에서 데이터 읽기 (기존 메서드 - 호환성 유지)
+        
+        아직 가져가지 않은 응답 하나를 반환 (없으면 None, 대기하지 않음)
+        """
+        with self._response_cond:
+            if self.responses:
+                return self.responses.popleft()
         return None
+    
+    def wait_for_response(self, prefix="", timeout=5.0):
+        """prefix로 시작하는 응답이 올 때까지 대기 (timeout 안에 없으면 None)
+        
+        이미 받아 두고 가져가지 않은 응답도 확인하고, 찾은 응답은 대기열에서 꺼냄
+        """
+        deadline = time.monotonic() + timeout
+        with self._response_cond:
+            while True:
+                for response in self.responses:
+                    if response.startswith(prefix):
+                        self.responses.remove(response)
+                        return response
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.reader_running:
+                    return None
+                self._response_cond.wait(remaining)
+    
+    def get_all_responses(self):
+        """아직 가져가지 않은 응답을 모두 꺼내 리스트로 반환"""
+        with self._response_cond:
+            responses = list(self.responses)
+            self.responses.clear()
+        return responses
+    
+    def add_response_callback(self, callback):
+        """응답을 받을 때마다 callback(응답) 호출 (수신 스레드에서 실행되므로 짧게 처리)"""
+        with self._response_cond:
+            if callback not in self.response_callbacks:
+                self.response_callbacks.append(callback)
+    
+    def remove_response_callback(self, callback):
+        with self._response_cond:
+            if callback in self.response_callbacks:
+                self.response_callbacks.remove(callback)
+    
+    def set_logging(self, enabled):
+        """응답 콘솔 출력 + 수신 기록 켜기/끄기"""
+        self.logging_enabled = enabled
+    
+    def get_response_log(self):
+        """수신 기록 ('[시:분:초] 응답' 문자열 목록)"""
+        with self._response_cond:
+            return list(self.response_log)
+    
+    def clear_response_log(self):
+        with self._response_cond:
+            self.response_log.clear()
 
 # 전역 아두이노 객체
 arduino_controller = None
 
+# 클립 길이 목록 (initialize_arduino에서 로드)
+clip_manifest = None
+_clip_manifest_lock = threading.Lock()
+
+def get_clip_manifest():
+    global clip_manifest
+    with _clip_manifest_lock:
+        if clip_manifest is None:
+            clip_manifest = ClipManifest()
+        return clip_manifest
+
+class PlaybackHandle:
+    """MP3 재생 완료 핸들 (wait=False로 재생했을 때 반환)"""
+    def __init__(self, clip_id, start_at, duration):
+        self.clip_id = clip_id
+        self.start_at = start_at
+        self.end_at = start_at + duration
+
+    def remaining(self):
+        """재생 완료까지 남은 시간(초)"""
+        return max(0.0, self.end_at - time.monotonic())
+
+    def done(self):
+        return time.monotonic() >= self.end_at
+
+    def wait(self, timeout=None):
+        """재생이 끝날 때까지 대기 (timeout 안에 끝나면 True)"""
+        remaining = self.remaining()
+        if timeout is not None and remaining > timeout:
+            time.sleep(timeout)
+            return False
+        time.sleep(remaining)
+        return True
+
 def initialize_arduino(port='COM3'):
     """아두이노 초기화"""
     global arduino_controller
@@ -79,6 +393,8 @@ def initialize_arduino(port='COM3'):
     
     arduino_controller = ArduinoController(port)
     if arduino_controller.connect():
+        # 클립 길이 목록은 여기서 미리 로드 (영상 루프의 첫 재생에서 디렉토리 스캔/파일 쓰기를 하지 않도록)
+        get_clip_manifest()
         print("[ARDUINO] 아두이노 초기화 완료")
         print(f"[ARDUINO] arduino_controller 객체 생성됨: {arduino_controller}")
         print(f"[ARDUINO] 연결 상태: {arduino_controller.is_connected}")
@@ -136,15 +452,33 @@ def play_random_mp3(arduino):
         mp3_file = f"{mp3_number:04d}"  # 0001, 0002, 0003, 0004 형태로 포맷
         arduino.send_command(f"MP3:{mp3_file}")
 
-def play_specific_mp3(arduino, mp3_file):
+def play_specific_mp3(arduino, mp3_file, wait=True):
     """
     아두이노를 통해 특정 MP3 파일 재생
     mp3_file: 재생할 MP3 파일명 (예: "0001", "0002", "0003", "0004")
+    wait: True면 클립 길이만큼 대기 후 반환 (clip_manifest.json의 실제 길이 사용)
+          False면 바로 PlaybackHandle 반환 (영상 루프용)
+    앞 클립이 아직 재생 중이면 끝난 뒤에 명령을 보내 앞 클립을 끊지 않음
     """
-    if arduino:
+    if not arduino:
+        return None
+    
+    duration = get_clip_manifest().duration(mp3_file)
+    with arduino.playback_lock:
+        now = time.monotonic()
+        start_at = max(now, arduino.mp3_busy_until)
+        arduino.mp3_busy_until = start_at + duration
+    handle = PlaybackHandle(mp3_file, start_at, duration)
+    
+    if wait:
+        # 앞 클립이 끝날 때까지 기다렸다가 재생하고, 클립 길이만큼 대기
+        time.sleep(start_at - now)
         arduino.send_command(f"MP3:{mp3_file}")
-        # MP3 재생 완료까지 5초 대기
-        time.sleep(5)
+        handle.wait()
+    else:
+        # 앞 클립이 끝나는 시각에 전송 스레드가 명령 전송 (호출한 루프는 기다리지 않음)
+        arduino.send_command(f"MP3:{mp3_file}", at=start_at)
+    return handle
 
 # 테스트 함수
 def test_arduino_connection():
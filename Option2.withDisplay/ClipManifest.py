@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MP3 클립 길이 목록 (clip_manifest.json)
+아두이노 SD 카드에 넣은 MP3 파일과 같은 파일들의 재생 시간을 한 번 측정해서 저장
+MP3 재생 명령 후 고정 5초 대신 실제 클립 길이만큼만 기다리도록 사용
+
+사용법: python ClipManifest.py [MP3 폴더 경로]   -> 폴더에 clip_manifest.json 생성
+"""
+
+import os
+import sys
+import json
+import struct
+from pathlib import Path
+
+MANIFEST_NAME = "clip_manifest.json"
+DEFAULT_CLIP_SECONDS = 5.0  # 목록에 없는 클립의 대기 시간 (기존 고정 대기 시간)
+
+# MP3 파일 위치 (PC에 있는 SD 카드 원본 폴더)
+MP3_DIRECTORY_CANDIDATES = [
+    Path(r"C:\Users\PC2403\Desktop\mp3"),
+    Path.home() / "Desktop" / "mp3",
+    Path(__file__).parent / "mp3",
+]
+
+# MPEG Layer III 비트레이트(kbps) / 샘플레이트 표
+_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+def measure_mp3_duration(path):
+    """MP3 재생 시간(초) 측정 (Xing/Info/VBRI 헤더의 프레임 수, 없으면 CBR 비트레이트 기준)"""
+    file_size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        data = f.read(64 * 1024)
+
+        # ID3v2 태그 건너뛰기
+        offset = 0
+        if data[:3] == b'ID3' and len(data) >= 10:
+            offset = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+            if data[5] & 0x10:
+                offset += 10
+            f.seek(offset)
+            data = f.read(64 * 1024)
+            file_size -= offset
+
+    # 첫 번째 프레임 헤더 찾기
+    pos = 0
+    while pos + 4 <= len(data):
+        if data[pos] == 0xFF and (data[pos + 1] & 0xE0) == 0xE0:
+            header = struct.unpack('>I', data[pos:pos + 4])[0]
+            version = (header >> 19) & 0x3
+            layer = (header >> 17) & 0x3
+            bitrate_index = (header >> 12) & 0xF
+            rate_index = (header >> 10) & 0x3
+            if version != 1 and layer == 1 and 0 < bitrate_index < 15 and rate_index < 3:
+                break
+        pos += 1
+    else:
+        return None
+
+    mono = ((header >> 6) & 0x3) == 3
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    samples_per_frame = 1152 if version == 3 else 576
+
+    # VBR 헤더가 있으면 전체 프레임 수로 계산
+    xing = pos + ((21 if mono else 36) if version == 3 else (13 if mono else 21))
+    if data[xing:xing + 4] in (b'Xing', b'Info') and len(data) >= xing + 12:
+        if struct.unpack('>I', data[xing + 4:xing + 8])[0] & 0x1:
+            frames = struct.unpack('>I', data[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame / sample_rate
+    vbri = pos + 36
+    if data[vbri:vbri + 4] == b'VBRI' and len(data) >= vbri + 18:
+        frames = struct.unpack('>I', data[vbri + 14:vbri + 18])[0]
+        return frames * samples_per_frame / sample_rate
+
+    # CBR: 오디오 데이터 크기 / 비트레이트
+    bitrate = _BITRATES['mpeg1' if version == 3 else 'mpeg2'][bitrate_index] * 1000
+    return (file_size - pos) * 8 / bitrate
+
+def build_manifest(mp3_dir):
+    """폴더의 MP3 파일 길이를 측정해 clip_manifest.json으로 저장 (클립 번호 -> 초)"""
+    mp3_dir = Path(mp3_dir)
+    clips = {}
+    for path in sorted(mp3_dir.iterdir()):
+        if path.suffix.lower() != '.mp3':
+            continue
+        stem = path.stem
+        clip_id = f"{int(stem):04d}" if stem.isdigit() else stem
+        try:
+            duration = measure_mp3_duration(path)
+        except OSError as e:
+            print(f"[MANIFEST] {path.name} 읽기 실패: {e}")
+            continue
+        if duration is not None:
+            clips[clip_id] = round(duration, 2)
+            print(f"[MANIFEST] {clip_id}: {clips[clip_id]}초")
+
+    manifest_path = mp3_dir / MANIFEST_NAME
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(clips, f, ensure_ascii=False, indent=2, sort_keys=True)
+    print(f"[MANIFEST] {len(clips)}개 클립 저장: {manifest_path}")
+    return clips
+
+class ClipManifest:
+    """클립 번호 -> 재생 시간(초) 조회
+
+    MP3 폴더에 clip_manifest.json이 있으면 읽고, 없으면 폴더의 MP3를 한 번 측정해서 생성
+    MP3 폴더가 없으면 프로그램 폴더의 clip_manifest.json 사용
+    """
+    def __init__(self, candidates=MP3_DIRECTORY_CANDIDATES, default=DEFAULT_CLIP_SECONDS):
+        self.default = default
+        self.durations = {}
+        self.source = None
+        self._load(candidates)
+
+    def _load(self, candidates):
+        for mp3_dir in candidates:
+            mp3_dir = Path(mp3_dir)
+            if not mp3_dir.is_dir():
+                continue
+            manifest_path = mp3_dir / MANIFEST_NAME
+            if manifest_path.exists():
+                self._read(manifest_path)
+            else:
+                self.durations = build_manifest(mp3_dir)
+                self.source = manifest_path
+            return
+
+        local_manifest = Path(__file__).parent / MANIFEST_NAME
+        if local_manifest.exists():
+            self._read(local_manifest)
+        else:
+            print(f"[MANIFEST] 클립 길이 목록이 없습니다. 모든 클립에 {self.default}초 대기를 사용합니다.")
+
+    def _read(self, manifest_path):
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.durations = {str(k): float(v) for k, v in json.load(f).items()}
+            self.source = manifest_path
+            print(f"[MANIFEST] 클립 길이 목록 로드: {manifest_path} ({len(self.durations)}개)")
+        except (OSError, ValueError) as e:
+            print(f"[MANIFEST] 클립 길이 목록 읽기 실패: {e}")
+
+    def duration(self, clip_id):
+        """클립 재생 시간(초) (목록에 없으면 기본값)"""
+        clip_id = str(clip_id)
+        if clip_id.isdigit():
+            clip_id = f"{int(clip_id):04d}"
+        return self.durations.get(clip_id, self.default)
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else next((d for d in MP3_DIRECTORY_CANDIDATES if Path(d).is_dir()), None)
+    if target is None:
+        print("MP3 폴더를 찾을 수 없습니다. 사용법: python ClipManifest.py [MP3 폴더 경로]")
+    else:
+        build_manifest(target)
@@ -184,9 +184,10 @@ def run_exercise_mode():
                 try:
                     landmarks = results.pose_landmarks.landmark
 
+                    # 안내 음성은 wait=False: 영상 루프를 멈추지 않고, 앞 클립이 끝난 뒤 순서대로 재생
                     # posture1 동작: 의자에 앉아서 상체 스트레칭 (오른팔 위로 뻗고 왼손으로 오른팔 잡기)
                     if stage == "posture1":
-                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller,"0005")  # posture1 동작 시범 안내
+                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller,"0005", wait=False)  # posture1 동작 시범 안내
                         
                         # 상체 노드들만 사용 (하체 제외)
                         right_shoulder = [landmarks[mp_pose.PoseLandmark.RIGHT_SHOULDER.value].x,
@@ -220,20 +221,20 @@ def run_exercise_mode():
                         hands_close = left_hand_to_right_arm_distance < 0.15  # 임계값 조정 가능
                         
                         if right_arm_extended and left_arm_bent and hands_close:
-                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller,"0008")  # 성공 안내
+                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller,"0008", wait=False)  # 성공 안내
                             safe_arduino_command(ArduinoCommunication.control_led, ArduinoCommunication.arduino_controller, 'green')
                             video_completed = True  # 자세 완료 플래그 설정
                             stage = "posture2"
                             fail_count = 0
                         else:  # 팔을 덜 편 경우
                             fail_count += 1
-                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0013")  # 팔을 더 펴달라는 안내
+                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0013", wait=False)  # 팔을 더 펴달라는 안내
                             # 실패 시에는 영상이 끝날 때까지 기다린 후 재시도 로직 적용
 
 
                     # posture2 동작: 의자에 앉아서 왼손으로 오른쪽 골반(허리) 잡기
                     elif stage == "posture2":
-                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0004")  # 왼손으로골반잡으세요
+                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0004", wait=False)  # 왼손으로골반잡으세요
                         
                         # 상체 노드들 정의 (하체 제외)
                         left_wrist = [landmarks[mp_pose.PoseLandmark.LEFT_WRIST.value].x,
@@ -251,19 +252,19 @@ def run_exercise_mode():
                         hand_below_hip = left_wrist[1] > right_hip[1]  # 왼손이 오른쪽 골반보다 아래
                         
                         if hand_near_hip and hand_below_hip:
-                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0006")  # 성공 안내
+                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0006", wait=False)  # 성공 안내
                             video_completed = True  # 자세 완료 플래그 설정
                             stage = "posture3"
                             fail_count = 0
                         else:
                             fail_count += 1
-                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0014")  # 실패 안내
+                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0014", wait=False)  # 실패 안내
                             # 실패 시에는 영상이 끝날 때까지 기다린 후 재시도 로직 적용
 
                     # posture3 동작: 의자에 앉아서 오른쪽으로 기울이면서 오른팔 위로 뻗고 왼손을 오른쪽 골반에 대기
                     elif stage == "posture3":
-                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0005")  # posture3 동작 안내
-                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0006")
+                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0005", wait=False)  # posture3 동작 안내
+                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0006", wait=False)
                         
                         # 상체 노드들 정의 (하체 제외)
                         left_shoulder = [landmarks[mp_pose.PoseLandmark.LEFT_SHOULDER.value].x,
@@ -301,13 +302,13 @@ def run_exercise_mode():
                             fail_count = 0
                         else:
                             fail_count += 1
-                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0015")  # 실패 안내
+                            safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0015", wait=False)  # 실패 안내
                             safe_arduino_command(ArduinoCommunication.play_voice_guide, ArduinoCommunication.arduino_controller, 'fail')
                             safe_arduino_command(ArduinoCommunication.play_sound, ArduinoCommunication.arduino_controller, 'fail')
                             # 실패 시에는 영상이 끝날 때까지 기다린 후 재시도 로직 적용
                     
                     if stage == "done":
-                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0007")  # 모든 동작 완료 안내
+                        safe_arduino_command(ArduinoCommunication.play_specific_mp3, ArduinoCommunication.arduino_controller, "0007", wait=False)  # 모든 동작 완료 안내
                         break
 
                 except Exception as e:
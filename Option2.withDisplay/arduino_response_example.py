@@ -6,10 +6,10 @@ ArduinoCommunication.py의 새로운 응답 수신 기능 사용법
 """
 
 import time
+import ArduinoCommunication
 from ArduinoCommunication import (
     initialize_arduino, 
     cleanup_arduino, 
-    arduino_controller,
     control_led, 
     play_sound, 
     play_voice_guide, 
@@ -23,10 +23,10 @@ def example_basic_response():
     if initialize_arduino('COM3'):
         # 명령 전송 후 응답 대기
         print("LED 제어 명령 전송...")
-        control_led(arduino_controller, 'green')
+        control_led(ArduinoCommunication.arduino_controller, 'green')
         
         # 응답 대기
-        response = arduino_controller.wait_for_response("LED:", timeout=3.0)
+        response = ArduinoCommunication.arduino_controller.wait_for_response("LED:", timeout=3.0)
         if response:
             print(f"응답 수신: {response}")
         else:
@@ -46,21 +46,21 @@ def example_callback_usage():
             print(f"[콜백] 아두이노 응답: {data}")
         
         # 콜백 등록
-        arduino_controller.add_response_callback(my_callback)
+        ArduinoCommunication.arduino_controller.add_response_callback(my_callback)
         
         # 여러 명령 전송
         print("여러 명령 전송 중...")
-        control_led(arduino_controller, 'red')
+        control_led(ArduinoCommunication.arduino_controller, 'red')
         time.sleep(1)
         
-        play_sound(arduino_controller, 'success')
+        play_sound(ArduinoCommunication.arduino_controller, 'success')
         time.sleep(1)
         
-        play_specific_mp3(arduino_controller, "0001")
+        play_specific_mp3(ArduinoCommunication.arduino_controller, "0001")
         time.sleep(2)
         
         # 콜백 제거
-        arduino_controller.remove_response_callback(my_callback)
+        ArduinoCommunication.arduino_controller.remove_response_callback(my_callback)
         
         cleanup_arduino()
     else:
@@ -72,19 +72,19 @@ def example_response_queue():
     
     if initialize_arduino('COM3'):
         # 로깅 비활성화 (콘솔 출력 줄이기)
-        arduino_controller.set_logging(False)
+        ArduinoCommunication.arduino_controller.set_logging(False)
         
         # 여러 명령 전송
         print("여러 명령 전송...")
-        control_led(arduino_controller, 'yellow')
-        play_sound(arduino_controller, 'start')
-        play_voice_guide(arduino_controller, 'welcome')
+        control_led(ArduinoCommunication.arduino_controller, 'yellow')
+        play_sound(ArduinoCommunication.arduino_controller, 'start')
+        play_voice_guide(ArduinoCommunication.arduino_controller, 'welcome')
         
         time.sleep(2)  # 응답 수집 대기
         
         # 모든 응답 가져오기
         print("수신된 모든 응답:")
-        responses = arduino_controller.get_all_responses()
+        responses = ArduinoCommunication.arduino_controller.get_all_responses()
         for i, response in enumerate(responses, 1):
             print(f"  {i}. {response}")
         
@@ -98,27 +98,27 @@ def example_response_log():
     
     if initialize_arduino('COM3'):
         # 로깅 활성화
-        arduino_controller.set_logging(True)
+        ArduinoCommunication.arduino_controller.set_logging(True)
         
         # 명령들 실행
         print("명령 실행 중...")
-        control_led(arduino_controller, 'green')
+        control_led(ArduinoCommunication.arduino_controller, 'green')
         time.sleep(1)
         
-        play_sound(arduino_controller, 'fail')
+        play_sound(ArduinoCommunication.arduino_controller, 'fail')
         time.sleep(1)
         
-        play_specific_mp3(arduino_controller, "0002")
+        play_specific_mp3(ArduinoCommunication.arduino_controller, "0002")
         time.sleep(2)
         
         # 응답 로그 출력
         print("\n응답 로그:")
-        log_entries = arduino_controller.get_response_log()
+        log_entries = ArduinoCommunication.arduino_controller.get_response_log()
         for entry in log_entries:
             print(f"  {entry}")
         
         # 로그 초기화
-        arduino_controller.clear_response_log()
+        ArduinoCommunication.arduino_controller.clear_response_log()
         print("로그 초기화 완료")
         
         cleanup_arduino()
@@ -140,23 +140,23 @@ def example_advanced_monitoring():
                 print("❌ 오류 감지!")
         
         # 콜백 등록
-        arduino_controller.add_response_callback(success_detector)
-        arduino_controller.add_response_callback(error_detector)
+        ArduinoCommunication.arduino_controller.add_response_callback(success_detector)
+        ArduinoCommunication.arduino_controller.add_response_callback(error_detector)
         
         # 시뮬레이션 명령들
         print("시뮬레이션 명령 실행...")
-        control_led(arduino_controller, 'green')  # 성공 시뮬레이션
+        control_led(ArduinoCommunication.arduino_controller, 'green')  # 성공 시뮬레이션
         time.sleep(1)
         
-        play_sound(arduino_controller, 'success')  # 성공 사운드
+        play_sound(ArduinoCommunication.arduino_controller, 'success')  # 성공 사운드
         time.sleep(1)
         
-        play_sound(arduino_controller, 'fail')     # 실패 사운드
+        play_sound(ArduinoCommunication.arduino_controller, 'fail')     # 실패 사운드
         time.sleep(2)
         
         # 콜백 제거
-        arduino_controller.remove_response_callback(success_detector)
-        arduino_controller.remove_response_callback(error_detector)
+        ArduinoCommunication.arduino_controller.remove_response_callback(success_detector)
+        ArduinoCommunication.arduino_controller.remove_response_callback(error_detector)
         
         cleanup_arduino()
     else: